@@ -47,6 +47,7 @@ class BitCard(int):
     char_to_int_rank = dict(zip(ranks, int_ranks))
     char_to_int_suit = dict(zip(suits, int_suits))
     int_to_char_suit = "xcdxsxxxh"
+    _by_index = None
 
     def __new__(cls, card) -> BitCard:
         if isinstance(card, str):
@@ -69,6 +70,21 @@ class BitCard(int):
         card_int = bit_rank | suit | rank | prime
         return BitCard.from_int(card_int)
 
+    @classmethod
+    def from_index(cls, index: int) -> BitCard:
+        """
+        Converts the index of a card in Card.all_cards to its 32-bit integer representation
+        Example:
+            44 ("Kc") --> 134224677
+        Args:
+            index (int): The index of the card, between 0 and 51
+        Returns:
+            BitCard: The 32-bit int representing the card as described above
+        """
+        if BitCard._by_index is None:
+            BitCard._by_index = tuple(BitCard.from_card(card) for card in Card.all_cards)
+        return BitCard._by_index[index]
+
     @classmethod
     def from_string(cls, str_card) -> BitCard:
         """
@@ -143,6 +159,17 @@ class BitCard(int):
         """
         return (self >> 16) & 0x1FFF
 
+    @property
+    def index(self) -> int:
+        """
+        The index of the card in Card.all_cards.
+        Example:
+            134224677 ("Kc") --> 44
+        Returns:
+            int: Number between 0-51, equal to 4 times the rank plus the position of the suit.
+        """
+        return self.rank * 4 + self.suit.bit_length() - 1
+
     @property
     def prime(self) -> int:
         """
@@ -1,4 +1,4 @@
-from attrs import define, field, Factory
+from attrs import define, field, Factory, setters
 from attrs.validators import instance_of, optional
 import numpy as np
 import pandas as pd
@@ -6,6 +6,55 @@ from pkrcomponents.components.cards.card import Card
 from pkrcomponents.components.cards.flop import Flop
 from pkrcomponents.components.utils.converters import convert_to_card
 
+BOARD_SLOTS = ("flop_1", "flop_2", "flop_3", "turn", "river")
+SLOT_INDEXES = {"turn": 3, "river": 4}
+
+
+def get_index(card):
+    """
+    Returns the index of a card in Card.all_cards
+
+    Args:
+        card (Card): The card, or None
+
+    Returns:
+        int: The index of the card, None if no card is given
+    """
+    return None if card is None else card.index
+
+
+def count_cards(slots):
+    """
+    Counts the cards in board slots
+
+    Args:
+        slots (list): The card indexes of the board slots, None for the undrawn cards
+
+    Returns:
+        int: The number of cards in the slots
+    """
+    return sum(card is not None for card in slots)
+
+
+def sync_slots(board, attribute, value):
+    """
+    Keeps the card slots and the card count of the board in line with a new flop, turn or river
+
+    Args:
+        board (Board): The board being modified
+        attribute (Attribute): The attribute being set
+        value (Flop, Card): The new value of the attribute
+
+    Returns:
+        (Flop, Card): The unchanged value
+    """
+    if attribute.name == "flop":
+        board._slots[:3] = [get_index(card) for card in value.cards]
+    else:
+        board._slots[SLOT_INDEXES[attribute.name]] = get_index(value)
+    board._len = count_cards(board._slots)
+    return value
+
 
 @define(eq=False)
 class Board:
@@ -17,9 +66,18 @@ class Board:
         turn (Card): The turn of the board
         river (Card): The river of the board
     """
-    flop = field(default=Factory(Flop), validator=instance_of(Flop))
-    turn = field(default=None, validator=optional(instance_of(Card)), converter=convert_to_card)
-    river = field(default=None, validator=optional(instance_of(Card)), converter=convert_to_card)
+    flop = field(default=Factory(Flop), validator=instance_of(Flop),
+                 on_setattr=[setters.validate, sync_slots])
+    turn = field(default=None, validator=optional(instance_of(Card)), converter=convert_to_card,
+                 on_setattr=[setters.convert, setters.validate, sync_slots])
+    river = field(default=None, validator=optional(instance_of(Card)), converter=convert_to_card,
+                  on_setattr=[setters.convert, setters.validate, sync_slots])
+    _slots = field(init=False, repr=False)
+    _len = field(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self._slots = [get_index(card) for card in self.flop.cards + [self.turn, self.river]]
+        self._len = count_cards(self._slots)
 
     @classmethod
     def from_cards(cls, cards=None):
@@ -46,7 +104,7 @@ class Board:
             return cls(flop=Flop(*cards[:3]), turn=Card(cards[3]), river=Card(cards[4]))
 
     def __len__(self):
-        return 5 - self.cards.isna().sum()
+        return self._len
 
     def __eq__(self, other):
         return self.flop == other.flop and self.turn == other.turn and self.river == other.river
@@ -55,13 +113,26 @@ class Board:
     def cards(self):
         """
         Returns:
-            pd.Series: The cards on the board as a Series
+            pd.Series: The cards of the board, indexed by board slot, NaN for the undrawn ones
         """
-        return pd.Series(
-            data=self.flop.cards + [self.turn, self.river],
-            index=["flop_1", "flop_2", "flop_3", "turn", "river"],
-            name="cards"
-        ).fillna(value=np.nan)
+        return self.to_series()
+
+    @property
+    def card_slots(self):
+        """
+        Returns:
+            tuple: The five card slots of the board (flop cards, turn and river), None for the undrawn ones
+        """
+        all_cards = Card.all_cards
+        return tuple(None if index is None else all_cards[index] for index in self._slots)
+
+    @property
+    def indexes(self):
+        """
+        Returns:
+            tuple: The indexes in Card.all_cards of the cards on the board, in the order of the board slots
+        """
+        return tuple(index for index in self._slots if index is not None)
 
     @property
     def len(self):
@@ -69,7 +140,7 @@ class Board:
         Returns:
             int: The number of cards on the board
         """
-        return self.__len__()
+        return self._len
 
     def add(self, card: [str, Card]):
         """
@@ -79,37 +150,52 @@ class Board:
             card (str, Card): The card to add to the board
         """
         card = Card(card)
-        if len(self) == 5:
+        if self._len == 5:
             raise ValueError("Board is already full with 5 cards")
-        if self.cards.isin([card]).any():
+        if card.index in self._slots:
             raise ValueError("A same card cannot be put in the board twice or more")
-        if len(self) == 0:
+        if self._len == 0:
             self.flop.first_card = card
-        elif len(self) == 1:
+        elif self._len == 1:
             self.flop.second_card = card
-        elif len(self) == 2:
+        elif self._len == 2:
             self.flop.third_card = card
-        elif len(self) == 3:
-            self.turn = card
+        elif self._len == 3:
+            object.__setattr__(self, "turn", card)
         else:
-            self.river = card
+            object.__setattr__(self, "river", card)
+        self._slots[self._len] = card.index
+        self._len += 1
 
     def reset(self):
         """
         Reset the board
         """
         self.flop.reset()
-        self.turn = None
-        self.river = None
+        object.__setattr__(self, "turn", None)
+        object.__setattr__(self, "river", None)
+        self._slots[:] = [None] * 5
+        self._len = 0
+
+    def to_series(self):
+        """
+        Returns the board as a Series
+        """
+        return pd.Series(
+            data=[np.nan if card is None else card for card in self.card_slots],
+            index=BOARD_SLOTS,
+            name="cards",
+            dtype=object
+        )
 
     def to_json(self):
         """
         Returns the board as a JSON
         """
-        return self.cards.astype(str).to_dict()
+        return {slot: "nan" if card is None else f"{card}" for slot, card in zip(BOARD_SLOTS, self.card_slots)}
 
     def to_dataframe(self):
         """
         Returns the board as a DataFrame
         """
-        return pd.DataFrame([self.cards])
+        return pd.DataFrame([self.to_series()])
@@ -1,4 +1,5 @@
 """This module contains the Card class, which represents a playing card."""
+import random
 from functools import total_ordering
 
 from pkrcomponents.components.utils.common import ReprMixin
@@ -17,15 +18,20 @@ class Card(ReprMixin, metaclass=CardMeta):
     Attributes:
         rank (Rank): the rank of the card
         suit (Suit): the suit of the card
+        index (int): the index of the card in Card.all_cards, between 0 and 51
 
     Methods:
         is_face: indicates if the card is a face
         is_broadway: indicates if the card is a broadway
+        from_index: returns the Card at an index of Card.all_cards
         make_random: returns a random Card instance
 
+    Every Card is a singleton: Card("Kd") always returns the same instance, looked up by its string.
     """
 
-    __slots__ = ("rank", "suit")
+    __slots__ = ("rank", "suit", "index")
+    _by_string = {}
+    _by_index = [None] * 52
 
     def __new__(cls, card):
         if card is None:
@@ -33,20 +39,34 @@ class Card(ReprMixin, metaclass=CardMeta):
         if isinstance(card, cls):
             return card
         elif isinstance(card, str):
+            try:
+                return cls._by_string[card]
+            except KeyError:
+                pass
             if len(card) != 2:
                 raise ValueError(f"Length should be two in {card}")
-
-            self = object.__new__(cls)
-            self.rank = Rank(card[0])
-            self.suit = Suit(card[1])
+            rank, suit = Rank(card[0]), Suit(card[1])
+            index = rank.ordinal * 4 + suit.ordinal
+            self = cls._by_index[index]
+            if self is None:
+                self = object.__new__(cls)
+                self.rank, self.suit, self.index = rank, suit, index
+                cls._by_index[index] = self
+                cls._by_string[f"{self}"] = self
+            cls._by_string[card] = self
             return self
         else:
             raise TypeError("A card or string must be given")
 
+    def __reduce__(self):
+        return self.__class__, (f"{self}",)
+
     def __hash__(self):
-        return hash(self.rank) + hash(self.suit)
+        return self.index
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.__class__ is other.__class__:
             return self.rank == other.rank and self.suit == other.suit
         else:
@@ -55,10 +75,8 @@ class Card(ReprMixin, metaclass=CardMeta):
     def __lt__(self, other):
         if self.__class__ is not other.__class__:
             raise ValueError("Only a Card can be compared with another")
-        # with same ranks, suit counts
-        if self.rank == other.rank:
-            return self.suit < other.suit
-        return self.rank < other.rank
+        # the index orders cards by rank, then by suit for the same rank
+        return self.index < other.index
 
     def __str__(self):
         return f"{self.rank}{self.suit}"
@@ -92,10 +110,19 @@ class Card(ReprMixin, metaclass=CardMeta):
         """
         return self.rank.is_broadway
 
+    @classmethod
+    def from_index(cls, index: int):
+        """
+        Returns the Card at an index of Card.all_cards
+
+        Args:
+            index (int): The index of the card, between 0 and 51
+        Returns:
+            Card: The card at this index
+        """
+        return cls.all_cards[index]
+
     @classmethod
     def make_random(cls):
         """Returns a random Card instance."""
-        self = object.__new__(cls)
-        self.rank = Rank.make_random()
-        self.suit = Suit.make_random()
-        return self
+        return random.choice(cls.all_cards)
@@ -12,23 +12,48 @@ from pkrcomponents.components.utils.meta.combo_meta import ComboMeta
 
 @total_ordering
 class Combo(ReprMixin, metaclass=ComboMeta):
-    """Hand combination, made of two cards"""
+    """
+    Hand combination, made of two cards
+
+    Every Combo is a singleton: Combo("AsKd"), Combo("KdAs") and Combo.from_cards("Kd", "As") return the same
+    instance, whose index is its position in Combo.all_combos, between 0 and 1325.
+    """
 
     _shape: Shape
-    __slots__ = ("first", "second")
+    __slots__ = ("first", "second", "index")
+    _by_string = {}
+    _by_indexes = {}
 
     def __new__(cls, combo):
         if isinstance(combo, cls):
             return combo
         if not combo:
             return None
+        try:
+            return cls._by_string[combo]
+        except (KeyError, TypeError):
+            pass
         if len(combo) != 4:
             raise ValueError(f"{combo}, should have a length of 4")
         elif combo[0] == combo[2] and combo[1] == combo[3]:
             raise ValueError(f"{combo!r}, Pair can't have the same suit: {combo[1]!r}")
+        self = cls.from_cards(combo[:2], combo[2:])
+        if isinstance(combo, str):
+            cls._by_string[combo] = self
+        return self
 
-        self = super().__new__(cls)
-        self._set_cards_in_order(combo[:2], combo[2:])
+    @classmethod
+    def _intern(cls, first: Card, second: Card):
+        """Private method returning the single Combo instance made of two different cards"""
+        low, high = sorted((first.index, second.index))
+        self = cls._by_indexes.get((low, high))
+        if self is None:
+            self = super().__new__(cls)
+            self._set_cards_in_order(first, second)
+            # Position of (low, high) in itertools.combinations(range(52), 2), which is the order of Combo.all_combos
+            self.index = low * (103 - low) // 2 + high - low - 1
+            cls._by_indexes[(low, high)] = self
+            cls._by_string[f"{self}"] = self
         return self
 
     @classmethod
@@ -37,11 +62,32 @@ class Combo(ReprMixin, metaclass=ComboMeta):
         first, second = Card(first), Card(second)
         if first == second:
             raise ValueError("We cannot have the same card twice in a Combo")
-        self = super().__new__(cls)
-        first = first.rank.val + first.suit.val
-        second = second.rank.val + second.suit.val
-        self._set_cards_in_order(first, second)
-        return self
+        return cls._intern(first, second)
+
+    @classmethod
+    def from_card_indexes(cls, first: int, second: int):
+        """
+        Creates a Combo from the indexes of its two cards in Card.all_cards
+
+        Args:
+            first (int): The index of the first card, between 0 and 51
+            second (int): The index of the second card, between 0 and 51
+        Returns:
+            Combo: The combo made of the two cards
+        """
+        return cls.from_cards(Card.from_index(first), Card.from_index(second))
+
+    @classmethod
+    def from_index(cls, index: int):
+        """
+        Returns the Combo at an index of Combo.all_combos
+
+        Args:
+            index (int): The index of the combo, between 0 and 1325
+        Returns:
+            Combo: The combo at this index
+        """
+        return cls.all_combos[index]
 
     @classmethod
     def from_tuple(cls, combo_tuple):
@@ -58,10 +104,15 @@ class Combo(ReprMixin, metaclass=ComboMeta):
     def __str__(self):
         return f"{self.first}{self.second}"
 
+    def __reduce__(self):
+        return self.__class__, (f"{self}",)
+
     def __hash__(self):
-        return self.first.__hash__() + self.second.__hash__()
+        return self.index
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.__class__ is not other.__class__:
             if isinstance(other, Hand):
                 return self.hand == other
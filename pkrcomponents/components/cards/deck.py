@@ -2,17 +2,21 @@
 import random
 from pkrcomponents.components.cards.card import Card
 
+NB_CARDS = 52
+FULL_DECK_MASK = (1 << NB_CARDS) - 1
+
 
 class Deck:
     """
-    A class that represents a deck of cards
+    A class that represents a deck of cards, stored as a 52-bit mask where the bit of index i is set when the card
+    of index i in Card.all_cards is in the deck. Drawing, replacing and looking for a given card take constant time.
 
     Attributes:
-        cards (list): the list of cards in the deck
+        mask (int): the bits of the cards in the deck
 
     Methods:
-        shuffle: randomly shuffles the deck
-        reset: re-initializes the deck and shuffles it
+        shuffle: shuffles the deck, which is always shuffled as the cards are drawn at random
+        reset: puts every card back in the deck
         draw: returns a card from the deck
         replace: replaces a card in the deck
         to_json: returns the deck as a json object
@@ -20,43 +24,68 @@ class Deck:
     """
 
     def __init__(self):
-        self.cards = list(Card)
+        self.mask = FULL_DECK_MASK
 
     def __len__(self):
-        return self.cards.__len__()
+        return self.mask.bit_count()
+
+    def __contains__(self, card):
+        return bool(self.mask >> Card(card).index & 1)
+
+    @property
+    def indexes(self) -> list:
+        """
+        Returns the indexes in Card.all_cards of the cards in the deck, in ascending order
+        """
+        mask = self.mask
+        return [index for index in range(NB_CARDS) if mask >> index & 1]
+
+    @property
+    def cards(self) -> list:
+        """
+        Returns the cards currently in the deck, in the order of Card.all_cards
+        """
+        all_cards = Card.all_cards
+        return [all_cards[index] for index in self.indexes]
 
     def shuffle(self):
         """
-        Randomly shuffles the deck
+        Shuffles the deck. The cards drawn without being named are picked at random when they are drawn,
+        so the deck is always shuffled and there is nothing left to do.
         """
-        random.shuffle(self.cards)
 
     def reset(self):
-        """Re-initializes the deck and shuffles it"""
-        self.cards = list(Card)
-        self.shuffle()
+        """Puts every card back in the deck"""
+        self.mask = FULL_DECK_MASK
 
     def draw(self, card: (str, Card) = None):
         """
         Returns a card from the deck
-        If the parameter card is given, it returns the card at stake and pops it from the deck
+        If the parameter card is given, it returns the card at stake and removes it from the deck,
+        otherwise a random card is drawn
 
         Args:
             card (Card): the card to be drawn
         """
         if not card:
-            return self.cards.pop()
+            if not self.mask:
+                raise IndexError("Cannot draw from an empty deck")
+            index = random.randrange(NB_CARDS)
+            while not self.mask >> index & 1:
+                index = random.randrange(NB_CARDS)
+            card = Card.from_index(index)
         else:
             card = Card(card)
-            idx = self.cards.index(card)
-            return self.cards.pop(idx)
+            if not self.mask >> card.index & 1:
+                raise ValueError(f"{card} is not in the deck")
+        self.mask ^= 1 << card.index
+        return card
 
     def replace(self, card: Card):
         """
         Replaces a card in the deck
         """
-        if card not in self.cards:
-            self.cards.append(card)
+        self.mask |= 1 << Card(card).index
 
     @property
     def len(self):
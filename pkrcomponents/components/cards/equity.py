@@ -0,0 +1,324 @@
+"""This module contains the EquityCalculator and RangeEquityCalculator classes, which compute all-in equities
+between combos and between ranges."""
+from functools import lru_cache
+from itertools import combinations, permutations
+from math import comb
+
+import numpy as np
+from attrs import define, field
+from attrs.validators import instance_of
+
+from pkrcomponents.components.cards.card import Card
+from pkrcomponents.components.cards.combo import Combo
+from pkrcomponents.components.cards.deck import Deck, NB_CARDS
+from pkrcomponents.components.cards.evaluator import Evaluator
+from pkrcomponents.components.cards.hand_range import Range
+
+EQUITY_CACHE_SIZE = 4096
+CACHED_EQUITY_PRECISION = 0.005
+SUIT_PERMUTATIONS = tuple(permutations(range(4)))
+
+
+def _permute_suits(cards_indexes: np.ndarray, permutation: tuple) -> np.ndarray:
+    """
+    Returns the card indexes with their suits permuted, a card index being 4 times its rank plus its suit
+    """
+    return cards_indexes - cards_indexes % 4 + np.asarray(permutation)[cards_indexes % 4]
+
+
+@define(frozen=True)
+class EquityResult:
+    """
+    The equities of the combos all-in against each other
+
+    Attributes:
+        equities (tuple): The equity of each combo, in the order they were given. Ties are split between winners.
+        nb_runouts (int): The number of runouts evaluated
+        is_exact (bool): Whether every runout was enumerated, or a random sample of them evaluated
+    """
+    equities = field(validator=instance_of(tuple))
+    nb_runouts = field(validator=instance_of(int))
+    is_exact = field(validator=instance_of(bool))
+
+
+class EquityCalculator:
+    """
+    Computes the equities of two or more combos all-in against each other, exhaustively or by Monte Carlo sampling.
+
+    Attributes:
+        max_exhaustive_runouts (int): The maximum number of runouts to enumerate before switching to Monte Carlo
+        rng (np.random.Generator): The random generator used to sample runouts
+
+    Methods:
+        equity: computes the equities, choosing the mode from the number of runouts left
+        exhaustive_equity: computes the exact equities by enumerating every runout
+        monte_carlo_equity: estimates the equities on random runouts, until a target precision is reached
+    """
+
+    def __init__(self, max_exhaustive_runouts: int = 50000, seed: int = None):
+        self.max_exhaustive_runouts = max_exhaustive_runouts
+        self.rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def _prepare(combos, board) -> tuple:
+        """
+        Checks the combos and board and returns their card indexes with the indexes of the cards left in the deck
+        """
+        combos = [Combo(combo) for combo in combos]
+        board = [Card(card) for card in (board or ()) if card is not None]
+        if len(combos) < 2:
+            raise ValueError("At least two combos must be given")
+        if len(board) > 5:
+            raise ValueError("Board must have at most 5 cards")
+        deck = Deck()
+        try:
+            for card in [card for combo in combos for card in (combo.first, combo.second)] + board:
+                deck.draw(card)
+        except ValueError:
+            raise ValueError("A same card cannot be dealt twice")
+        combos_indexes = np.array([[combo.first.index, combo.second.index] for combo in combos])
+        board_indexes = np.array([card.index for card in board], dtype=np.intp)
+        deck_indexes = np.array(deck.indexes, dtype=np.intp)
+        return combos_indexes, board_indexes, deck_indexes
+
+    @staticmethod
+    def _shares(combos_indexes, boards) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The share of the pot won by each combo on each board, of shape (nb_boards, nb_combos)
+        """
+        nb_boards = len(boards)
+        scores = np.stack([
+            Evaluator.evaluate_many(np.broadcast_to(combo_indexes, (nb_boards, 2)), boards)
+            for combo_indexes in combos_indexes
+        ], axis=1)
+        winners = scores == scores.min(axis=1, keepdims=True)
+        return winners / winners.sum(axis=1, keepdims=True)
+
+    def exhaustive_equity(self, combos, board=None, batch_size: int = 100000) -> EquityResult:
+        """
+        Computes the exact equities by enumerating every runout
+
+        Args:
+            combos (list): The combos all-in, as Combo or strings
+            board (list): The cards already on the board, as Card or strings
+            batch_size (int): The number of runouts evaluated at once
+        Returns:
+            EquityResult: The exact equities
+        """
+        combos_indexes, board_indexes, deck_indexes = self._prepare(combos, board)
+        nb_cards_to_come = 5 - len(board_indexes)
+        runouts = combinations(deck_indexes, nb_cards_to_come)
+        nb_runouts = comb(len(deck_indexes), nb_cards_to_come)
+        totals = np.zeros(len(combos_indexes))
+        for start in range(0, nb_runouts, batch_size):
+            size = min(batch_size, nb_runouts - start)
+            drawn = np.fromiter(
+                (card for _, runout in zip(range(size), runouts) for card in runout), dtype=np.intp,
+                count=size * nb_cards_to_come
+            ).reshape(size, nb_cards_to_come)
+            boards = np.concatenate((np.broadcast_to(board_indexes, (size, len(board_indexes))), drawn), axis=1)
+            totals += self._shares(combos_indexes, boards).sum(axis=0)
+        return EquityResult(equities=tuple((totals / nb_runouts).tolist()), nb_runouts=nb_runouts, is_exact=True)
+
+    def monte_carlo_equity(self, combos, board=None, precision: float = 0.001, max_runouts: int = 1000000,
+                           batch_size: int = 10000) -> EquityResult:
+        """
+        Estimates the equities on random runouts, until the standard error of every equity is below the precision
+
+        Args:
+            combos (list): The combos all-in, as Combo or strings
+            board (list): The cards already on the board, as Card or strings
+            precision (float): The target standard error of the equities
+            max_runouts (int): The maximum number of runouts sampled
+            batch_size (int): The number of runouts sampled at once
+        Returns:
+            EquityResult: The estimated equities
+        """
+        combos_indexes, board_indexes, deck_indexes = self._prepare(combos, board)
+        nb_cards_to_come = 5 - len(board_indexes)
+        totals = np.zeros(len(combos_indexes))
+        squared_totals = np.zeros(len(combos_indexes))
+        nb_runouts = 0
+        while nb_runouts < max_runouts:
+            size = min(batch_size, max_runouts - nb_runouts)
+            drawn = deck_indexes[self.rng.random((size, len(deck_indexes))).argsort(axis=1)[:, :nb_cards_to_come]]
+            boards = np.concatenate((np.broadcast_to(board_indexes, (size, len(board_indexes))), drawn), axis=1)
+            shares = self._shares(combos_indexes, boards)
+            totals += shares.sum(axis=0)
+            squared_totals += (shares ** 2).sum(axis=0)
+            nb_runouts += size
+            means = totals / nb_runouts
+            variances = np.maximum(squared_totals / nb_runouts - means ** 2, 0)
+            if (np.sqrt(variances / nb_runouts) <= precision).all():
+                break
+        return EquityResult(equities=tuple((totals / nb_runouts).tolist()), nb_runouts=nb_runouts, is_exact=False)
+
+    def equity(self, combos, board=None, precision: float = 0.001) -> EquityResult:
+        """
+        Computes the equities, exactly when few runouts are left and by Monte Carlo sampling otherwise
+
+        Args:
+            combos (list): The combos all-in, as Combo or strings
+            board (list): The cards already on the board, as Card or strings
+            precision (float): The target standard error of the equities when sampling
+        Returns:
+            EquityResult: The equities of the combos
+        """
+        nb_board_cards = len([card for card in (board or ()) if card is not None])
+        nb_runouts = comb(52 - 2 * len(combos) - nb_board_cards, 5 - nb_board_cards)
+        if nb_runouts <= self.max_exhaustive_runouts:
+            return self.exhaustive_equity(combos, board)
+        return self.monte_carlo_equity(combos, board, precision=precision)
+
+
+class RangeEquityCalculator:
+    """
+    Computes the equity of a range against another one, on a given board.
+
+    Each combo is scored once on every runout, then compared with all the combos of the other range. Suit permutations
+    leaving the board unchanged map runouts onto runouts, so only one combo of each suit-isomorphic class is evaluated,
+    the scores of the others being the same ones on permuted runouts.
+
+    Attributes:
+        nb_sampled_boards (int): The number of boards sampled preflop, each one completed with its suit permutations
+        rng (np.random.Generator): The random generator used to sample boards preflop
+
+    Methods:
+        equity: computes the equities of two ranges
+    """
+
+    def __init__(self, nb_sampled_boards: int = 2000, seed: int = None):
+        self.nb_sampled_boards = nb_sampled_boards
+        self.rng = np.random.default_rng(seed)
+
+    def _get_runouts(self, board_indexes: np.ndarray, stabilizer: list) -> tuple:
+        """
+        Returns the runouts, every runout mapped by each permutation of the stabilizer, and whether they are exhaustive
+        """
+        deck_indexes = np.setdiff1d(np.arange(NB_CARDS), board_indexes)
+        nb_cards_to_come = 5 - len(board_indexes)
+        if len(board_indexes):
+            runouts = np.array(list(combinations(deck_indexes, nb_cards_to_come)), dtype=np.intp)
+            runouts = runouts.reshape(len(runouts), nb_cards_to_come)
+            positions = {runout.tobytes(): position for position, runout in enumerate(runouts)}
+            runout_maps = {
+                permutation: np.array([positions[runout.tobytes()] for runout in
+                                       np.sort(_permute_suits(runouts, permutation), axis=1)])
+                for permutation in stabilizer
+            }
+            return runouts, runout_maps, True
+        nb_boards = self.nb_sampled_boards
+        sampled = deck_indexes[self.rng.random((nb_boards, len(deck_indexes))).argsort(axis=1)[:, :nb_cards_to_come]]
+        runouts = np.concatenate([_permute_suits(sampled, permutation) for permutation in stabilizer])
+        positions = {permutation: position for position, permutation in enumerate(stabilizer)}
+        samples = np.arange(nb_boards)
+        runout_maps = {
+            permutation: np.concatenate([
+                positions[tuple(permutation[suit] for suit in other)] * nb_boards + samples for other in stabilizer
+            ])
+            for permutation in stabilizer
+        }
+        return runouts, runout_maps, False
+
+    @staticmethod
+    def _get_scores(combos_indexes: np.ndarray, board_indexes: np.ndarray, runouts: np.ndarray,
+                    runout_maps: dict) -> np.ndarray:
+        """
+        Returns the score of every combo on every runout, of shape (nb_combos, nb_runouts).
+        Only one combo of each suit-isomorphic class is evaluated.
+        """
+        representatives, representative_positions, permutations_used = {}, [], []
+        for combo in combos_indexes:
+            images = {permutation: tuple(sorted(_permute_suits(combo, permutation).tolist()))
+                      for permutation in runout_maps}
+            permutation, representative = min(images.items(), key=lambda item: item[1])
+            representative_positions.append(representatives.setdefault(representative, len(representatives)))
+            permutations_used.append(permutation)
+        nb_runouts = len(runouts)
+        boards = np.concatenate((np.broadcast_to(board_indexes, (nb_runouts, len(board_indexes))), runouts), axis=1)
+        representatives_scores = np.stack([
+            Evaluator.evaluate_many(np.broadcast_to(representative, (nb_runouts, 2)), boards)
+            for representative in representatives
+        ])
+        return np.stack([
+            representatives_scores[position][runout_maps[permutation]]
+            for position, permutation in zip(representative_positions, permutations_used)
+        ])
+
+    def equity(self, hero_range, villain_range, board=None) -> EquityResult:
+        """
+        Computes the equities of two ranges, exactly when the flop is known and on sampled boards preflop.
+        Combos blocked by the board are removed, and pairs of combos sharing a card are not counted.
+
+        Args:
+            hero_range (Range, str): The range of the first player, as a Range or its notation
+            villain_range (Range, str): The range of the second player, as a Range or its notation
+            board (list): The cards already on the board, as Card or strings
+        Returns:
+            EquityResult: The equities of both ranges, and the number of runouts each combo was scored on
+        """
+        board = [Card(card) for card in (board or ()) if card is not None]
+        if len(board) not in (0, 3, 4, 5):
+            raise ValueError("Board must have 0, 3, 4 or 5 cards")
+        ranges = [(Range.from_string(player_range) if isinstance(player_range, str) else player_range)
+                  .without_dead_cards(board) for player_range in (hero_range, villain_range)]
+        if not all(ranges):
+            raise ValueError("Both ranges must have combos not blocked by the board")
+        board_indexes = np.array([card.index for card in board], dtype=np.intp)
+        stabilizer = [permutation for permutation in SUIT_PERMUTATIONS
+                      if set(_permute_suits(board_indexes, permutation).tolist()) == set(board_indexes.tolist())]
+        runouts, runout_maps, is_exact = self._get_runouts(board_indexes, stabilizer)
+
+        combos = list(dict.fromkeys(combo for player_range in ranges for combo in player_range))
+        positions = {combo: position for position, combo in enumerate(combos)}
+        combos_indexes = np.array([[combo.first.index, combo.second.index] for combo in combos])
+        scores = self._get_scores(combos_indexes, board_indexes, runouts, runout_maps)
+        runout_cards = np.zeros((len(runouts), NB_CARDS), dtype=bool)
+        np.put_along_axis(runout_cards, runouts, True, axis=1)
+        blocked = (runout_cards[:, combos_indexes[:, 0]] | runout_cards[:, combos_indexes[:, 1]]).T
+
+        hero_positions, villain_positions = ([positions[combo] for combo in player_range] for player_range in ranges)
+        villain_weights = np.array([ranges[1].weights[combo] for combo in ranges[1]])
+        villain_scores, villain_blocked = scores[villain_positions], blocked[villain_positions]
+        villain_cards = combos_indexes[villain_positions]
+        total, total_weight = 0.0, 0.0
+        for combo, position in zip(ranges[0], hero_positions):
+            valid = ~blocked[position] & ~villain_blocked
+            wins = ((scores[position] < villain_scores) & valid).sum(axis=1)
+            ties = ((scores[position] == villain_scores) & valid).sum(axis=1)
+            nb_valid = valid.sum(axis=1)
+            disjoint = ~np.isin(villain_cards, combos_indexes[position]).any(axis=1) & (nb_valid > 0)
+            weights = ranges[0].weights[combo] * villain_weights[disjoint]
+            total += (weights * (wins[disjoint] + ties[disjoint] / 2) / nb_valid[disjoint]).sum()
+            total_weight += weights.sum()
+        if total_weight == 0:
+            raise ValueError("Every pair of combos of the ranges shares a card")
+        hero_equity = float(total / total_weight)
+        return EquityResult(equities=(hero_equity, 1 - hero_equity), nb_runouts=len(runouts), is_exact=is_exact)
+
+
+@lru_cache(maxsize=EQUITY_CACHE_SIZE)
+def _cached_equities(combos: tuple, board: tuple) -> tuple:
+    """
+    Computes the equities of combos and board given in their canonical order, with a fixed seed
+    """
+    return EquityCalculator(seed=0).equity(combos, board, precision=CACHED_EQUITY_PRECISION).equities
+
+
+def all_in_equities(combos, board=None) -> tuple:
+    """
+    Returns the equities of combos all-in against each other, from a bounded LRU cache.
+    Combos and board cards are put in a canonical order, so that a same spot is computed only once.
+
+    Args:
+        combos (list): The combos all-in, as Combo or strings
+        board (list): The cards already on the board, as Card or strings
+    Returns:
+        tuple: The equity of each combo, in the order they were given
+    """
+    combos = [f"{Combo(combo)}" for combo in combos]
+    board = tuple(sorted(f"{Card(card)}" for card in (board or ()) if card is not None))
+    canonical_combos = tuple(sorted(combos))
+    equities = dict(zip(canonical_combos, _cached_equities(canonical_combos, board)))
+    return tuple(equities[combo] for combo in combos)
@@ -1,8 +1,12 @@
 import itertools
+import numpy as np
 from pkrcomponents.components.cards.bitcard import BitCard
-from pkrcomponents.components.cards.lookup_table import LookupTable
+from pkrcomponents.components.cards.card import Card
+from pkrcomponents.components.cards.lookup_table import ArrayLookupTable, LookupTable, SevenCardLookupTable, \
+    load_books
 
-LOOKUP_TABLE = LookupTable()
+BOOKS = load_books()
+LOOKUP_TABLE = LookupTable(BOOKS)
 
 
 class Evaluator:
@@ -36,6 +40,48 @@ class Evaluator:
         all_cards = cards + board
         return min(cls._five(hand) for hand in itertools.combinations(all_cards, 5))
 
+    @classmethod
+    def evaluate_indexes(cls, cards, board) -> int:
+        """
+        Evaluates the best five-card hand from cards encoded as their index in ``Card.all_cards``, from 0 to 51.
+
+        Args:
+            cards (Iterable): The indexes of the hole cards
+            board (Iterable): The indexes of the board cards
+        Returns:
+            int: The rank of the hand, identical to the one returned by :meth:`evaluate`
+        """
+        all_cards = Card.all_cards
+        return cls.evaluate([all_cards[index] for index in cards], [all_cards[index] for index in board])
+
+    @classmethod
+    def evaluate_many(cls, cards_array, boards_array) -> np.ndarray:
+        """
+        Evaluates N hands at once. Cards are encoded as their index in ``Card.all_cards``, from 0 to 51.
+
+        Args:
+            cards_array (array-like): The hole cards, of shape (N, 2)
+            boards_array (array-like): The boards, of shape (N, 3), (N, 4) or (N, 5)
+        Returns:
+            np.ndarray: The N ranks, identical to the ones returned by :meth:`evaluate`
+        """
+        lookup_table = SevenCardEvaluator.get_array_lookup_table()
+        hands = np.concatenate((np.asarray(cards_array, dtype=np.intp), np.asarray(boards_array, dtype=np.intp)),
+                               axis=1)
+        if hands.shape[1] not in (5, 6, 7):
+            raise ValueError("Hands must have 2 hole cards and 3, 4 or 5 board cards")
+        products = lookup_table.card_primes[hands].prod(axis=1)
+        scores = lookup_table.unsuited_ranks[np.searchsorted(lookup_table.unsuited_keys, products)]
+        suits = lookup_table.card_suits[hands]
+        bitranks = lookup_table.card_bitranks[hands]
+        for suit in BitCard.int_suits:
+            in_suit = suits == suit
+            flushes = np.count_nonzero(in_suit, axis=1) >= 5
+            if flushes.any():
+                masks = np.bitwise_or.reduce(np.where(in_suit[flushes], bitranks[flushes], 0), axis=1)
+                scores[flushes] = np.minimum(scores[flushes], lookup_table.flush_lookup[masks])
+        return scores.astype(int)
+
     @classmethod
     def get_rank_class(cls, hand_rank: int) -> int:
         """
@@ -49,9 +95,29 @@ class Evaluator:
             int: A rank class int describing the general category of hand from 9 rank classes.
                 Example, straight flush is class 1, high card is class 9, full house is class 3.
 
+        Raises:
+            ValueError: If hand_rank is not a rank, from 1 to 7462
+
+        """
+        if not 1 <= hand_rank <= LOOKUP_TABLE.MAX_HIGH_CARD:
+            raise ValueError(f"Hand rank must be between 1 and {LOOKUP_TABLE.MAX_HIGH_CARD}, not {hand_rank}")
+        return LOOKUP_TABLE.RANK_TO_RANK_CLASS[hand_rank]
+
+    @classmethod
+    def get_rank_classes(cls, hand_ranks) -> np.ndarray:
+        """
+        Returns the classes of N hand ranks at once, as :meth:`get_rank_class` does for one.
+        Values that are not ranks, like the 0 returned by :meth:`evaluate_many` for hands with a same card twice,
+        are masked and get the class 0 instead of raising an error.
+
+        Args:
+            hand_ranks (array-like): The ranks returned by :meth:`evaluate` or :meth:`evaluate_many`
+        Returns:
+            np.ndarray: The N rank classes, from 1 (straight flush) to 9 (high card), 0 for values that are not ranks
         """
-        max_rank = min(rank for rank in LOOKUP_TABLE.MAX_TO_RANK_CLASS if hand_rank <= rank)
-        return LOOKUP_TABLE.MAX_TO_RANK_CLASS[max_rank]
+        hand_ranks = np.asarray(hand_ranks, dtype=np.intp)
+        is_rank = (hand_ranks >= 1) & (hand_ranks <= LOOKUP_TABLE.MAX_HIGH_CARD)
+        return np.where(is_rank, LOOKUP_TABLE.RANK_CLASSES[np.where(is_rank, hand_ranks, 0)], 0)
 
     @classmethod
     def score_to_string(cls, hand_rank: int) -> str:
@@ -82,3 +148,111 @@ class Evaluator:
 
         """
         return 1 - float(hand_rank) / float(LOOKUP_TABLE.MAX_HIGH_CARD)
+
+
+class SevenCardEvaluator(Evaluator):
+    """
+    Evaluates 5, 6 and 7 card hands in one pass with the precomputed books of a :class:`SevenCardLookupTable`.
+
+    Ranks are on the same [1, 7462] scale as :class:`Evaluator`. The books are built once, on the first evaluation.
+    Cards are accepted in every form :class:`BitCard` accepts: the keys of Card objects and canonical strings are
+    cached, the other forms, like "as" or BitCard integers, are converted on each evaluation.
+    """
+    seven_card_lookup_table = None
+    array_lookup_table = None
+    card_keys = {
+        key: (bit_card.prime, bit_card.suit, bit_card.bitrank)
+        for card in Card
+        for bit_card in (BitCard(card),)
+        for key in (card, f"{card}")
+    }
+    index_keys = tuple((bit_card.prime, bit_card.suit, bit_card.bitrank) for bit_card in map(BitCard, Card))
+
+    @classmethod
+    def get_card_key(cls, card) -> tuple:
+        """
+        Returns the prime, the suit and the bit rank of a card, in any form accepted by :class:`BitCard`
+
+        Args:
+            card (Card | str | int): The card, like Card("As"), "As", "as" or a BitCard integer
+        Returns:
+            tuple: The prime of the rank, the suit and the bit rank of the card
+        """
+        card_key = cls.card_keys.get(card)
+        if card_key is None:
+            bit_card = BitCard(card)
+            card_key = (bit_card.prime, bit_card.suit, bit_card.bitrank)
+        return card_key
+
+    @classmethod
+    def get_lookup_table(cls) -> SevenCardLookupTable:
+        """
+        Returns:
+            SevenCardLookupTable: The 5 to 7 cards lookup table, built on the first call
+        """
+        if SevenCardEvaluator.seven_card_lookup_table is None:
+            SevenCardEvaluator.seven_card_lookup_table = SevenCardLookupTable(LOOKUP_TABLE, BOOKS)
+        return SevenCardEvaluator.seven_card_lookup_table
+
+    @classmethod
+    def get_array_lookup_table(cls) -> ArrayLookupTable:
+        """
+        Returns:
+            ArrayLookupTable: The 5 to 7 cards lookup table as NumPy arrays, built on the first call
+        """
+        if SevenCardEvaluator.array_lookup_table is None:
+            if BOOKS is not None:
+                SevenCardEvaluator.array_lookup_table = ArrayLookupTable(books=BOOKS)
+            else:
+                SevenCardEvaluator.array_lookup_table = ArrayLookupTable(cls.get_lookup_table())
+        return SevenCardEvaluator.array_lookup_table
+
+    @classmethod
+    def evaluate(cls, cards, board) -> int:
+        """
+        Evaluates the best five-card hand from the given cards and board. Returns
+        the corresponding rank.
+        """
+        lookup_table = cls.get_lookup_table()
+        card_keys = cls.card_keys
+        product = 1
+        suit_masks = [0] * 9
+        suit_counts = [0] * 9
+        for card in itertools.chain(cards, board):
+            card_key = card_keys.get(card)
+            prime, suit, bitrank = card_key if card_key is not None else cls.get_card_key(card)
+            product *= prime
+            suit_masks[suit] |= bitrank
+            suit_counts[suit] += 1
+        score = lookup_table.unsuited_lookup[product]
+        for suit in BitCard.int_suits:
+            if suit_counts[suit] >= 5:
+                score = min(score, lookup_table.flush_lookup[suit_masks[suit]])
+        return score
+
+    @classmethod
+    def evaluate_indexes(cls, cards, board) -> int:
+        """
+        Evaluates the best five-card hand from cards encoded as their index in ``Card.all_cards``, from 0 to 51.
+
+        Args:
+            cards (Iterable): The indexes of the hole cards
+            board (Iterable): The indexes of the board cards
+        Returns:
+            int: The rank of the hand, identical to the one returned by :meth:`evaluate`
+        """
+        lookup_table = cls.get_lookup_table()
+        index_keys = cls.index_keys
+        product = 1
+        suit_masks = [0] * 9
+        suit_counts = [0] * 9
+        for index in itertools.chain(cards, board):
+            prime, suit, bitrank = index_keys[index]
+            product *= prime
+            suit_masks[suit] |= bitrank
+            suit_counts[suit] += 1
+        score = lookup_table.unsuited_lookup[product]
+        for suit in BitCard.int_suits:
+            if suit_counts[suit] >= 5:
+                score = min(score, lookup_table.flush_lookup[suit_masks[suit]])
+        return score
@@ -1,6 +1,6 @@
 from itertools import combinations
 from pkrcomponents.components.cards.card import Card
-from pkrcomponents.components.cards.rank import Rank
+from pkrcomponents.components.cards.rank import RANK_DIFFERENCES
 from pkrcomponents.components.utils.meta.flop_meta import FlopMeta
 
 
@@ -53,7 +53,30 @@ class Flop(metaclass=FlopMeta):
 
     @property
     def differences(self):
-        return {Rank.difference(duo[0].rank, duo[1].rank) for duo in self.duos}
+        first, second, third = (card.rank.ordinal for card in self.cards)
+        return {RANK_DIFFERENCES[first][second], RANK_DIFFERENCES[first][third], RANK_DIFFERENCES[second][third]}
+
+    @property
+    def class_id(self):
+        """
+        The id of the suit-isomorphic class of the flop in the FlopTable, between 0 and 1754, None for an empty flop
+        """
+        if self.first_card is None:
+            return None
+        # imported here so that importing Flop does not import NumPy
+        from pkrcomponents.components.cards.flop_table import get_flop_table
+        return get_flop_table().get_class_id(self)
+
+    @property
+    def features(self):
+        """
+        The precomputed texture features of the flop class, as a record of the FlopTable features, None for an empty
+        flop
+        """
+        if self.first_card is None:
+            return None
+        from pkrcomponents.components.cards.flop_table import get_flop_table
+        return get_flop_table().features[self.class_id]
 
     @property
     def is_rainbow(self):
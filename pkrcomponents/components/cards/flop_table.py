@@ -0,0 +1,110 @@
+"""This module contains the FlopTable class, which maps every flop to its suit-isomorphic class and keeps the
+texture features of each class."""
+from functools import lru_cache
+from itertools import combinations, permutations
+
+import numpy as np
+
+from pkrcomponents.components.cards.card import Card
+from pkrcomponents.components.cards.flop import Flop
+
+__all__ = ["FlopTable", "FLOP_FEATURES_DTYPE", "NB_FLOP_CLASSES", "get_flop_table"]
+
+NB_FLOP_CLASSES = 1755
+FLOP_FEATURES_DTYPE = np.dtype([
+    ("nb_flops", np.int16),
+    ("is_rainbow", np.bool_),
+    ("is_monotone", np.bool_),
+    ("has_flush_draw", np.bool_),
+    ("is_paired", np.bool_),
+    ("is_triplet", np.bool_),
+    ("has_straight_draw", np.bool_),
+    ("has_gutshot", np.bool_),
+    ("is_sequential", np.bool_),
+    ("has_straights", np.bool_),
+    ("min_distance", np.int8),
+    ("max_distance", np.int8),
+    ("high_card", np.int8),
+])
+# A flop key encodes its three card indexes in base 52
+KEY_WEIGHTS = np.array([52 * 52, 52, 1])
+
+
+class FlopTable:
+    """
+    Maps each of the 22100 flops to one of the 1755 flop classes, two flops being in the same class when a
+    permutation of the suits turns one into the other. Classes share their texture, so texture statistics over
+    many hands can be grouped by class id.
+
+    Cards are encoded as their index in ``Card.all_cards``, from 0 to 51.
+
+    Attributes:
+        class_ids (np.ndarray): the class id of each flop key, for the 6 orders of its cards, -1 for impossible flops
+        representatives (np.ndarray): the card indexes of the canonical flop of each class, of shape (1755, 3)
+        features (np.recarray): the texture features of each class, with the FLOP_FEATURES_DTYPE fields
+
+    """
+
+    def __init__(self):
+        flops = np.array(list(combinations(range(52), 3)), dtype=np.intp)
+        ranks, suits = flops - flops % 4, flops % 4
+        permuted_keys = [np.sort(ranks + np.array(permutation)[suits], axis=1) @ KEY_WEIGHTS
+                         for permutation in permutations(range(4))]
+        canonical_keys, flop_classes, nb_flops = np.unique(np.min(permuted_keys, axis=0), return_inverse=True,
+                                                           return_counts=True)
+        self.class_ids = np.full(52 ** 3, -1, dtype=np.int16)
+        for order in permutations(range(3)):
+            self.class_ids[flops[:, order] @ KEY_WEIGHTS] = flop_classes
+        self.representatives = np.stack((canonical_keys // (52 * 52), canonical_keys // 52 % 52, canonical_keys % 52),
+                                        axis=1)
+        self.features = np.rec.array(
+            [self._get_features(representative, count)
+             for representative, count in zip(self.representatives, nb_flops)],
+            dtype=FLOP_FEATURES_DTYPE
+        )
+
+    @staticmethod
+    def _get_features(representative, nb_flops: int) -> tuple:
+        """
+        Returns the texture features of the flop with the given card indexes, in FLOP_FEATURES_DTYPE order
+        """
+        flop = Flop(*(Card.from_index(index) for index in representative))
+        return (nb_flops, flop.is_rainbow, flop.is_monotone, flop.has_flush_draw, flop.is_paired, flop.is_triplet,
+                flop.has_straight_draw, flop.has_gutshot, flop.is_sequential, flop.has_straights, flop.min_distance,
+                flop.max_distance, flop.first_card.rank.ordinal)
+
+    def get_class_id(self, flop) -> int:
+        """
+        Returns the class id of a flop
+
+        Args:
+            flop (Flop, Iterable): The flop, or its three cards as Card, strings or card indexes
+        Returns:
+            int: The class id of the flop, between 0 and 1754
+        """
+        cards = flop.cards if isinstance(flop, Flop) else flop
+        indexes = [card if isinstance(card, (int, np.integer)) else Card(card).index for card in cards]
+        class_id = self.class_ids[np.asarray(indexes) @ KEY_WEIGHTS]
+        if class_id < 0:
+            raise ValueError("A flop must be made of three different cards")
+        return int(class_id)
+
+    def get_class_ids(self, flops_array) -> np.ndarray:
+        """
+        Returns the class ids of N flops at once
+
+        Args:
+            flops_array (array-like): The card indexes of the flops, of shape (N, 3)
+        Returns:
+            np.ndarray: The N class ids, -1 for the flops that repeat a card
+        """
+        return self.class_ids[np.asarray(flops_array, dtype=np.intp) @ KEY_WEIGHTS]
+
+
+@lru_cache(maxsize=1)
+def get_flop_table() -> FlopTable:
+    """
+    Returns:
+        FlopTable: The flop table, built on the first call
+    """
+    return FlopTable()
@@ -10,6 +10,8 @@ __all__ = [
 from pkrcomponents.components.cards.shape import Shape
 from pkrcomponents.components.utils.meta.hand_meta import HandMeta
 
+NB_NON_PAIRED_HANDS = 156
+
 
 @total_ordering
 class Hand(ReprMixin, metaclass=HandMeta):
@@ -113,6 +115,26 @@ class Hand(ReprMixin, metaclass=HandMeta):
             obj._shape = random.choice(["s", "o"])
         return obj
 
+    @classmethod
+    def from_index(cls, index: int):
+        """
+        Returns the Hand at an index of Hand.all_hands
+
+        Args:
+            index (int): The index of the hand, between 0 and 168
+        Returns:
+            Hand: The hand at this index
+        """
+        return cls.all_hands[index]
+
+    @property
+    def index(self) -> int:
+        """The index of the hand in Hand.all_hands, between 0 and 168"""
+        first, second = self.first.ordinal, self.second.ordinal
+        if first == second:
+            return NB_NON_PAIRED_HANDS + first
+        return first * (first - 1) + 2 * second + (self._shape == "s")
+
     @property
     def short_name(self):
         """Returns the short name of the hand"""
@@ -0,0 +1,186 @@
+"""This module contains the Range class, which represents a weighted set of combos."""
+from pkrcomponents.components.cards.card import Card
+from pkrcomponents.components.cards.combo import Combo
+from pkrcomponents.components.cards.hand import Hand
+from pkrcomponents.components.cards.rank import Rank
+from pkrcomponents.components.cards.suit import Suit
+
+__all__ = ["Range"]
+
+# The 169 hands sorted by decreasing all-in equity against a random hand, used for "top X%" ranges
+HANDS_BY_STRENGTH = (
+    "AA", "KK", "QQ", "JJ", "TT", "99", "88", "AKs", "AQs", "77", "AJs", "AKo", "ATs", "AQo", "AJo", "KQs", "66",
+    "ATo", "A9s", "KJs", "A8s", "KTs", "KQo", "A7s", "A9o", "KJo", "QJs", "55", "A5s", "K9s", "A6s", "A8o", "KTo",
+    "QTs", "A4s", "A7o", "K8s", "QJo", "A3s", "K9o", "A6o", "A5o", "Q9s", "K7s", "JTs", "A2s", "QTo", "44", "K6s",
+    "A4o", "Q8s", "K5s", "K8o", "A3o", "J9s", "Q9o", "K7o", "JTo", "K4s", "A2o", "Q7s", "K6o", "J8s", "T9s", "K3s",
+    "33", "Q6s", "Q8o", "K5o", "J9o", "K2s", "Q5s", "T8s", "J7s", "K4o", "Q7o", "Q4s", "T9o", "K3o", "J8o", "Q6o",
+    "Q3s", "98s", "T7s", "J6s", "K2o", "22", "Q2s", "Q5o", "J5s", "T8o", "J7o", "97s", "J4s", "Q4o", "T6s", "Q3o",
+    "J3s", "98o", "J6o", "T7o", "87s", "96s", "J2s", "Q2o", "J5o", "T5s", "T4s", "97o", "86s", "T6o", "J4o", "95s",
+    "T3s", "76s", "J3o", "87o", "T2s", "85s", "96o", "J2o", "T5o", "94s", "75s", "T4o", "93s", "86o", "65s", "T3o",
+    "84s", "95o", "76o", "92s", "74s", "T2o", "54s", "85o", "64s", "83s", "94o", "75o", "82s", "93o", "73s", "65o",
+    "53s", "63s", "84o", "92o", "43s", "74o", "54o", "72s", "64o", "62s", "52s", "83o", "82o", "42s", "73o", "63o",
+    "53o", "32s", "43o", "72o", "52o", "62o", "42o", "32o"
+)
+RANKS = tuple(Rank)
+SUIT_SYMBOLS = tuple(f"{suit}" for suit in Suit)
+
+
+def _expand_hand(token: str) -> list:
+    """
+    Expands a hand token, like "AK", "AKs", "22+", "A2s+", "99-66" or "T9s-65s", into the list of its hands
+    """
+    if token.endswith("+"):
+        if len(token) == 3 and token[0] != token[1]:
+            return [hand for shape in "so" for hand in _expand_hand(f"{token[:-1]}{shape}+")]
+        hand = Hand(token[:-1])
+        if hand.is_pair:
+            return [Hand(f"{rank}{rank}") for rank in RANKS[RANKS.index(hand.first):]]
+        kickers = RANKS[RANKS.index(hand.second):RANKS.index(hand.first)]
+        return [Hand(f"{hand.first}{kicker}{hand.shape}") for kicker in kickers]
+    if "-" in token:
+        high_token, low_token = token.split("-")
+        high, low = Hand(high_token), Hand(low_token)
+        if high.shape != low.shape:
+            raise ValueError(f"Both ends of {token} must have the same shape")
+        if high < low:
+            high, low = low, high
+        if high.is_pair:
+            return [Hand(f"{rank}{rank}") for rank in RANKS[RANKS.index(low.first):RANKS.index(high.first) + 1]]
+        if high.first == low.first:
+            kickers = RANKS[RANKS.index(low.second):RANKS.index(high.second) + 1]
+            return [Hand(f"{high.first}{kicker}{high.shape}") for kicker in kickers]
+        gap = RANKS.index(high.first) - RANKS.index(high.second)
+        if RANKS.index(low.first) - RANKS.index(low.second) != gap:
+            raise ValueError(f"{token} must keep either the first rank or the gap between ranks")
+        firsts = RANKS[RANKS.index(low.first):RANKS.index(high.first) + 1]
+        return [Hand(f"{first}{RANKS[RANKS.index(first) - gap]}{high.shape}") for first in firsts]
+    if len(token) == 2 and token[0] != token[1]:
+        return [Hand(f"{token}s"), Hand(f"{token}o")]
+    return [Hand(token)]
+
+
+class Range:
+    """
+    A range of combos, each one with a weight between 0 and 1
+
+    Attributes:
+        weights (dict): The weight of each combo of the range
+
+    Methods:
+        from_string: creates a range from a notation like "22+,A2s+,KQo:0.5,AsKs" or "top 15%"
+        from_top: creates a range with the strongest hands
+        without_dead_cards: returns the range without the combos blocked by dead cards
+    """
+
+    def __init__(self, weights: dict = None):
+        self.weights = {}
+        for combo, weight in (weights or {}).items():
+            if not 0 <= weight <= 1:
+                raise ValueError(f"Weight of {combo} must be between 0 and 1")
+            if weight > 0:
+                self.weights[Combo(combo)] = float(weight)
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __iter__(self):
+        return iter(self.weights)
+
+    def __contains__(self, combo):
+        return Combo(combo) in self.weights
+
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and self.weights == other.weights
+
+    def __repr__(self):
+        return f"Range({len(self)} combos)"
+
+    @property
+    def combos(self) -> list:
+        """
+        Returns:
+            list: The combos of the range
+        """
+        return list(self.weights)
+
+    @property
+    def nb_combos(self) -> float:
+        """
+        Returns:
+            float: The number of combos in the range, counted with their weights
+        """
+        return sum(self.weights.values())
+
+    @classmethod
+    def from_hands(cls, hands, weight: float = 1.0):
+        """
+        Creates a range with every combo of the given hands
+
+        Args:
+            hands (Iterable): The hands of the range, as Hand or strings
+            weight (float): The weight of every combo
+        Returns:
+            Range: The range of the hands
+        """
+        return cls({combo: weight for hand in hands for combo in Combo.from_hand(Hand(hand))})
+
+    @classmethod
+    def from_top(cls, percentage: float, weight: float = 1.0):
+        """
+        Creates a range with the strongest hands, until they make up the given percentage of all combos
+
+        Args:
+            percentage (float): The percentage of the 1326 combos to include, between 0 and 100
+            weight (float): The weight of every combo
+        Returns:
+            Range: The range of the strongest hands
+        """
+        target = len(Combo) * percentage / 100
+        hands, nb_combos = [], 0
+        for hand_str in HANDS_BY_STRENGTH:
+            if nb_combos >= target:
+                break
+            hand = Hand(hand_str)
+            hands.append(hand)
+            nb_combos += len(Combo.from_hand(hand))
+        return cls.from_hands(hands, weight)
+
+    @classmethod
+    def from_string(cls, range_str: str):
+        """
+        Creates a range from a comma separated notation.
+        Tokens can be hands ("AK", "AKs", "QQ"), open ranges ("22+", "A2s+"), closed ranges ("99-66", "T9s-65s",
+        "A5s-A2s"), combos ("AsKs") or top ranges ("top 15%"), each one with an optional weight ("KQo:0.5").
+
+        Args:
+            range_str (str): The notation of the range
+        Returns:
+            Range: The range described by the notation
+        """
+        weights = {}
+        for token in range_str.replace(" ", "").split(","):
+            if not token:
+                continue
+            token, _, weight = token.partition(":")
+            weight = float(weight) if weight else 1.0
+            if token.lower().startswith("top") or token.endswith("%"):
+                combos = cls.from_top(float(token.lower().removeprefix("top").rstrip("%"))).combos
+            elif len(token) == 4 and token[1] in SUIT_SYMBOLS and token[3] in SUIT_SYMBOLS:
+                combos = [Combo(token)]
+            else:
+                combos = [combo for hand in _expand_hand(token) for combo in Combo.from_hand(hand)]
+            weights.update({combo: weight for combo in combos})
+        return cls(weights)
+
+    def without_dead_cards(self, dead_cards):
+        """
+        Returns the range without the combos blocked by dead cards
+
+        Args:
+            dead_cards (Iterable): The dead cards, as Card or strings
+        Returns:
+            Range: The range of the combos that can still be dealt
+        """
+        dead_cards = {Card(card) for card in dead_cards if card is not None}
+        return Range({combo: weight for combo, weight in self.weights.items()
+                      if combo.first not in dead_cards and combo.second not in dead_cards})
@@ -1,6 +1,10 @@
 from pkrcomponents.components.cards.bitcard import BitCard
-from typing import Dict
+from pkrcomponents.components.cards.card import Card
+from typing import Dict, List
 import itertools
+import math
+import os
+import numpy as np
 
 """
 The lookup table module keeps the books on all possible hand strengths.
@@ -28,8 +32,35 @@ Example:
     - Royal flush (best hand possible) -> 1
     - 7-5-4-3-2 unsuited (worst hand possible) -> 7462
 
+The books of the lookup tables are also saved in a binary file, shipped with the package, which is memory-mapped
+instead of recomputing them. The file starts with the lengths of the books, as int64, followed by the books
+themselves in BOOKS_LAYOUT order. Run this module to write the file again.
+
 """
 
+BOOKS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lookup_table.bin")
+# 8-byte books come first so that every book stays aligned in the file
+BOOKS_LAYOUT = (
+    ("flush_keys", np.int64),
+    ("unsuited_keys", np.int64),
+    ("seven_card_unsuited_keys", np.int64),
+    ("flush_ranks", np.int16),
+    ("unsuited_ranks", np.int16),
+    ("seven_card_flush_ranks", np.int16),
+    ("seven_card_unsuited_ranks", np.int16),
+)
+
+
+def _get_rank_classes(max_to_rank_class: Dict[int, int]) -> tuple:
+    """
+    Expands the worst rank of each rank class into the rank class of every rank, from 1 to 7462.
+    Index 0 is not a rank and holds 0.
+    """
+    rank_classes = [0]
+    for max_rank, rank_class in sorted(max_to_rank_class.items()):
+        rank_classes.extend([rank_class] * (max_rank + 1 - len(rank_classes)))
+    return tuple(rank_classes)
+
 
 class LookupTable:
     # pylint: disable=too-few-public-methods
@@ -38,6 +69,8 @@ class LookupTable:
         flush_lookup (Dict[int, int]): map from prime-product to rank for suited cards
         unsuited_lookup (Dict[int, int]): map from prime-product to rank for unsuited cards
 
+    The books are read from the memory-mapped file of :func:`load_books` when given, computed otherwise.
+
     """
 
     MAX_STRAIGHT_FLUSH = 10
@@ -74,7 +107,17 @@ class LookupTable:
         9: "High card",
     }
 
-    def __init__(self):
+    # rank class of every rank, as a tuple for single lookups and as an array for vectorized ones
+    RANK_TO_RANK_CLASS = _get_rank_classes(MAX_TO_RANK_CLASS)
+    RANK_CLASSES = np.array(RANK_TO_RANK_CLASS, dtype=np.int8)
+
+    def __init__(self, books: Dict[str, np.ndarray] = None):
+        if books is not None:
+            self.flush_lookup: Dict[int, int] = dict(zip(books["flush_keys"].tolist(), books["flush_ranks"].tolist()))
+            self.unsuited_lookup: Dict[int, int] = dict(
+                zip(books["unsuited_keys"].tolist(), books["unsuited_ranks"].tolist())
+            )
+            return
         # create dictionaries
         self.flush_lookup: Dict[int, int] = {}
         self.unsuited_lookup: Dict[int, int] = {}
@@ -286,6 +329,155 @@ class LookupTable:
             yield lexo_next
 
 
-"""
-The lookup table that is created when imported
-"""
\ No newline at end of file
+class SevenCardLookupTable:
+    """
+    Extends the five-card books to hands of 5, 6 and 7 cards, keeping the same [1, 7462] rank scale.
+
+    Each entry holds the best five-card rank that can be made from the cards, so that a 7-card hand is
+    scored with one flush lookup per suit and one unsuited lookup instead of 21 five-card evaluations.
+
+    Attributes:
+        flush_lookup (List[int]): map from the 13-bit rank mask of 5 to 7 suited cards to the best flush rank,
+            0 for masks with less than 5 bits set
+        unsuited_lookup (Dict[int, int]): map from the prime product of 5 to 7 cards to the best non-flush rank
+
+    """
+
+    def __init__(self, lookup_table: LookupTable = None, books: Dict[str, np.ndarray] = None):
+        if books is not None:
+            self.flush_lookup: List[int] = books["seven_card_flush_ranks"].tolist()
+            self.unsuited_lookup: Dict[int, int] = dict(
+                zip(books["seven_card_unsuited_keys"].tolist(), books["seven_card_unsuited_ranks"].tolist())
+            )
+            return
+        if lookup_table is None:
+            lookup_table = LookupTable()
+        self.flush_lookup: List[int] = [0] * (1 << len(BitCard.int_ranks))
+        self.unsuited_lookup: Dict[int, int] = dict(lookup_table.unsuited_lookup)
+
+        self._flushes(lookup_table)
+        self._unsuited()
+
+    def _flushes(self, lookup_table: LookupTable):
+        """
+        Best flush of every 5, 6 and 7 suited cards, indexed by their rank mask.
+
+        A 6 or 7 bits mask is as strong as its best sub-mask with one rank removed.
+        """
+        rank_bits = tuple(1 << i for i in BitCard.int_ranks)
+        masks_by_size = {5: [], 6: [], 7: []}
+        for mask in range(len(self.flush_lookup)):
+            size = bin(mask).count("1")
+            if size in masks_by_size:
+                masks_by_size[size].append(mask)
+
+        for mask in masks_by_size[5]:
+            self.flush_lookup[mask] = lookup_table.flush_lookup[BitCard.prime_product_from_rankbits(mask)]
+        for size in (6, 7):
+            for mask in masks_by_size[size]:
+                self.flush_lookup[mask] = min(
+                    self.flush_lookup[mask ^ bit] for bit in rank_bits if mask & bit
+                )
+
+    def _unsuited(self):
+        """
+        Best non-flush hand of every 6 and 7 cards, indexed by their prime product.
+
+        A multiset of ranks is as strong as its best sub-multiset with one card removed.
+        """
+        for size in (6, 7):
+            for ranks in itertools.combinations_with_replacement(BitCard.int_ranks, size):
+                if any(ranks.count(rank) > 4 for rank in set(ranks)):
+                    continue
+                product = math.prod(BitCard.primes[rank] for rank in ranks)
+                self.unsuited_lookup[product] = min(
+                    self.unsuited_lookup[product // BitCard.primes[rank]] for rank in set(ranks)
+                )
+
+
+class ArrayLookupTable:
+    """
+    The books of a :class:`SevenCardLookupTable` moved into NumPy arrays for vectorized evaluations.
+
+    Cards are encoded as their index in ``Card.all_cards``, from 0 to 51.
+
+    Attributes:
+        flush_lookup (np.ndarray): map from the 13-bit rank mask of 5 to 7 suited cards to the best flush rank
+        unsuited_keys (np.ndarray): sorted prime products of 5 to 7 cards
+        unsuited_ranks (np.ndarray): best non-flush rank of each prime product in unsuited_keys
+        card_primes (np.ndarray): prime of each card index
+        card_suits (np.ndarray): suit bit of each card index
+        card_bitranks (np.ndarray): rank bit of each card index
+
+    """
+
+    def __init__(self, seven_card_lookup_table: SevenCardLookupTable = None, books: Dict[str, np.ndarray] = None):
+        if books is not None:
+            self.flush_lookup = books["seven_card_flush_ranks"]
+            self.unsuited_keys = books["seven_card_unsuited_keys"]
+            self.unsuited_ranks = books["seven_card_unsuited_ranks"]
+        else:
+            if seven_card_lookup_table is None:
+                seven_card_lookup_table = SevenCardLookupTable()
+            self.flush_lookup = np.array(seven_card_lookup_table.flush_lookup, dtype=np.int16)
+            unsuited_items = sorted(seven_card_lookup_table.unsuited_lookup.items())
+            self.unsuited_keys = np.array([product for product, _ in unsuited_items], dtype=np.int64)
+            self.unsuited_ranks = np.array([rank for _, rank in unsuited_items], dtype=np.int16)
+
+        bit_cards = [BitCard(card) for card in Card]
+        self.card_primes = np.array([bit_card.prime for bit_card in bit_cards], dtype=np.int64)
+        self.card_suits = np.array([bit_card.suit for bit_card in bit_cards], dtype=np.int8)
+        self.card_bitranks = np.array([bit_card.bitrank for bit_card in bit_cards], dtype=np.int16)
+
+
+
+def save_books(path: str = BOOKS_PATH):
+    """
+    Computes the five and seven cards lookup tables and writes their books in a binary file
+
+    Args:
+        path (str): The path of the file
+    """
+    lookup_table = LookupTable()
+    array_lookup_table = ArrayLookupTable(SevenCardLookupTable(lookup_table))
+    flush_items = sorted(lookup_table.flush_lookup.items())
+    unsuited_items = sorted(lookup_table.unsuited_lookup.items())
+    books = {
+        "flush_keys": [key for key, _ in flush_items],
+        "flush_ranks": [rank for _, rank in flush_items],
+        "unsuited_keys": [key for key, _ in unsuited_items],
+        "unsuited_ranks": [rank for _, rank in unsuited_items],
+        "seven_card_flush_ranks": array_lookup_table.flush_lookup,
+        "seven_card_unsuited_keys": array_lookup_table.unsuited_keys,
+        "seven_card_unsuited_ranks": array_lookup_table.unsuited_ranks,
+    }
+    with open(path, "wb") as file:
+        file.write(np.array([len(books[name]) for name, _ in BOOKS_LAYOUT], dtype=np.int64).tobytes())
+        for name, dtype in BOOKS_LAYOUT:
+            file.write(np.asarray(books[name], dtype=dtype).tobytes())
+
+
+def load_books(path: str = BOOKS_PATH) -> Dict[str, np.ndarray]:
+    """
+    Memory-maps the books written by :func:`save_books`
+
+    Args:
+        path (str): The path of the file
+    Returns:
+        Dict[str, np.ndarray]: The read-only books by name, None if the file does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    offset = len(BOOKS_LAYOUT) * np.dtype(np.int64).itemsize
+    lengths = data[:offset].view(np.int64)
+    books = {}
+    for (name, dtype), length in zip(BOOKS_LAYOUT, lengths):
+        size = int(length) * np.dtype(dtype).itemsize
+        books[name] = data[offset:offset + size].view(dtype)
+        offset += size
+    return books
+
+
+if __name__ == "__main__":
+    save_books()
@@ -59,19 +59,27 @@ class Rank(PokerEnum):
         """
 
         # so we always get a Rank instance even if string were passed in
-        first, second = cls(first), cls(second)
-        rank_list = list(cls)
-        a = rank_list.index(first)+2
-        b = rank_list.index(second)+2
-        if a == 14:
-            return min(abs(a-b), abs(1-b))
-        elif b == 14:
-            return min(abs(a - b), abs(a - 1))
-        return abs(rank_list.index(first) - rank_list.index(second))
+        if first.__class__ is not cls:
+            first = cls(first)
+        if second.__class__ is not cls:
+            second = cls(second)
+        return RANK_DIFFERENCES[first.ordinal][second.ordinal]
 
     def __sub__(self, other):
         return self.difference(self, other)
 
 
+def _ordinals_difference(first: int, second: int) -> int:
+    """
+    Tells the difference between two rank ordinals, the ace (ordinal 12) also counting as one below the deuce
+    """
+    if first == 12:
+        return min(12 - second, second + 1)
+    elif second == 12:
+        return min(12 - first, first + 1)
+    return abs(first - second)
+
+
+RANK_DIFFERENCES = tuple(tuple(_ordinals_difference(first, second) for second in range(13)) for first in range(13))
 FACE_RANKS = Rank("J"), Rank("Q"), Rank("K")
 BROADWAY_RANKS = Rank("T"), Rank("J"), Rank("Q"), Rank("K"), Rank("A")
@@ -14,26 +14,27 @@ class PlayerHandStats(StreetHandStatsBase):
 
     Methods:
         reset: Resets all stats
+        make_default: Creates stats with default values, without running validators
     """
     # A. Preflop stats
     preflop = field(
-        default=Factory(preflop.PreflopPlayerHandStats),
+        default=Factory(preflop.PreflopPlayerHandStats.make_default),
         metadata={'description': 'Preflop player stats for a hand'},
         validator=instance_of(preflop.PreflopPlayerHandStats))
     flop = field(
-        default=Factory(postflop.PostflopPlayerHandStats),
+        default=Factory(postflop.PostflopPlayerHandStats.make_default),
         metadata={'description': 'Flop player stats for a hand'},
         validator=instance_of(postflop.PostflopPlayerHandStats))
     turn = field(
-        default=Factory(postflop.PostflopPlayerHandStats),
+        default=Factory(postflop.PostflopPlayerHandStats.make_default),
         metadata={'description': 'Turn player stats for a hand'},
         validator=instance_of(postflop.PostflopPlayerHandStats))
     river = field(
-        default=Factory(postflop.PostflopPlayerHandStats),
+        default=Factory(postflop.PostflopPlayerHandStats.make_default),
         metadata={'description': 'River player stats for a hand'},
         validator=instance_of(postflop.PostflopPlayerHandStats))
     general = field(
-        default=Factory(general.GeneralPlayerHandStats),
+        default=Factory(general.GeneralPlayerHandStats.make_default),
         metadata={'description': 'General player stats for a hand'},
         validator=instance_of(general.GeneralPlayerHandStats))
 
@@ -44,6 +45,20 @@ class PlayerHandStats(StreetHandStatsBase):
         self.river.reset()
         self.general.reset()
 
+    @classmethod
+    def make_default(cls):
+        """
+        Creates stats equal to PlayerHandStats(), whose streets are left reset by __attrs_post_init__,
+        building the streets directly in their reset state
+        """
+        stats = object.__new__(cls)
+        object.__setattr__(stats, "preflop", preflop.PreflopPlayerHandStats.make_reset())
+        object.__setattr__(stats, "flop", postflop.PostflopPlayerHandStats.make_reset())
+        object.__setattr__(stats, "turn", postflop.PostflopPlayerHandStats.make_reset())
+        object.__setattr__(stats, "river", postflop.PostflopPlayerHandStats.make_reset())
+        object.__setattr__(stats, "general", general.GeneralPlayerHandStats.make_reset())
+        return stats
+
     def to_dataframe(self) -> pd.DataFrame:
         """
         Converts the object to a pandas DataFrame
@@ -1,19 +1,24 @@
 from pkrcomponents.components.actions.posting import AntePosting, SBPosting, BBPosting
-from pkrcomponents.components.players.position import Position
+from pkrcomponents.components.players.position import POSITIONS_MAPPER
 from pkrcomponents.components.utils.exceptions import PlayerNotOnTableError
 
 
 class Players:
     """
     Class representing many players on a table
+
+    The seat orderings and position maps only depend on the occupied seats and on the Big Blind seat, so they are
+    computed on first use and kept until a player is added or removed or the Big Blind seat changes.
     """
     _bb_seat: int
     _pl_list: list
     _name_dict: dict
     _seat_dict: dict
+    _seating_cache: dict
     button_seat: int
 
     def __init__(self):
+        self._seating_cache = {}
         self.pl_list = []
         self.name_dict = {}
         self.seat_dict = {}
@@ -31,7 +36,7 @@ class Players:
             raise ValueError("To get a player, call it by its name or seat")
 
     def __len__(self):
-        return len(self.occupied_seats)
+        return len(self.seat_dict)
 
     def __contains__(self, item):
         return self.pl_list.__contains__(item)
@@ -71,18 +76,24 @@ class Players:
     def seat_dict(self, dico):
         """Setter for seat dict property"""
         self._seat_dict = dico
+        self.clear_seating_cache()
+
+    def clear_seating_cache(self):
+        """Forgets the seat orderings and position maps, when the seating changes"""
+        self._seating_cache.clear()
 
     @property
     def len(self):
         """Returns the number of players on the table"""
-        return self.__len__()
+        return len(self.seat_dict)
 
     @property
     def occupied_seats(self):
         """returns an ordered list of the number of every occupied seat on the table"""
-        tab = list(self.seat_dict.keys())
-        tab.sort()
-        return tab
+        try:
+            return self._seating_cache["occupied_seats"]
+        except KeyError:
+            return self._seating_cache.setdefault("occupied_seats", sorted(self.seat_dict))
 
     @property
     def bb_seat(self):
@@ -92,24 +103,30 @@ class Players:
     @bb_seat.setter
     def bb_seat(self, seat):
         """ Setter for bb_seat property"""
-        if seat in self.occupied_seats:
+        if seat not in self.seat_dict:
+            seat = self.occupied_seats[0]
+        if seat != self._bb_seat:
             self._bb_seat = seat
-        else:
-            self._bb_seat = self.occupied_seats[0]
+            self.clear_seating_cache()
 
     @property
     def preflop_ordered_seats(self):
         """Returns the list of the indexes of players on the table, with preflop playing order"""
-        cut = self.occupied_seats.index(self.bb_seat) + 1
-        return self.occupied_seats[cut:] + self.occupied_seats[:cut]
+        try:
+            return self._seating_cache["preflop_ordered_seats"]
+        except KeyError:
+            occupied_seats = self.occupied_seats
+            cut = occupied_seats.index(self.bb_seat) + 1
+            return self._seating_cache.setdefault("preflop_ordered_seats", occupied_seats[cut:] + occupied_seats[:cut])
 
     @property
     def positions_mapper(self):
         """Returns a dict {seat: position} """
-        nb_players = self.len
-        mapper = Position.get_mapper()
-        positions = mapper[nb_players]
-        return dict(zip(self.preflop_ordered_seats, positions))
+        try:
+            return self._seating_cache["positions_mapper"]
+        except KeyError:
+            positions = POSITIONS_MAPPER[self.len]
+            return self._seating_cache.setdefault("positions_mapper", dict(zip(self.preflop_ordered_seats, positions)))
 
     def set_button_seat(self, seat: int):
         self.button_seat = seat
@@ -117,10 +134,11 @@ class Players:
     @property
     def seats_mapper(self):
         """Returns a dict {position: seat} """
-        nb_players = self.len
-        mapper = Position.get_mapper()
-        positions = tuple(position.name for position in mapper[nb_players])
-        return dict(zip(positions, self.preflop_ordered_seats))
+        try:
+            return self._seating_cache["seats_mapper"]
+        except KeyError:
+            positions = tuple(position.name for position in POSITIONS_MAPPER[self.len])
+            return self._seating_cache.setdefault("seats_mapper", dict(zip(positions, self.preflop_ordered_seats)))
 
     def distribute_positions(self):
         """When  players are on the table and bb is set, distributes a position to each player on the table"""
@@ -139,18 +157,25 @@ class Players:
     @property
     def postflop_ordered_seats(self):
         """Returns the list of the indexes of players on the table, with postflop playing order"""
-        return self.preflop_ordered_seats[-2:] + self.preflop_ordered_seats[:-2]
+        try:
+            return self._seating_cache["postflop_ordered_seats"]
+        except KeyError:
+            preflop_ordered_seats = self.preflop_ordered_seats
+            postflop_ordered_seats = preflop_ordered_seats[-2:] + preflop_ordered_seats[:-2]
+            return self._seating_cache.setdefault("postflop_ordered_seats", postflop_ordered_seats)
 
     def add_player(self, player):
         """Adds a player to the table"""
         self.pl_list.append(player)
         self.name_dict[player.name] = player
         self.seat_dict[player.seat] = player
+        self.clear_seating_cache()
 
     def remove_player(self, player):
         self.pl_list.remove(player)
         self.name_dict.pop(player.name)
         self.seat_dict.pop(player.seat)
+        self.clear_seating_cache()
 
     def advance_bb_seat(self):
         """Advances the Big Blind seat"""
@@ -196,6 +221,16 @@ class Players:
                 bb_index = 0
         return self.occupied_seats[bb_index]
 
+    def reset(self):
+        """Removes every player and seating information, as for a new Players object"""
+        self.pl_list.clear()
+        self.name_dict.clear()
+        self.seat_dict.clear()
+        self._bb_seat = 1
+        self.clear_seating_cache()
+        if hasattr(self, "button_seat"):
+            del self.button_seat
+
     def hand_reset(self):
         """Reset all players for a new hand"""
         for player in self:
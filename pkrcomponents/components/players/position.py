@@ -57,22 +57,8 @@ class Position(ReprMixin, PokerEnum):
 
     @classmethod
     def get_mapper(cls):
-        return {
-            1: [Position.BB],
-            2: [Position.SB, Position.BB],
-            3: [Position.BTN, Position.SB, Position.BB],
-            4: [Position.CO, Position.BTN, Position.SB, Position.BB],
-            5: [Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB],
-            6: [Position.UTG, Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB],
-            7: [Position.UTG, Position.LJ, Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB],
-            8: [Position.UTG, Position.UTG1, Position.LJ, Position.HJ, Position.CO, Position.BTN, Position.SB,
-                Position.BB],
-            9: [Position.UTG, Position.UTG1, Position.UTG2, Position.LJ, Position.HJ, Position.CO, Position.BTN,
-                Position.SB, Position.BB],
-            10: [Position.UTG, Position.UTG1, Position.UTG2, Position.UTG3, Position.LJ, Position.HJ, Position.CO,
-                 Position.BTN,
-                 Position.SB, Position.BB]
-        }
+        """Returns the dict {number of players: positions in preflop order}, shared by every caller"""
+        return POSITIONS_MAPPER
 
     @classmethod
     def get_maps(cls):
@@ -85,8 +71,24 @@ class Position(ReprMixin, PokerEnum):
             for nb_ref_positions_occupied in range(2, min(nb_total_positions + 1, 4)):
                 nb_left_positions_to_pick = nb_total_positions - nb_ref_positions_occupied
                 for ref_positions_picked in (combinations(ref_positions, nb_ref_positions_occupied)):
-                    left_positions = available_positions[:nb_left_positions_to_pick]
+                    left_positions = list(available_positions[:nb_left_positions_to_pick])
                     final_positions_picked = left_positions + list(ref_positions_picked)
                     positions_lookups.append(final_positions_picked)
-        positions_lookups.append(mapper[10])
+        positions_lookups.append(list(mapper[10]))
         return positions_lookups
+
+
+POSITIONS_MAPPER = {
+    1: (Position.BB,),
+    2: (Position.SB, Position.BB),
+    3: (Position.BTN, Position.SB, Position.BB),
+    4: (Position.CO, Position.BTN, Position.SB, Position.BB),
+    5: (Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB),
+    6: (Position.UTG, Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB),
+    7: (Position.UTG, Position.LJ, Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB),
+    8: (Position.UTG, Position.UTG1, Position.LJ, Position.HJ, Position.CO, Position.BTN, Position.SB, Position.BB),
+    9: (Position.UTG, Position.UTG1, Position.UTG2, Position.LJ, Position.HJ, Position.CO, Position.BTN, Position.SB,
+        Position.BB),
+    10: (Position.UTG, Position.UTG1, Position.UTG2, Position.UTG3, Position.LJ, Position.HJ, Position.CO, Position.BTN,
+         Position.SB, Position.BB)
+}
@@ -3,20 +3,69 @@ import pandas as pd
 from attrs import define, Factory
 from pkrcomponents.components.utils.converters import pascal_to_snake_case
 
+_RESET_VALUES = {}
+
+
+def get_reset_value(attribute) -> tuple:
+    """
+    Returns the default value of an attribute, already converted, or its factory
+
+    Args:
+        attribute (Attribute): The attrs attribute of a statistic
+
+    Returns:
+        tuple: The name of the attribute, its default value and its factory (None when there is no factory)
+    """
+    # noinspection PyTypeChecker
+    if isinstance(attribute.default, Factory):
+        # noinspection PyUnresolvedReferences
+        return attribute.name, None, attribute.default.factory
+    if attribute.converter is not None:
+        return attribute.name, attribute.converter(attribute.default), None
+    return attribute.name, attribute.default, None
+
+
 @define
 class StreetHandStatsBase:
 
+    @classmethod
+    def get_reset_values(cls) -> tuple:
+        """
+        Returns the name, default value and factory of every statistic, computed once per class
+        """
+        try:
+            return _RESET_VALUES[cls]
+        except KeyError:
+            return _RESET_VALUES.setdefault(cls, tuple(get_reset_value(attribute) for attribute in cls.__attrs_attrs__))
+
+    @classmethod
+    def make_default(cls):
+        """
+        Creates statistics with default values, without running the attrs initializer and its validators.
+        The post-init hook still runs, so the statistics are equal to the ones built by the initializer.
+        This is the fast path used for every player of every converted hand.
+        """
+        stats = cls.make_reset()
+        if hasattr(cls, "__attrs_post_init__"):
+            stats.__attrs_post_init__()
+        return stats
+
+    @classmethod
+    def make_reset(cls):
+        """
+        Creates statistics in the state left by reset(), without running the attrs initializer nor the post-init hook
+        """
+        stats = object.__new__(cls)
+        stats.reset()
+        return stats
+
     def reset(self):
         """
-        Resets the statistics
+        Resets the statistics in bulk. Default values are known to be valid, so validators are not run and the
+        converted default values are shared by every instance.
         """
-        for attribute in self.__attrs_attrs__:
-            # noinspection PyTypeChecker
-            if isinstance(attribute.default, Factory):
-                # noinspection PyUnresolvedReferences
-                setattr(self, attribute.name, attribute.default.factory())
-            else:
-                setattr(self, attribute.name, attribute.default)
+        for name, value, factory in self.get_reset_values():
+            object.__setattr__(self, name, value if factory is None else factory())
 
     def to_dataframe(self):
         """
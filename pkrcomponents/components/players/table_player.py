@@ -1,4 +1,4 @@
-from attrs import define, field, Factory
+from attrs import define, field, Factory, setters
 from attrs.validators import instance_of, ge, le, optional, max_len, min_len
 
 from pkrcomponents.components.actions.actions_history import ActionsHistory
@@ -11,6 +11,27 @@ from pkrcomponents.components.utils.converters import convert_to_position
 from pkrcomponents.components.utils.exceptions import ShowdownNotReachedError, FullTableError, SeatTakenError
 
 
+def count_state_change(player, attribute, value):
+    """
+    Keeps the player counters of the table in line with a change of the player state
+
+    Args:
+        player (TablePlayer): The player being modified
+        attribute (Attribute): The attribute being set
+        value (bool, float): The new value of the attribute
+
+    Returns:
+        (bool, float): The unchanged value
+    """
+    table = getattr(player, "table", None)
+    if table is not None and table.players.seat_dict.get(player.seat) is player:
+        player.count_state(-1)
+        state = {"folded": player.folded, "stack": player.stack, "played": player.played,
+                 "current_bet": player.current_bet, attribute.name: value}
+        table.count_player_state(state["folded"], state["stack"] == 0, state["played"], state["current_bet"])
+    return value
+
+
 @define(repr=False)
 class TablePlayer:
     """
@@ -101,18 +122,20 @@ class TablePlayer:
         default=Factory(lambda self: self.init_stack, takes_self=True),
         validator=[ge(0), instance_of(float)],
         converter=float,
+        on_setattr=[setters.convert, setters.validate, count_state_change],
         metadata={'description': 'The current stack of the player'})
     combo = field(default=None, validator=optional(instance_of(Combo)), converter=Combo)
-    folded = field(default=False, validator=instance_of(bool))
+    folded = field(default=False, validator=instance_of(bool), on_setattr=[setters.validate, count_state_change])
     position = field(default=None, validator=optional(instance_of(Position)), converter=convert_to_position)
     table = field(default=None, validator=optional(instance_of(Table)))
     bounty = field(default=0, validator=[ge(0), instance_of(float)], converter=float)
-    played = field(default=False, validator=instance_of(bool))
+    played = field(default=False, validator=instance_of(bool), on_setattr=[setters.validate, count_state_change])
     is_hero = field(default=False, validator=instance_of(bool))
-    current_bet = field(default=0, validator=[ge(0), instance_of(float)], converter=float)
+    current_bet = field(default=0, validator=[ge(0), instance_of(float)], converter=float,
+                        on_setattr=[setters.convert, setters.validate, count_state_change])
     hand_reward = field(default=0, validator=optional([ge(0), instance_of((int, float))]))
     actions_history = field(default=Factory(lambda: ActionsHistory()), validator=instance_of(ActionsHistory))
-    hand_stats = field(default=Factory(PlayerHandStats), validator=instance_of(PlayerHandStats))
+    hand_stats = field(default=Factory(PlayerHandStats.make_default), validator=instance_of(PlayerHandStats))
     has_initiative = field(default=False, validator=instance_of(bool))
     flag_street_first_to_talk = field(default=False, validator=instance_of(bool))
     flag_street_went_all_in = field(default=False, validator=instance_of(bool))
@@ -260,9 +283,8 @@ class TablePlayer:
     @property
     def hand_score(self) -> int:
         """Returns player's current hand score on the table"""
-        cards = (self.combo.first, self.combo.second)
-        board = tuple(card for card in self.table.board.cards[:self.table.board.len])
-        score = self.table.evaluator.evaluate(cards=cards, board=board)
+        cards = (self.combo.first.index, self.combo.second.index)
+        score = self.table.evaluator.evaluate_indexes(cards=cards, board=self.table.board.indexes)
         return score
 
     @property
@@ -289,14 +311,25 @@ class TablePlayer:
         else:
             self.table = table
             table.players.add_player(self)
+            self.count_state()
             self.reset_street_status()
 
     def sit_out(self):
         """Removes player from the table"""
         self.reset_street_status()
+        self.count_state(-1)
         self.table.players.remove_player(self)
         delattr(self, "table")
 
+    def count_state(self, sign: int = 1):
+        """
+        Adds the player state to the counters of the table, or removes it when sign is -1
+
+        Args:
+            sign (int): 1 to add the state, -1 to remove it
+        """
+        self.table.count_player_state(self.folded, self.is_all_in, self.played, self.current_bet, sign)
+
     def replace(self, table: Table):
         """Replace a player on the table"""
         player_to_replace = table.players.seat_dict.get(self.seat)
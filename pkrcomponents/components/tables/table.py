@@ -1,21 +1,26 @@
+from collections import Counter
+
 import pandas as pd
 
-from attrs import define, field, Factory
+from attrs import define, field, fields, Factory
 from attrs.validators import instance_of, optional, ge, le
 from datetime import datetime
 from pkrcomponents.components.cards.board import Board
 from pkrcomponents.components.cards.card import Card
 from pkrcomponents.components.cards.combo import Combo
 from pkrcomponents.components.cards.deck import Deck
+from pkrcomponents.components.cards.equity import all_in_equities
 from pkrcomponents.components.cards.flop import Flop
 from pkrcomponents.components.actions.street import Street
 from pkrcomponents.components.players.players import Players
 from pkrcomponents.components.tables.pot import Pot
 from pkrcomponents.components.tournaments.tournament import Level, Tournament
-from pkrcomponents.components.cards.evaluator import Evaluator
+from pkrcomponents.components.cards.evaluator import Evaluator, SevenCardEvaluator
 from pkrcomponents.components.utils.converters import convert_to_street
 from pkrcomponents.components.utils.exceptions import CannotParseWinnersError
 
+ALL_IN_BOARD_SIZES = {Street.PREFLOP: 0, Street.FLOP: 3, Street.TURN: 4}
+
 
 @define(repr=False)
 class Table:
@@ -46,6 +51,10 @@ class Table:
         street(Street): The current street of the table
         tournament(Tournament): The tournament associated with the table
 
+    The number of folded players, the number of players folded or all-in and the current bets of players who played
+    and can still act are maintained by the players themselves when they sit, leave, fold, pay or act, so that the
+    counts of players involved, in game and able to play are available without scanning the players.
+
     Methods:
 
 
@@ -66,7 +75,7 @@ class Table:
     cnt_cold_calls = field(default=0, validator=[instance_of(int), ge(0)])
     cnt_limps = field(default=0, validator=[instance_of(int), ge(0)])
     deck = field(default=Factory(Deck), validator=instance_of(Deck))
-    evaluator = field(default=Factory(Evaluator), validator=instance_of(Evaluator))
+    evaluator = field(default=Factory(SevenCardEvaluator), validator=instance_of(Evaluator))
     hand_has_started = field(default=False, validator=instance_of(bool))
     hand_id = field(default=None, validator=optional(instance_of(str)))
     hero_combo = field(default=None, validator=optional(instance_of(Combo)))
@@ -84,9 +93,11 @@ class Table:
     tournament = field(default=None, validator=optional(instance_of(Tournament)))
     total_buy_in = field(default=0, validator=[instance_of(float), ge(0)], converter=float)
     rewards_table = field(default=[], validator=instance_of(list))
+    _nb_folded = field(default=0, init=False, eq=False, repr=False)
+    _nb_out = field(default=0, init=False, eq=False, repr=False)
+    _played_bets = field(default=Factory(Counter), init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self):
-        self.deck.shuffle()
         self.postings = list()
         self.rewards_table = list()
 
@@ -177,12 +188,13 @@ class Table:
     @property
     def nb_able_to_play(self) -> int:
         """Returns the number of players that are able to play"""
-        return len(self.players_able_to_play)
+        return self.nb_in_game - self._played_bets.get(self.pot.highest_bet, 0)
 
     @property
     def nb_waiting(self) -> int:
         """Returns the number of players that are waiting to play in this street"""
-        return len(self.players_waiting)
+        # A player able to play is never ready for the next street, so both counts are always the same
+        return self.nb_able_to_play
 
     @property
     def has_players_able_to_play(self):
@@ -197,12 +209,39 @@ class Table:
     @property
     def nb_in_game(self) -> int:
         """Returns the number of players still in the game"""
-        return len(self.players_in_game)
+        return len(self.players.seat_dict) - self._nb_out
 
     @property
     def nb_involved(self) -> int:
         """Returns the number of players who didn't fold yet"""
-        return len(self.players_involved)
+        return len(self.players.seat_dict) - self._nb_folded
+
+    def count_player_state(self, folded: bool, is_all_in: bool, played: bool, current_bet: float, sign: int = 1):
+        """
+        Adds a player state to the counters of the table, or removes it when sign is -1
+
+        Args:
+            folded (bool): Whether the player has folded
+            is_all_in (bool): Whether the player is all-in
+            played (bool): Whether the player has played in this street
+            current_bet (float): The current bet of the player
+            sign (int): 1 to add the state, -1 to remove it
+        """
+        self._nb_folded += sign * folded
+        if folded or is_all_in:
+            self._nb_out += sign
+        elif played:
+            nb_played_bets = self._played_bets[current_bet] + sign
+            if nb_played_bets:
+                self._played_bets[current_bet] = nb_played_bets
+            else:
+                del self._played_bets[current_bet]
+
+    def reset_player_counts(self):
+        """Resets the player counters of the table, when every player leaves it"""
+        self._nb_folded = 0
+        self._nb_out = 0
+        self._played_bets.clear()
 
     @property
     def one_player_left(self) -> bool:
@@ -479,9 +518,10 @@ class Table:
     @property
     def next_player(self):
         """ Returns the next player after the current player"""
-        current_player_index = self.players_order.index(self.current_player)
-        next_index = current_player_index + 1 if current_player_index < len(self.players_order) - 1 else 0
-        return self.players_order[next_index]
+        players_order = self.players_order
+        current_player_index = players_order.index(self.current_player)
+        next_index = current_player_index + 1 if current_player_index < len(players_order) - 1 else 0
+        return players_order[next_index]
 
     @property
     def next_seat(self) -> int:
@@ -608,6 +648,49 @@ class Table:
         for player in self.players:
             player.hand_stats.general.chips_difference = player.stack - player.init_stack
 
+    @property
+    def all_in_board_size(self) -> int | None:
+        """
+        Returns the number of board cards dealt when the last player went all-in, if the hand was an all-in
+        shown down before the river, with at most one player not all-in and every combo known. Returns None otherwise.
+        """
+        players = self.players_involved
+        if len(players) < 2 or not all(player.has_combo for player in players):
+            return None
+        all_in_players = [player for player in players if player.is_all_in]
+        if len(players) - len(all_in_players) > 1:
+            return None
+        all_in_street = max((player.hand_stats.general.all_in_street or Street.PREFLOP for player in all_in_players),
+                            default=None)
+        return ALL_IN_BOARD_SIZES.get(all_in_street)
+
+    def calculate_expected_rewards(self):
+        """
+        Calculate the amount each player was expected to win (all-in EV) and store it in their hand stats.
+        Each side pot is shared between the players contesting it according to their equities when going all-in.
+        Must be called before rewards are distributed, while the investments of the players are known.
+        """
+        board_size = self.all_in_board_size
+        if board_size is None:
+            return
+        board = self.board.card_slots[:board_size]
+        involved_players = self.players_involved
+        expected_rewards = {player.name: 0.0 for player in involved_players}
+        previous_level = 0.0
+        for level in sorted({player.invested for player in involved_players}):
+            side_pot = sum(min(player.invested, level) - min(player.invested, previous_level)
+                           for player in self.players)
+            contesting_players = [player for player in involved_players if player.invested >= level]
+            if len(contesting_players) == 1:
+                equities = (1.0,)
+            else:
+                equities = all_in_equities([player.combo for player in contesting_players], board)
+            for player, equity in zip(contesting_players, equities):
+                expected_rewards[player.name] += side_pot * equity
+            previous_level = level
+        for player in involved_players:
+            player.hand_stats.general.amount_expected_won = round(expected_rewards[player.name], 2)
+
     def hand_reset(self):
         """Reset the table for a new hand"""
         self.street = Street.PREFLOP
@@ -619,6 +702,23 @@ class Table:
         self.hand_has_started = False
         self.rewards_table = []
 
+    def reset_for_conversion(self):
+        """
+        Resets the table in place, in the same state as a newly built table, before converting a new hand.
+        Players, pot, board, counters and postings are cleared without rebuilding the deck, the evaluator or
+        the other components, and without running validators on values that are known to be valid.
+        """
+        for attribute_name, value in CONVERSION_RESET_VALUES:
+            object.__setattr__(self, attribute_name, value)
+        self.postings.clear()
+        self.rewards_table.clear()
+        object.__setattr__(self, "level", Level())
+        self.board.reset()
+        self.deck.reset()
+        self.pot.reset()
+        self.players.reset()
+        self.reset_player_counts()
+
     def advance_to_next_hand(self):
         """Advance to the next hand"""
         self.hand_reset()
@@ -636,3 +736,12 @@ class Table:
         values = [self.hand_id, self.hand_date, self.max_players, self.cnt_players, self.players.button_seat]
         df = pd.DataFrame([values], columns=columns)
         return df
+
+
+# The fields holding a plain default are set back to it, converted like the initializer does.
+# The components built by a factory and the lists are reset in place by reset_for_conversion.
+CONVERSION_RESET_VALUES = tuple(
+    (attribute.name, attribute.converter(attribute.default) if attribute.converter else attribute.default)
+    for attribute in fields(Table)
+    if not isinstance(attribute.default, (Factory, list))
+)
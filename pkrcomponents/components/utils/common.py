@@ -20,10 +20,15 @@ class _PokerEnumMeta(enum.EnumMeta):
                 if isinstance(alias, str):
                     alias = alias.upper()
                 self._value2member_map_.setdefault(alias, member)
+        # cache the position of each member, used for ordering and as an integer encoding
+        for ordinal, name in enumerate(self._member_names_):
+            self.__members__[name].ordinal = ordinal
 
     def __call__(cls, value):
         """Return the appropriate instance with any of the values listed. If values contains
         text types, those will be looked up in an insensitive case manner."""
+        if value.__class__ is cls:
+            return value
         if isinstance(value, str):
             value = value.upper()
         return super().__call__(value)
@@ -55,8 +60,7 @@ class _OrderableMixin:
 
     def __lt__(self, other):
         if self.__class__ is other.__class__:
-            names = self.__class__._member_names_
-            return names.index(self._name_) < names.index(other._name_)
+            return self.ordinal < other.ordinal
         else:
             raise ValueError("Both elements must have the same type to be compared")
 
@@ -64,6 +68,8 @@ class _OrderableMixin:
 class PokerEnum(_OrderableMixin, enum.Enum, metaclass=_PokerEnumMeta):
     """
     Class describing enumerable categories that can be stored in db
+
+    Each member has an ordinal attribute, its position in the enumeration, which gives its ordering.
     """
     def __str__(self):
         return str(self._value_[0])
@@ -5,13 +5,17 @@ from pkrcomponents.components.cards.suit import Suit
 
 
 class CardMeta(type):
-    def __new__(mcs, clsname, bases, classdict):
-        """Cache all possible Card instances on the class itself."""
-        cls = super(CardMeta, mcs).__new__(mcs, clsname, bases, classdict)
-        cls.all_cards = list(
-            cls(f"{rank}{suit}") for rank, suit in product(Rank, Suit)
-        )
-        return cls
+    """Makes Card class iterable. All possible Card instances are built on first use and cached on the class."""
+    _all_cards = None
+
+    @property
+    def all_cards(cls) -> list:
+        """All possible Card instances, built on first access"""
+        if cls._all_cards is None:
+            cls._all_cards = list(
+                cls(f"{rank}{suit}") for rank, suit in product(Rank, Suit)
+            )
+        return cls._all_cards
 
     def __iter__(cls):
         return iter(cls.all_cards)
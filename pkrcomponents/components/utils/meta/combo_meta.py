@@ -3,16 +3,18 @@ from pkrcomponents.components.cards.card import Card
 
 
 class ComboMeta(type):
+    """Makes Combo class iterable. All possible Combo instances are built on first use and cached on the class."""
+    _all_combos = None
 
-    def __new__(mcs, clsname, bases, classdict):
-        """Cache all possible Combo instances on the class itself."""
-        cls = super(ComboMeta, mcs).__new__(mcs, clsname, bases, classdict)
-        cls.all_combos = list(
-            cls(f"{first}{second}")
-            for first, second in combinations(Card.all_cards,2)
-
-        )
-        return cls
+    @property
+    def all_combos(cls) -> list:
+        """All possible Combo instances, built on first access"""
+        if cls._all_combos is None:
+            cls._all_combos = list(
+                cls(f"{first}{second}")
+                for first, second in combinations(Card.all_cards, 2)
+            )
+        return cls._all_combos
 
     def __iter__(cls):
         return iter(cls.all_combos)
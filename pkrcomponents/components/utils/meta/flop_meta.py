@@ -3,18 +3,22 @@ from pkrcomponents.components.cards.card import Card
 
 
 class FlopMeta(type):
-    def __new__(mcs, clsname, bases, classdict):
-        """Cache all possible Flop instances on the class itself."""
-        cls = super(FlopMeta, mcs).__new__(mcs, clsname, bases, classdict)
-        cls.all_flops = list(
-            cls(
-                first_card=first_card,
-                second_card=second_card,
-                third_card=third_card
+    """Makes Flop class iterable. All possible Flop instances are built on first use and cached on the class."""
+    _all_flops = None
+
+    @property
+    def all_flops(cls) -> list:
+        """All possible Flop instances, built on first access"""
+        if cls._all_flops is None:
+            cls._all_flops = list(
+                cls(
+                    first_card=first_card,
+                    second_card=second_card,
+                    third_card=third_card
+                )
+                for first_card, second_card, third_card in combinations(Card.all_cards, 3)
             )
-            for first_card, second_card, third_card in combinations(Card.all_cards, 3)
-        )
-        return cls
+        return cls._all_flops
 
     def __iter__(cls):
         return iter(cls.all_flops)
@@ -3,12 +3,14 @@ from pkrcomponents.components.cards.rank import Rank
 
 class HandMeta(type):
     """Makes Hand class iterable. __iter__ goes through all hands in ascending order."""
-
-    def __new__(mcs, clsname, bases, classdict):
-        """Cache all possible Hand instances on the class itself."""
-        cls = super(HandMeta, mcs).__new__(mcs, clsname, bases, classdict)
-        cls.all_hands = tuple(cls.get_non_paired_hands()) + tuple(cls.get_paired_hands())
-        return cls
+    _all_hands = None
+
+    @property
+    def all_hands(cls) -> tuple:
+        """All possible Hand instances, built on first access and cached on the class"""
+        if cls._all_hands is None:
+            cls._all_hands = tuple(cls.get_non_paired_hands()) + tuple(cls.get_paired_hands())
+        return cls._all_hands
 
     def get_non_paired_hands(cls):
         """Generator of all non-paired hands"""
@@ -1,8 +1,8 @@
-import json
 
+import os
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
 from tqdm import tqdm
 
 from pkrcomponents.components.actions.action import BetAction, CallAction, CheckAction, FoldAction, RaiseAction
@@ -18,13 +18,55 @@ from pkrcomponents.components.tournaments.tournament import Tournament
 from pkrcomponents.components.utils.exceptions import NotSufficientBetError, NotSufficientRaiseError, \
     ShowdownNotReachedError, CannotParseWinnersError, SeatTakenError, PlayerAlreadyFoldedError, \
     PlayerNotOnTableError
+from pkrcomponents.converters.utils.bundles import make_line_key, split_line_key
 from pkrcomponents.converters.utils.exceptions import HandConversionError
+from pkrcomponents.converters.utils.json_decoders import get_json_decoder
+from pkrcomponents.converters.utils.parsed_history import ParsedAction, ParsedHistory, ParsedPlayer
+from pkrcomponents.converters.utils.records import HandConversionFailure, HandRecord
+from pkrcomponents.converters.utils.stats_export import HandStatsWriter
+
+_worker_converter = None
+
+
+def _init_conversion_worker(converter_class: type, init_kwargs: dict):
+    """
+    Builds the converter of a worker process, once, along with its table
+
+    Args:
+        converter_class (type): The class of the converter to build
+        init_kwargs (dict): The keyword arguments used to build the converter
+    """
+    global _worker_converter
+    _worker_converter = converter_class(**init_kwargs)
+
+
+def _convert_histories_chunk(parsed_keys: list) -> list:
+    """
+    Converts a chunk of parsed histories with the converter of the worker process
+
+    Args:
+        parsed_keys (list): The keys of the parsed histories to convert
+
+    Returns:
+        records (list): A HandRecord or a HandConversionFailure for each key
+    """
+    return [_worker_converter.convert_history_to_record(parsed_key) for parsed_key in parsed_keys]
+
+
+def _chunked(keys: list, chunk_size: int):
+    """Generator of successive chunks of chunk_size keys"""
+    iterator = iter(keys)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
 
 
 class AbstractHandHistoryConverter(ABC):
 
     data: dict
+    parsed_history: ParsedHistory
     table: Table
+    json_backend: str = None
+    typed_decoding: bool = False
 
     @abstractmethod
     def list_parsed_histories_keys(self) -> list:
@@ -35,6 +77,14 @@ class AbstractHandHistoryConverter(ABC):
         """
         pass
 
+    def iter_parsed_histories_keys(self):
+        """
+        Lists the keys of the parsed histories lazily
+        Yields:
+            key (str): The key of a parsed history
+        """
+        yield from self.list_parsed_histories_keys()
+
     @abstractmethod
     def read_data_text(self, parsed_key: str) -> str:
         """
@@ -46,20 +96,54 @@ class AbstractHandHistoryConverter(ABC):
         """
         pass
 
-    def get_parsed_data(self, parsed_key: str):
+    def read_data_bytes(self, parsed_key: str) -> bytes:
         """
-        Gets the data of a parsed history and stores it in the data attribute
+        Reads the raw data of a parsed history, without decoding it into str.
+        Converters that can read bytes directly override it, the text is encoded by default.
         Args:
             parsed_key (str): The key of the parsed history
+        Returns:
+            data_bytes (bytes): The data of the parsed history
         """
-        data_text = self.read_data_text(parsed_key)
-        self.data = json.loads(data_text)
+        return self.read_data_text(parsed_key).encode("utf-8")
+
+    @abstractmethod
+    def get_init_kwargs(self) -> dict:
+        """
+        Returns the keyword arguments needed to build an equivalent converter in a worker process
+        Returns:
+            init_kwargs (dict): The keyword arguments of the converter constructor
+        """
+        pass
+
+    def get_parsed_data(self, parsed_key: str):
+        """
+        Gets the data of a parsed history and stores it in the data attribute.
+        The data is validated once against the parsed history schema, the typed record is stored in parsed_history.
+        With typed_decoding, the history is decoded straight into its record and the data attribute is left empty.
+        Args:
+            parsed_key (str): The key of the parsed history
+        Raises:
+            ParsedHistoryError: If the data does not match the parsed history schema
+        """
+        data_bytes = self.read_data_bytes(parsed_key)
+        decoder = get_json_decoder(self.json_backend)
+        if self.typed_decoding:
+            self.data = None
+            self.parsed_history = decoder.decode_history(data_bytes)
+        else:
+            self.data = decoder.decode(data_bytes)
+            self.parsed_history = ParsedHistory.from_dict(self.data)
 
     @staticmethod
     def get_split_key(file_key: str) -> str:
         """
-        Returns the key of the split history file from the parsed history file key
+        Returns the key of the split history file from the parsed history file key.
+        The split history of a line of a bundle is the same line of the bundle with the same name in the split directory
         """
+        path, line_number = split_line_key(file_key)
+        if line_number is not None:
+            return make_line_key(path.replace("parsed", "split"), line_number)
         split_key = file_key.replace("parsed", "split").replace(".json", ".txt")
         return split_key
 
@@ -80,7 +164,7 @@ class AbstractHandHistoryConverter(ABC):
 
     def get_max_players(self):
         """Get the max players from the data and set it to the table object"""
-        max_players = self.data.get("max_players")
+        max_players = self.parsed_history.max_players
         self.table.set_max_players(max_players)
 
     def get_buy_in(self):
@@ -90,15 +174,15 @@ class AbstractHandHistoryConverter(ABC):
         Returns:
             buy_in (float): The total_buy_in amount
         """
-        buy_in = self.data.get("buy_in")
+        buy_in = self.parsed_history.buy_in
         self.table.set_total_buy_in(buy_in)
 
     def get_level(self):
         """
         Get the level  and blinds from the data and set it to set the tournament object
         """
-        level_data = self.data.get("level")
-        level = Level(value=level_data.get("value"), bb=level_data.get("bb"), ante=level_data.get("ante"))
+        parsed_history = self.parsed_history
+        level = Level(value=parsed_history.level_value, bb=parsed_history.bb, ante=parsed_history.ante)
         self.table.set_level(level)
 
     def get_tournament_name(self) -> str:
@@ -108,7 +192,7 @@ class AbstractHandHistoryConverter(ABC):
         Returns:
             tournament_name (str): Tournament name
         """
-        tournament_name = self.data.get("tournament_info").get("tournament_name")
+        tournament_name = self.parsed_history.tournament_name
         return tournament_name
 
     def get_tournament_id(self):
@@ -118,7 +202,7 @@ class AbstractHandHistoryConverter(ABC):
         Returns:
             tournament_id (str): Tournament id
         """
-        tournament_id = self.data.get("tournament_info").get("tournament_id")
+        tournament_id = self.parsed_history.tournament_id
         return tournament_id
 
     def get_table_number(self) -> str:
@@ -128,7 +212,7 @@ class AbstractHandHistoryConverter(ABC):
         Returns:
             table_number (str): Table number
         """
-        table_number = self.data.get("tournament_info").get("table_number")
+        table_number = self.parsed_history.table_number
         return table_number
 
     def get_pregame_info(self):
@@ -148,16 +232,13 @@ class AbstractHandHistoryConverter(ABC):
         """
         Get the hand id from the data and set it to the table object
         """
-        self.table.hand_id = self.data.get("hand_id")
+        self.table.hand_id = self.parsed_history.hand_id
 
     def get_datetime(self):
         """
         Get the datetime from the data and set it to the table object
         """
-        hand_date_str = self.data.get("datetime")
-        date_format = "%d-%m-%Y %H:%M:%S"
-        hand_datetime = datetime.strptime(hand_date_str, date_format)
-        self.table.hand_date = hand_datetime
+        self.table.hand_date = self.parsed_history.hand_date
 
     def get_game_type(self) -> str:
         """
@@ -166,7 +247,7 @@ class AbstractHandHistoryConverter(ABC):
         Returns:
             game_type (str): Game type
         """
-        game_type = self.data.get("game_type")
+        game_type = self.parsed_history.game_type
         return game_type
 
     def get_button_seat(self):
@@ -176,61 +257,62 @@ class AbstractHandHistoryConverter(ABC):
         Returns:
             button_seat (int): Button seat
         """
-        button_seat = self.data.get("button_seat")
+        button_seat = self.parsed_history.button_seat
         return button_seat
 
     def get_players(self):
         """Get the players from the data and set them to the set table object"""
-        players_dict = self.data.get("players")
-        for seat, player_dict in players_dict.items():
-            self.get_player(player_dict)
+        for parsed_player in self.parsed_history.players:
+            self.get_player(parsed_player)
         button_seat = self.get_button_seat()
         bb_seat = self.table.players.get_bb_seat_from_button(button_seat)
         self.table.set_bb_seat(bb_seat)
         self.table.players.distribute_positions()
         # self.table.players.delete_inactive_players()
 
-    def get_player(self, player_dict: dict):
+    def get_player(self, parsed_player: ParsedPlayer | dict):
         """
         Get a player from the data and set it to the set table object
 
         Args:
-            player_dict (dict): Player data
-
-        """
-        seat = player_dict.get("seat")
-        name = player_dict.get("name")
-        init_stack = player_dict.get("init_stack")
-        bounty = player_dict.get("bounty")
-        entered_hand = player_dict.get("entered_hand")
-        player = TablePlayer(name=name, seat=seat, init_stack=init_stack, bounty=bounty, entered_hand=entered_hand)
+            parsed_player (ParsedPlayer | dict): Player record, or raw player data that is validated first
+
+        """
+        if isinstance(parsed_player, dict):
+            parsed_player = ParsedPlayer.from_dict(parsed_player)
+        player = TablePlayer(
+            name=parsed_player.name,
+            seat=parsed_player.seat,
+            init_stack=parsed_player.init_stack,
+            bounty=parsed_player.bounty,
+            entered_hand=parsed_player.entered_hand
+        )
         try:
-            if entered_hand:
+            if parsed_player.entered_hand:
                 player.sit(self.table)
         except SeatTakenError:
             player.replace(self.table)
 
     def get_hero(self):
         """Get the hero from the data and set it to the table object"""
-        name = self.data.get("hero_hand").get("hero")
-        first_card = self.data.get("hero_hand").get("first_card")
-        second_card = self.data.get("hero_hand").get("second_card")
+        parsed_history = self.parsed_history
+        first_card = parsed_history.hero_first_card
+        second_card = parsed_history.hero_second_card
         if first_card and second_card:
-            self.table.distribute_hero_cards(name, first_card, second_card)
+            self.table.distribute_hero_cards(parsed_history.hero, first_card, second_card)
 
     def get_postings(self):
         """
         Get the postings from the data and set them to the table object
         """
-        postings_list = self.data.get("postings")
+        postings_list = self.parsed_history.postings
 
         self.adapt_positions(postings_list)
         self.table.set_starting_status()
-        for posting in postings_list:
-            player = self.table.players[posting.get("name")]
-            amount = posting.get("amount")
-            blind_type = BlindType(posting.get("blind_type"))
-            match blind_type:
+        for parsed_posting in postings_list:
+            player = self.table.players[parsed_posting.name]
+            amount = parsed_posting.amount
+            match parsed_posting.blind_type:
                 case BlindType.ANTE:
                     posting = AntePosting(player_name=player.name, value=amount)
                 case BlindType.SMALL_BLIND:
@@ -239,14 +321,13 @@ class AbstractHandHistoryConverter(ABC):
                     posting = BBPosting(player_name=player.name, value=amount)
             posting.execute(player)
 
-    def adapt_positions(self, postings_list: list):
+    def adapt_positions(self, postings_list: tuple):
         """
         Adapt the positions of the players according to the postings
         """
-        for posting in postings_list:
-            player = self.table.players[posting.get("name")]
-            if posting.get("blind_type") == "big blind":
-                self.table.players.bb_seat = player.seat
+        for parsed_posting in postings_list:
+            if parsed_posting.blind_type is BlindType.BIG_BLIND:
+                self.table.players.bb_seat = self.table.players[parsed_posting.name].seat
         # self.table.players.delete_inactive_players()
         self.table.players.distribute_positions()
 
@@ -254,8 +335,7 @@ class AbstractHandHistoryConverter(ABC):
         """
         Get the actions from the data and set them to the table object
         """
-        actions_dict = self.data.get("actions")
-        for street, actions in actions_dict.items():
+        for street in self.parsed_history.actions:
             if not self.table.hand_ended:
                 self.get_street_actions(street)
 
@@ -266,25 +346,25 @@ class AbstractHandHistoryConverter(ABC):
         Args:
             street (Street): Street to get the actions from
         """
-        actions = self.data.get("actions").get(street)
-        for action_dict in actions:
-            self.get_action(action_dict)
+        for parsed_action in self.parsed_history.actions[street]:
+            self.get_action(parsed_action)
         if self.table.next_street_ready:
             self.advance_street()
 
-    def get_action(self, action_dict: dict):
+    def get_action(self, parsed_action: ParsedAction | dict):
         """
         Get an action from the data and set it to the table object
 
         Args:
-            action_dict (dict): Action data
+            parsed_action (ParsedAction | dict): Action record, or raw action data that is validated first
         """
-        player = self.table.players[action_dict.get("player")]
-        is_all_in = action_dict.get("is_all_in")
+        if isinstance(parsed_action, dict):
+            parsed_action = ParsedAction.from_dict(parsed_action)
+        player = self.table.players[parsed_action.player]
+        is_all_in = parsed_action.is_all_in
         if player.folded:
             raise PlayerAlreadyFoldedError
-        move = ActionMove(action_dict.get("action"))
-        match move:
+        match parsed_action.move:
             case ActionMove.FOLD:
                 action = FoldAction(player)
             case ActionMove.CHECK:
@@ -292,10 +372,10 @@ class AbstractHandHistoryConverter(ABC):
             case ActionMove.CALL:
                 action = CallAction(player, is_all_in=is_all_in)
             case ActionMove.BET:
-                amount = action_dict.get("amount")
+                amount = parsed_action.amount
                 action = BetAction(player, amount, is_all_in=is_all_in)
             case ActionMove.RAISE:
-                amount = action_dict.get("amount")
+                amount = parsed_action.amount
                 action = RaiseAction(player, amount, is_all_in=is_all_in)
             case other:
                 raise ValueError(f"Invalid action: {other}")
@@ -305,45 +385,35 @@ class AbstractHandHistoryConverter(ABC):
         """
         Get the flop cards from the data and set them to the table object
         """
-        flop = self.data.get("flop")
-        flop_card_1 = flop.get("flop_card_1")
-        flop_card_2 = flop.get("flop_card_2")
-        flop_card_3 = flop.get("flop_card_3")
-        self.table.execute_flop(flop_card_1, flop_card_2, flop_card_3)
+        self.table.execute_flop(*self.parsed_history.flop_cards)
 
     def get_turn(self):
         """
         Get the turn card from the data and set it to the table object
         """
-        turn = self.data.get("turn")
-        turn_card = turn.get("turn_card")
-        self.table.execute_turn(turn_card)
+        self.table.execute_turn(self.parsed_history.turn_card)
 
     def get_river(self):
         """
         Get the river card from the data and set it to the table object
         """
-        river = self.data.get("river")
-        river_card = river.get("river_card")
-        self.table.execute_river(river_card)
+        self.table.execute_river(self.parsed_history.river_card)
 
     def get_showdown(self):
         """
         Get the showdown data from the data and set it to the table object
 
         """
-        showdown_dict = self.data.get("showdown")
-        for player_name, hand_dict in showdown_dict.items():
-            player = self.table.players[player_name]
-            first_card = hand_dict.get("first_card")
-            second_card = hand_dict.get("second_card")
-            combo = Combo.from_cards(first_card, second_card)
+        for parsed_showdown in self.parsed_history.showdown:
+            player = self.table.players[parsed_showdown.name]
+            combo = Combo.from_cards(parsed_showdown.first_card, parsed_showdown.second_card)
             player.shows(combo)
 
     def get_winners(self):
         """
-        Get the winners data from the data and set it to the table object
+        Get the winners data from the data and set it to the table object, along with the all-in EV of the players
         """
+        self.table.calculate_expected_rewards()
         self.table.calculate_and_distribute_rewards()
 
     def advance_street(self):
@@ -369,15 +439,14 @@ class AbstractHandHistoryConverter(ABC):
 
     def reset_table(self):
         """
-        Reset the table object
+        Reset the table object in place, so that one table is reused for every converted hand
         """
-        del self.table
-        table = Table()
-        self.table = table
+        self.table.reset_for_conversion()
 
     def convert_history(self, file_key: str, verbose=0) -> Table:
         """
-        Convert a hand history file into a table object
+        Convert a hand history file into a table object.
+        The table of the converter is reused: it is reset when the next hand is converted.
 
         Args:
             file_key (str): Path to the hand history file
@@ -404,24 +473,145 @@ class AbstractHandHistoryConverter(ABC):
                 KeyError, ShowdownNotReachedError, CannotParseWinnersError, AttributeError) as e:
             raise HandConversionError(file_key, e)
 
+    def convert_history_to_record(self, file_key: str) -> HandRecord | HandConversionFailure:
+        """
+        Convert a hand history file into a compact record, detached from the table object
+
+        Args:
+            file_key (str): Path to the hand history file
+
+        Returns:
+            (HandRecord | HandConversionFailure): The record of the hand, or of the conversion failure
+        """
+        try:
+            table = self.convert_history(file_key)
+        except HandConversionError as e:
+            return HandConversionFailure.from_error(e)
+        return HandRecord.from_table(file_key, table)
+
+    def iter_convert_histories(self, parsed_keys=None):
+        """
+        Converts hand histories one at a time, reading each one only when it is needed.
+        Only detached records are yielded, so no converted hand is kept alive by the generator.
+
+        Args:
+            parsed_keys (Iterable): The keys of the parsed histories to convert, all of them by default
+
+        Yields:
+            (HandRecord | HandConversionFailure): The record of each hand, in keys order
+        """
+        if parsed_keys is None:
+            parsed_keys = self.iter_parsed_histories_keys()
+        for parsed_key in parsed_keys:
+            yield self.convert_history_to_record(parsed_key)
+
+    def export_hand_stats(self, path: str, parsed_keys=None, file_format: str = None,
+                          row_group_size: int = 100_000) -> int:
+        """
+        Converts hand histories and writes the statistics of every player to a columnar file, in row groups.
+        Hands that cannot be converted are moved to corrections.
+
+        Args:
+            path (str): The path of the Parquet, Arrow IPC or CSV file to write
+            parsed_keys (Iterable): The keys of the parsed histories to convert, all of them by default
+            file_format (str): "parquet", "arrow" or "csv", "parquet" by default when pyarrow is installed, else "csv"
+            row_group_size (int): The number of player rows written at once
+
+        Returns:
+            (int): The number of exported hands
+        """
+        if parsed_keys is None:
+            parsed_keys = self.list_parsed_histories_keys()
+        nb_hands = 0
+        with HandStatsWriter(path, file_format=file_format, row_group_size=row_group_size) as writer:
+            for parsed_key in parsed_keys:
+                try:
+                    table = self.convert_history(parsed_key)
+                except HandConversionError as e:
+                    failure = HandConversionFailure.from_error(e)
+                    print(f"Error processing history {failure.file_key}: {failure.message}")
+                    self.move_to_correction_dir(failure.file_key)
+                    continue
+                writer.add_table(table)
+                nb_hands += 1
+        return nb_hands
+
     def slow_convert_histories(self):
-        parsed_keys = self.list_parsed_histories_keys()
-        for parsed_key in tqdm(parsed_keys):
+        for result in tqdm(self.iter_convert_histories()):
+            if isinstance(result, HandConversionFailure):
+                self.move_to_correction_dir(result.file_key)
+
+    def convert_histories(self):
+        """
+        Converts all the hand histories one after the other and moves the failing ones to corrections.
+        The converter resets and reuses a single table for every hand, so hands are not converted in threads:
+        use process_convert_histories to convert them in parallel.
+        """
+        for parsed_key in self.list_parsed_histories_keys():
             try:
                 self.convert_history(parsed_key)
-            except HandConversionError:
+            except HandConversionError as e:
+                print(f"Error processing history {parsed_key}: {e}")
                 self.move_to_correction_dir(parsed_key)
 
+    def iter_process_converted_histories(self, parsed_keys: list = None, max_workers: int = None,
+                                         chunk_size: int = 100):
+        """
+        Converts hand histories in worker processes, each one building its own converter and table once.
+        Records are yielded as soon as their chunk has been converted. At most two chunks per worker are in flight,
+        a new chunk being submitted each time one completes, so that the keys and records held in memory stay bounded.
+        When a chunk fails as a whole, for instance when a file can not be read, a failure is yielded for each of its
+        keys.
+
+        Args:
+            parsed_keys (Iterable): The keys of the parsed histories to convert, all of them by default
+            max_workers (int): The number of worker processes, the number of CPUs by default
+            chunk_size (int): The number of histories sent to a worker at once
+
+        Yields:
+            (HandRecord | HandConversionFailure): The record of each hand, in completion order
+        """
+        if parsed_keys is None:
+            parsed_keys = self.iter_parsed_histories_keys()
+        max_workers = max_workers or os.cpu_count() or 1
+        chunks = _chunked(parsed_keys, chunk_size)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_conversion_worker,
+                                 initargs=(self.__class__, self.get_init_kwargs())) as executor:
+            pending = {}
+            for chunk in islice(chunks, 2 * max_workers):
+                pending[executor.submit(_convert_histories_chunk, chunk)] = chunk
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    for next_chunk in islice(chunks, 1):
+                        pending[executor.submit(_convert_histories_chunk, next_chunk)] = next_chunk
+                    try:
+                        results = future.result()
+                    except Exception as error:
+                        results = [HandConversionFailure.from_exception(parsed_key, error) for parsed_key in chunk]
+                    yield from results
+
+    def process_convert_histories(self, max_workers: int = None, chunk_size: int = 100) -> list[HandRecord]:
+        """
+        Converts all the hand histories in worker processes and moves the failing ones to corrections.
+        The records of every hand are kept in memory: use iter_process_converted_histories to stream them
+        on large data directories.
 
+        Args:
+            max_workers (int): The number of worker processes, the number of CPUs by default
+            chunk_size (int): The number of histories sent to a worker at once
 
-    def convert_histories(self):
+        Returns:
+            records (list[HandRecord]): The records of the converted hands
+        """
         parsed_keys = self.list_parsed_histories_keys()
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(self.convert_history, parsed_key): parsed_key for parsed_key in parsed_keys}
-            for future in as_completed(futures):
-                parsed_key = futures[future]
-                try:
-                    future.result()
-                except HandConversionError as e:
-                    print(f"Error processing history {parsed_key}: {e}")
-                    self.move_to_correction_dir(parsed_key)
+        records = []
+        results = self.iter_process_converted_histories(parsed_keys, max_workers=max_workers, chunk_size=chunk_size)
+        for result in tqdm(results, total=len(parsed_keys)):
+            if isinstance(result, HandConversionFailure):
+                print(f"Error processing history {result.file_key}: {result.message}")
+                self.move_to_correction_dir(result.file_key)
+            else:
+                records.append(result)
+        return records
@@ -13,17 +13,29 @@ class CloudHandHistoryConverter(AbstractHandHistoryConverter):  # pragma: no cov
         self.bucket_name = bucket_name
         self.parsed_prefix = "data/histories/parsed"
         self.table = Table()
+
+    def get_init_kwargs(self) -> dict:
+        return {"bucket_name": self.bucket_name}
         
     def list_parsed_histories_keys(self) -> list:
+        keys = list(self.iter_parsed_histories_keys())
+        return keys
+
+    def iter_parsed_histories_keys(self):
         paginator = self.s3.get_paginator("list_objects_v2")
         pages = paginator.paginate(Bucket=self.bucket_name, Prefix=self.parsed_prefix)
-        keys = [obj["Key"] for page in pages for obj in page.get("Contents", [])]
-        return keys
+        for page in pages:
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
     
     def read_data_text(self, parsed_key: str) -> str:
         response = self.s3.get_object(Bucket=self.bucket_name, Key=parsed_key)
         content = response["Body"].read().decode("utf-8")
         return content
+
+    def read_data_bytes(self, parsed_key: str) -> bytes:
+        response = self.s3.get_object(Bucket=self.bucket_name, Key=parsed_key)
+        return response["Body"].read()
     
     def send_to_corrections(self, file_key: str):
         correction_key = file_key.replace("data", "corrections")
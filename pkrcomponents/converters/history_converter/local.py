@@ -1,15 +1,24 @@
 import os
+import warnings
 
 from tqdm import tqdm
 from pkrcomponents.components.tables.table import Table
 from pkrcomponents.converters.history_converter.abstract import AbstractHandHistoryConverter
+from pkrcomponents.converters.utils.archives import ArchiveReader, split_member_key
+from pkrcomponents.converters.utils.bundles import add_to_corrections_ledger, BundleReader, \
+    DEFAULT_READ_BUFFER_SIZE, iter_dir_keys, read_corrections_ledger, send_line_to_corrections, split_line_key
 
 
 class LocalHandHistoryConverter(AbstractHandHistoryConverter):
     
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE, memory_map: bool = True):
         data_dir = self.correct_data_dir(data_dir)
+        self.data_dir = data_dir
         self.parsed_dir = os.path.join(data_dir, "histories", "parsed")
+        self.read_buffer_size = read_buffer_size
+        self.memory_map = memory_map
+        self.bundle_reader = BundleReader(read_buffer_size, memory_map=memory_map)
+        self.archive_reader = ArchiveReader(read_buffer_size)
         self.table = Table()
         
     @staticmethod
@@ -18,21 +27,19 @@ class LocalHandHistoryConverter(AbstractHandHistoryConverter):
             data_dir = data_dir.replace("C:/", "/mnt/c/")
         return data_dir
     
+    def get_init_kwargs(self) -> dict:
+        return {"data_dir": self.data_dir, "read_buffer_size": self.read_buffer_size, "memory_map": self.memory_map}
+
     def list_parsed_histories_keys(self) -> list:
-        parsed_keys = [
-            os.path.join(root, filename)
-            for root, _, filenames in os.walk(self.parsed_dir)
-            for filename in filenames if filename.endswith('.json')
-        ]
+        parsed_keys = list(self.iter_parsed_histories_keys())
         return parsed_keys
 
+    def iter_parsed_histories_keys(self):
+        yield from iter_dir_keys(self.parsed_dir, self.bundle_reader, self.read_buffer_size)
+
     def list_parsed_history_keys_to_correct(self) -> list:
         correction_dir = self.parsed_dir.replace("data", "corrections")
-        parsed_keys = [
-            os.path.join(root, filename)
-            for root, _, filenames in os.walk(correction_dir)
-            for filename in filenames if filename.endswith('.json')
-        ]
+        parsed_keys = list(iter_dir_keys(correction_dir, self.bundle_reader, self.read_buffer_size))
         return parsed_keys
 
     def convert_correction_histories(self):
@@ -41,11 +48,58 @@ class LocalHandHistoryConverter(AbstractHandHistoryConverter):
             self.convert_history(parsed_key)
     
     def read_data_text(self, parsed_key: str) -> str:
+        if split_member_key(parsed_key)[1] is not None or split_line_key(parsed_key)[1] is not None:
+            return str(self.read_data_bytes(parsed_key), 'utf-8')
         with open(parsed_key, 'r', encoding='utf-8') as file:
             content = file.read()
         return content
-    
+
+    def read_data_bytes(self, parsed_key: str) -> bytes | memoryview:
+        path, member_name = split_member_key(parsed_key)
+        if member_name is not None:
+            return self.archive_reader.read_member(path, member_name)
+        path, line_number = split_line_key(parsed_key)
+        if line_number is not None:
+            return self.bundle_reader.read_line(path, line_number)
+        with open(parsed_key, 'rb') as file:
+            content = file.read()
+        return content
+
+    def send_member_to_corrections(self, path: str, member_name: str):
+        """
+        Writes a member of an archive to the corrections directory, in a directory named like the archive.
+        The archive itself is left untouched, the name of the member is recorded in the corrections ledger of the
+        archive instead, so that it is listed and extracted only once.
+        Members whose name would be written outside of that directory, like ../../x.json, are not extracted:
+        a warning is emitted and they are recorded in the ledger all the same.
+
+        Args:
+            path (str): The path of the archive
+            member_name (str): The name of the member
+        """
+        if not os.path.exists(path) or member_name in read_corrections_ledger(path):
+            return
+        correction_dir = path.replace("data", "corrections")
+        correction_key = os.path.join(correction_dir, os.path.normpath(member_name).lstrip("/\\"))
+        absolute_dir = os.path.abspath(correction_dir)
+        if os.path.commonpath([absolute_dir, os.path.abspath(correction_key)]) == absolute_dir:
+            os.makedirs(os.path.dirname(correction_key), exist_ok=True)
+            with open(correction_key, 'wb') as file:
+                file.write(self.archive_reader.read_member(path, member_name))
+            print(f"Extracted {member_name} of {path} to {correction_key}")
+        else:
+            warnings.warn(f"{member_name} of {path} was not extracted, it would be written outside of {correction_dir}")
+        add_to_corrections_ledger(path, member_name)
+
     def send_to_corrections(self, file_key: str):
+        path, member_name = split_member_key(file_key)
+        if member_name is not None:
+            self.send_member_to_corrections(path, member_name)
+            return
+        path, line_number = split_line_key(file_key)
+        if line_number is not None:
+            send_line_to_corrections(self.bundle_reader, path, line_number)
+            return
         correction_key = file_key.replace("data", "corrections")
         os.makedirs(os.path.dirname(correction_key), exist_ok=True)
         print(f"Moving {file_key} to {correction_key}")
@@ -1,4 +1,3 @@
-import json
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
@@ -9,6 +8,7 @@ from pkrcomponents.components.tournaments.speed import TourSpeed
 from pkrcomponents.components.tournaments.tournament import Tournament
 from pkrcomponents.components.tournaments.tournament_type import TournamentType
 from pkrcomponents.converters.utils.exceptions import SummaryConversionError
+from pkrcomponents.converters.utils.json_decoders import get_json_decoder
 
 
 class AbstractSummaryConverter(ABC):
@@ -17,6 +17,7 @@ class AbstractSummaryConverter(ABC):
     """
     data: dict
     tournament: Tournament
+    json_backend: str = None
 
     @abstractmethod
     def list_parsed_summaries_keys(self) -> list:
@@ -38,6 +39,17 @@ class AbstractSummaryConverter(ABC):
         """
         pass
 
+    def read_data_bytes(self, parsed_key: str) -> bytes:
+        """
+        Reads the raw data of a parsed summary, without decoding it into str.
+        Converters that can read bytes directly override it, the text is encoded by default.
+        Args:
+            parsed_key (str): The key of the parsed summary
+        Returns:
+            data_bytes (bytes): The data of the parsed summary
+        """
+        return self.read_data_text(parsed_key).encode("utf-8")
+
     @abstractmethod
     def send_to_corrections(self, file_key: str):
         """
@@ -53,8 +65,8 @@ class AbstractSummaryConverter(ABC):
         Args:
             parsed_key (str): The key of the parsed history
         """
-        data_text = self.read_data_text(parsed_key)
-        self.data = json.loads(data_text)
+        data_bytes = self.read_data_bytes(parsed_key)
+        self.data = get_json_decoder(self.json_backend).decode(data_bytes)
 
     def get_buy_in(self):
         """
@@ -25,6 +25,10 @@ class CloudSummaryConverter(AbstractSummaryConverter):  # pragma: no cover
         content = response['Body'].read().decode('utf-8')
         return content
 
+    def read_data_bytes(self, parsed_key: str) -> bytes:
+        response = self.s3.get_object(Bucket=self.bucket_name, Key=parsed_key)
+        return response['Body'].read()
+
     def send_to_corrections(self, file_key: str):
         correction_key = file_key.replace('data', 'corrections')
         print(f'Moving {file_key} to {correction_key}')
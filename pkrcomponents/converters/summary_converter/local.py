@@ -2,15 +2,19 @@ import os
 
 from pkrcomponents.components.tournaments.tournament import Tournament
 from pkrcomponents.converters.summary_converter.abstract import AbstractSummaryConverter
+from pkrcomponents.converters.utils.bundles import BundleReader, DEFAULT_READ_BUFFER_SIZE, iter_dir_keys, \
+    send_line_to_corrections, split_line_key
 
 
 class LocalSummaryConverter(AbstractSummaryConverter):
     """
-    This class converts the parsed summaries from local dir to the format used by the pkrcomponents
+    This class converts the parsed summaries from local dir to the format used by the pkrcomponents.
+    Summaries are read from .json files, and from NDJSON bundles holding one parsed summary per line.
     """
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE, memory_map: bool = True):
         data_dir = self.correct_data_dir(data_dir)
         self.parsed_dir = os.path.join(data_dir, "summaries", "parsed")
+        self.bundle_reader = BundleReader(read_buffer_size, memory_map=memory_map)
         self.tournament = Tournament()
 
     @staticmethod
@@ -27,19 +31,29 @@ class LocalSummaryConverter(AbstractSummaryConverter):
         return data_dir
 
     def list_parsed_summaries_keys(self) -> list:
-        parsed_keys = [
-            os.path.join(root, filename)
-            for root, _, filenames in os.walk(self.parsed_dir)
-            for filename in filenames if filename.endswith('.json')
-        ]
+        parsed_keys = list(iter_dir_keys(self.parsed_dir, self.bundle_reader))
         return parsed_keys
 
     def read_data_text(self, parsed_key: str) -> str:
+        if split_line_key(parsed_key)[1] is not None:
+            return str(self.read_data_bytes(parsed_key), 'utf-8')
         with open(parsed_key, 'r', encoding='utf-8') as file:
             content = file.read()
         return content
 
+    def read_data_bytes(self, parsed_key: str) -> bytes | memoryview:
+        path, line_number = split_line_key(parsed_key)
+        if line_number is not None:
+            return self.bundle_reader.read_line(path, line_number)
+        with open(parsed_key, 'rb') as file:
+            content = file.read()
+        return content
+
     def send_to_corrections(self, file_key: str):
+        path, line_number = split_line_key(file_key)
+        if line_number is not None:
+            send_line_to_corrections(self.bundle_reader, path, line_number)
+            return
         correction_key = file_key.replace("data", "corrections")
         os.makedirs(os.path.dirname(correction_key), exist_ok=True)
         print(f"Moving {file_key} to {correction_key}")
@@ -0,0 +1,189 @@
+"""This module contains the reading of parsed histories straight from zip and tar archives, without extracting them.
+Each parsed history of an archive is addressed by a member key, made of the path of the archive and of the name of the
+member, like data/histories/parsed/2023-01-04.tar.gz!608341002/2612804708405870609-6-1672853787.json."""
+import tarfile
+import zipfile
+from functools import partial
+
+from pkrcomponents.converters.utils.bundles import DEFAULT_READ_BUFFER_SIZE, import_zstandard
+
+ZIP_EXTENSIONS = (".zip",)
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".tar.zst")
+MEMBER_KEY_SEPARATOR = "!"
+
+
+def is_archive_path(path: str) -> bool:
+    """Returns True if the path is the path of a zip or tar archive"""
+    return path.endswith(ZIP_EXTENSIONS + TAR_EXTENSIONS)
+
+
+def make_member_key(path: str, member_name: str) -> str:
+    """Returns the key of a member of an archive"""
+    return f"{path}{MEMBER_KEY_SEPARATOR}{member_name}"
+
+
+def split_member_key(key: str) -> tuple:
+    """
+    Splits a member key into the path of the archive and the name of the member
+
+    Args:
+        key (str): The key of a parsed file or of a member of an archive
+
+    Returns:
+        (tuple): The path of the file and the name of the member, which is None when the key is not a member key
+    """
+    index = key.find(MEMBER_KEY_SEPARATOR)
+    while index != -1:
+        path = key[:index]
+        if is_archive_path(path):
+            return path, key[index + 1:]
+        index = key.find(MEMBER_KEY_SEPARATOR, index + 1)
+    return key, None
+
+
+def read_tar_member(archive: tarfile.TarFile, member: tarfile.TarInfo) -> bytes:
+    """Returns the bytes of the member of a tar archive opened in stream mode, which must be the current member"""
+    return archive.extractfile(member).read()
+
+
+def iter_tar_member_readers(archive: tarfile.TarFile, skipped_members: frozenset = frozenset()):
+    """
+    Streams the .json members of an open tar archive, in archive order, without reading their data
+
+    Args:
+        archive (tarfile.TarFile): The archive, opened in stream mode
+        skipped_members (frozenset): The names of the members to skip
+
+    Yields:
+        (tuple): The name of the member and a function returning its bytes, to call before the next member is reached
+    """
+    with archive:
+        for member in archive:
+            if member.isfile() and member.name.endswith(".json") and member.name not in skipped_members:
+                yield member.name, partial(read_tar_member, archive, member)
+
+
+def iter_archive_member_readers(path: str, buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+                                skipped_members: frozenset = frozenset()):
+    """
+    Streams the .json members of an archive, in archive order, without reading their data.
+    Tar archives are opened in stream mode, so that they are read without seeking: the data of the members that are
+    not read is skipped without being copied.
+
+    Args:
+        path (str): The path of the archive
+        buffer_size (int): The size of the read buffer of tar archives, in bytes
+        skipped_members (frozenset): The names of the members to skip, like the ones already sent to corrections
+
+    Yields:
+        (tuple): The name of the member and a function returning its bytes, to call before the next member is reached
+    """
+    if path.endswith(ZIP_EXTENSIONS):
+        with zipfile.ZipFile(path) as archive:
+            members = sorted(archive.infolist(), key=lambda info: info.header_offset)
+            for info in members:
+                if not info.is_dir() and info.filename.endswith(".json") and info.filename not in skipped_members:
+                    yield info.filename, partial(archive.read, info)
+        return
+    if path.endswith(".tar.zst"):
+        zstandard = import_zstandard()
+        decompressor = zstandard.ZstdDecompressor()
+        with open(path, "rb") as file, decompressor.stream_reader(file, read_size=buffer_size) as reader:
+            yield from iter_tar_member_readers(tarfile.open(fileobj=reader, mode="r|"), skipped_members)
+        return
+    yield from iter_tar_member_readers(tarfile.open(path, mode="r|*"), skipped_members)
+
+
+def iter_archive_members(path: str, buffer_size: int = DEFAULT_READ_BUFFER_SIZE, read_data: bool = True,
+                         skipped_members: frozenset = frozenset()):
+    """
+    Streams the parsed histories of an archive, in archive order. Only the .json members are read.
+
+    Args:
+        path (str): The path of the archive
+        buffer_size (int): The size of the read buffer of tar archives, in bytes
+        read_data (bool): Whether the data of the members is read, or only their names
+        skipped_members (frozenset): The names of the members to skip, like the ones already sent to corrections
+
+    Yields:
+        (tuple): The name of the member and its bytes, None when read_data is False
+    """
+    for member_name, read_member in iter_archive_member_readers(path, buffer_size, skipped_members):
+        yield member_name, read_member() if read_data else None
+
+
+class ArchiveReader:
+    """
+    Reads the members of archives by name.
+    Zip members are read directly from the open archive.
+    Tar archives are streamed: members requested in archive order are read in a single pass,
+    the archive is only reopened when an earlier member, or another archive, is requested.
+    Only the data of the requested member is read, the other members are skipped on the way.
+
+    Attributes:
+        buffer_size (int): The size of the read buffer of tar archives, in bytes
+
+    Methods:
+        read_member: returns the bytes of a member of an archive
+        close: closes the archive being read
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_READ_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._path = None
+        self._zip_file = None
+        self._members = None
+        self._member_name = None
+        self._member_data = None
+
+    def read_member(self, path: str, member_name: str) -> bytes:
+        """
+        Returns the bytes of a member of an archive
+
+        Args:
+            path (str): The path of the archive
+            member_name (str): The name of the member
+
+        Returns:
+            (bytes): The data of the member
+
+        Raises:
+            KeyError: If the archive has no such .json member
+        """
+        if path != self._path:
+            self.close()
+            self._path = path
+            if path.endswith(ZIP_EXTENSIONS):
+                self._zip_file = zipfile.ZipFile(path)
+        if self._zip_file is not None:
+            return self._zip_file.read(member_name)
+        if member_name == self._member_name:
+            return self._member_data
+        if self._members is not None and self._find_member(member_name):
+            return self._member_data
+        self._members = iter_archive_member_readers(path, self.buffer_size)
+        if self._find_member(member_name):
+            return self._member_data
+        self.close()
+        raise KeyError(f"No parsed history named {member_name} in {path}")
+
+    def _find_member(self, member_name: str) -> bool:
+        """Streams the tar archive being read up to a member, returns False when the end of the archive is reached"""
+        for name, read_member in self._members:
+            if name == member_name:
+                self._member_name, self._member_data = name, read_member()
+                return True
+        self._members = None
+        return False
+
+    def close(self):
+        """Closes the archive being read"""
+        if self._zip_file is not None:
+            self._zip_file.close()
+        if self._members is not None:
+            self._members.close()
+        self._path = None
+        self._zip_file = None
+        self._members = None
+        self._member_name = None
+        self._member_data = None
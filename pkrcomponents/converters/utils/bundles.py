@@ -0,0 +1,427 @@
+"""This module contains the reading of bundled parsed files: newline-delimited JSON files holding one parsed hand per
+line, optionally compressed with gzip or zstd.
+Each hand of a bundle is addressed by a line key, made of the path of the bundle and of the line number of the hand,
+like data/histories/parsed/hands.ndjson.gz#12.
+Uncompressed bundles can be mapped in memory: their lines are indexed once, then handed to the decoders as zero-copy
+memoryview slices, and the worker processes reading the same bundle share the page cache.
+The hands sent to corrections stay in their bundle, their line number is recorded in a corrections ledger next to it,
+like data/histories/parsed/hands.ndjson.gz.corrections, so that they are listed and sent to corrections only once."""
+import gzip
+import io
+import mmap
+import os
+from array import array
+from collections import OrderedDict
+
+BUNDLE_EXTENSIONS = (".ndjson", ".jsonl")
+COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
+LINE_KEY_SEPARATOR = "#"
+DEFAULT_READ_BUFFER_SIZE = 1 << 20
+DEFAULT_MAX_MAPPED_BUNDLES = 4
+WHITESPACE_BYTES = frozenset(b" \t\r\n")
+CORRECTIONS_LEDGER_EXTENSION = ".corrections"
+
+
+def import_zstandard():
+    """
+    Imports zstandard, which is only needed to read zstd-compressed bundles
+
+    Returns:
+        module: The zstandard module
+    """
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError("Reading zstd bundles requires zstandard: pip install pkrcomponents[zstd]") from error
+    return zstandard
+
+
+def split_compression(path: str) -> tuple:
+    """
+    Splits the compression extension from the path of a file
+
+    Args:
+        path (str): The path of the file
+
+    Returns:
+        (tuple): The path without its compression extension, and the name of the compression or None
+    """
+    for extension, compression in COMPRESSIONS.items():
+        if path.endswith(extension):
+            return path[:-len(extension)], compression
+    return path, None
+
+
+def is_bundle_path(path: str) -> bool:
+    """Returns True if the path is the path of a bundle, compressed or not"""
+    return split_compression(path)[0].endswith(BUNDLE_EXTENSIONS)
+
+
+def make_line_key(path: str, line_number: int) -> str:
+    """Returns the key of the hand written at a line of a bundle"""
+    return f"{path}{LINE_KEY_SEPARATOR}{line_number}"
+
+
+def split_line_key(key: str) -> tuple:
+    """
+    Splits a line key into the path of the bundle and the line number
+
+    Args:
+        key (str): The key of a parsed file or of a line of a bundle
+
+    Returns:
+        (tuple): The path of the file and the line number, which is None when the key is not a line key
+    """
+    path, separator, line_number = key.rpartition(LINE_KEY_SEPARATOR)
+    if separator and line_number.isdigit() and is_bundle_path(path):
+        return path, int(line_number)
+    return key, None
+
+
+def open_bundle(path: str, buffer_size: int = DEFAULT_READ_BUFFER_SIZE):
+    """
+    Opens a bundle in binary mode, decompressing it on the fly
+
+    Args:
+        path (str): The path of the bundle
+        buffer_size (int): The size of the read buffer, in bytes
+
+    Returns:
+        (io.BufferedIOBase): The readable binary stream of the bundle
+    """
+    compression = split_compression(path)[1]
+    if compression == "gzip":
+        return io.BufferedReader(gzip.open(path, "rb"), buffer_size)
+    if compression == "zstd":
+        zstandard = import_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_size=buffer_size, closefd=True)
+        return io.BufferedReader(reader, buffer_size)
+    return open(path, "rb", buffering=buffer_size)
+
+
+def iter_bundle_lines(path: str, buffer_size: int = DEFAULT_READ_BUFFER_SIZE):
+    """
+    Streams the hands of a bundle, line by line. Blank lines are skipped.
+
+    Args:
+        path (str): The path of the bundle
+        buffer_size (int): The size of the read buffer, in bytes
+
+    Yields:
+        (tuple): The line number, starting at 1, and the bytes of the line
+    """
+    with open_bundle(path, buffer_size) as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.isspace():
+                yield line_number, line
+
+
+def index_lines(data) -> array:
+    """
+    Indexes the offsets of the lines of a buffer
+
+    Args:
+        data (bytes | mmap.mmap): The buffer to index
+
+    Returns:
+        (array): The offset of the start of each line, followed by the offset of the end of the last line
+    """
+    line_starts = array("q", [0])
+    find = data.find
+    position = find(b"\n")
+    while position != -1:
+        line_starts.append(position + 1)
+        position = find(b"\n", position + 1)
+    if line_starts[-1] != len(data):
+        line_starts.append(len(data))
+    return line_starts
+
+
+class MappedBundle:
+    """
+    An uncompressed bundle mapped in memory, with the offsets of its lines indexed once when it is opened
+
+    Attributes:
+        path (str): The path of the bundle
+        line_starts (array): The offset of the start of each line, followed by the offset of the end of the last line
+
+    Methods:
+        get_line: returns a zero-copy slice of a line
+        iter_lines: iterates over the lines that are not blank
+        close: unmaps the bundle
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(file.fileno()).st_size else b""
+        self._view = memoryview(self._map)
+        self.line_starts = index_lines(self._map)
+
+    def __len__(self):
+        return len(self.line_starts) - 1
+
+    def is_blank(self, start: int, end: int) -> bool:
+        """Returns True if the line between two offsets is blank, only lines starting with a whitespace are copied"""
+        return start == end or (self._map[start] in WHITESPACE_BYTES and self._map[start:end].isspace())
+
+    def get_line(self, line_number: int) -> memoryview:
+        """
+        Returns a line of the bundle, without copying it
+
+        Args:
+            line_number (int): The number of the line, starting at 1
+
+        Returns:
+            (memoryview): The line, with its line ending
+
+        Raises:
+            KeyError: If the line is blank or past the end of the bundle
+        """
+        if 0 < line_number <= len(self):
+            start, end = self.line_starts[line_number - 1], self.line_starts[line_number]
+            if not self.is_blank(start, end):
+                return self._view[start:end]
+        raise KeyError(f"No parsed hand at line {line_number} of {self.path}")
+
+    def iter_lines(self):
+        """
+        Iterates over the lines of the bundle that are not blank
+
+        Yields:
+            (tuple): The line number, starting at 1, and the line as a memoryview
+        """
+        line_starts = self.line_starts
+        for line_number in range(1, len(line_starts)):
+            start, end = line_starts[line_number - 1], line_starts[line_number]
+            if not self.is_blank(start, end):
+                yield line_number, self._view[start:end]
+
+    def close(self):
+        """Unmaps the bundle. The map stays open until the slices still in use are released."""
+        self._view.release()
+        if isinstance(self._map, mmap.mmap):
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+
+
+class BundleReader:
+    """
+    Reads the lines of bundles by line number.
+    Uncompressed bundles are mapped in memory when memory_map is True: their lines are indexed once and returned as
+    zero-copy memoryview slices. Each map holds a file descriptor, so only the most recently read bundles stay mapped,
+    the least recently read one is closed when a new bundle is mapped. The other bundles are streamed: the bundle being
+    read is kept open, so that lines requested in increasing order are read in a single pass, and it is only reopened
+    when an earlier line, or another bundle, is requested.
+
+    Attributes:
+        buffer_size (int): The size of the read buffer of streamed bundles, in bytes
+        memory_map (bool): Whether uncompressed bundles are mapped in memory
+        max_mapped_bundles (int): The number of bundles kept mapped at once
+
+    Methods:
+        iter_lines: iterates over the lines of a bundle that are not blank
+        read_line: returns a line of a bundle
+        close: closes the bundles being read
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_READ_BUFFER_SIZE, memory_map: bool = True,
+                 max_mapped_bundles: int = DEFAULT_MAX_MAPPED_BUNDLES):
+        self.buffer_size = buffer_size
+        self.memory_map = memory_map
+        self.max_mapped_bundles = max(max_mapped_bundles, 1)
+        self._mapped_bundles = OrderedDict()
+        self._path = None
+        self._lines = None
+        self._line_number = 0
+        self._line = None
+
+    def get_mapped_bundle(self, path: str) -> MappedBundle | None:
+        """
+        Returns the mapped bundle of a path, mapped and indexed when it is not mapped yet.
+        The least recently read bundle is closed when more than max_mapped_bundles bundles are mapped.
+
+        Args:
+            path (str): The path of the bundle
+
+        Returns:
+            (MappedBundle | None): The mapped bundle, None if the bundle is compressed or memory_map is False
+        """
+        if not self.memory_map or split_compression(path)[1] is not None:
+            return None
+        mapped_bundle = self._mapped_bundles.get(path)
+        if mapped_bundle is not None:
+            self._mapped_bundles.move_to_end(path)
+            return mapped_bundle
+        while len(self._mapped_bundles) >= self.max_mapped_bundles:
+            self._mapped_bundles.popitem(last=False)[1].close()
+        mapped_bundle = self._mapped_bundles[path] = MappedBundle(path)
+        return mapped_bundle
+
+    def iter_lines(self, path: str):
+        """
+        Iterates over the lines of a bundle that are not blank.
+        A bundle that was not mapped yet is mapped only for the iteration, and closed once it is over, so that listing
+        many bundles does not keep them all open.
+
+        Args:
+            path (str): The path of the bundle
+
+        Yields:
+            (tuple): The line number, starting at 1, and the line
+        """
+        if not self.memory_map or split_compression(path)[1] is not None:
+            yield from iter_bundle_lines(path, self.buffer_size)
+        elif path in self._mapped_bundles:
+            yield from self.get_mapped_bundle(path).iter_lines()
+        else:
+            mapped_bundle = MappedBundle(path)
+            try:
+                yield from mapped_bundle.iter_lines()
+            finally:
+                mapped_bundle.close()
+
+    def read_line(self, path: str, line_number: int) -> bytes | memoryview:
+        """
+        Returns a line of a bundle
+
+        Args:
+            path (str): The path of the bundle
+            line_number (int): The number of the line, starting at 1
+
+        Returns:
+            (bytes | memoryview): The line, with its line ending, as a zero-copy slice for mapped bundles
+
+        Raises:
+            KeyError: If the line is blank or past the end of the bundle
+        """
+        mapped_bundle = self.get_mapped_bundle(path)
+        if mapped_bundle is not None:
+            return mapped_bundle.get_line(line_number)
+        if path == self._path and line_number == self._line_number:
+            return self._line
+        if path != self._path or line_number < self._line_number:
+            self.close_stream()
+            self._path = path
+            self._lines = iter_bundle_lines(path, self.buffer_size)
+        for self._line_number, self._line in self._lines:
+            if self._line_number == line_number:
+                return self._line
+            if self._line_number > line_number:
+                break
+        self.close_stream()
+        raise KeyError(f"No parsed hand at line {line_number} of {path}")
+
+    def close(self):
+        """Closes the bundles being read"""
+        for mapped_bundle in self._mapped_bundles.values():
+            mapped_bundle.close()
+        self._mapped_bundles.clear()
+        self.close_stream()
+
+    def close_stream(self):
+        """Closes the streamed bundle being read"""
+        if self._lines is not None:
+            self._lines.close()
+        self._path = None
+        self._lines = None
+        self._line_number = 0
+        self._line = None
+
+
+def get_corrections_ledger_path(path: str) -> str:
+    """Returns the path of the corrections ledger of a bundle or of an archive"""
+    return f"{path}{CORRECTIONS_LEDGER_EXTENSION}"
+
+
+def read_corrections_ledger(path: str) -> frozenset:
+    """
+    Reads the corrections ledger of a bundle or of an archive
+
+    Args:
+        path (str): The path of the bundle or of the archive
+
+    Returns:
+        (frozenset): The line numbers, or the member names, already sent to corrections
+    """
+    ledger_path = get_corrections_ledger_path(path)
+    if not os.path.exists(ledger_path):
+        return frozenset()
+    with open(ledger_path, 'r', encoding='utf-8') as file:
+        return frozenset(entry for entry in file.read().splitlines() if entry)
+
+
+def add_to_corrections_ledger(path: str, entry: str) -> bool:
+    """
+    Records a line number or a member name in the corrections ledger of a bundle or of an archive
+
+    Args:
+        path (str): The path of the bundle or of the archive
+        entry (str): The line number or the member name sent to corrections
+
+    Returns:
+        (bool): False if the entry was already recorded
+    """
+    if entry in read_corrections_ledger(path):
+        return False
+    with open(get_corrections_ledger_path(path), 'a', encoding='utf-8') as file:
+        file.write(entry + "\n")
+    return True
+
+
+def iter_dir_keys(directory: str, bundle_reader: BundleReader, archive_buffer_size: int = None):
+    """
+    Lists the keys of the parsed files of a directory lazily: the path of each .json file,
+    a line key for each hand of the NDJSON bundles and, when archive_buffer_size is given,
+    a member key for each .json member of the archives, in archive order.
+    The hands recorded in the corrections ledger of their bundle or of their archive are skipped.
+
+    Args:
+        directory (str): The directory to walk
+        bundle_reader (BundleReader): The reader listing the lines of the bundles
+        archive_buffer_size (int): The size of the read buffer of tar archives, archives are skipped when None
+
+    Yields:
+        key (str): The key of a parsed file
+    """
+    # Imported here as the archives module imports this one
+    from pkrcomponents.converters.utils.archives import is_archive_path, iter_archive_members, make_member_key
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if filename.endswith('.json'):
+                yield path
+            elif is_bundle_path(filename):
+                corrected_lines = read_corrections_ledger(path)
+                for line_number, _ in bundle_reader.iter_lines(path):
+                    if str(line_number) not in corrected_lines:
+                        yield make_line_key(path, line_number)
+            elif archive_buffer_size is not None and is_archive_path(filename):
+                corrected_members = read_corrections_ledger(path)
+                for member_name, _ in iter_archive_members(path, archive_buffer_size, read_data=False,
+                                                           skipped_members=corrected_members):
+                    yield make_member_key(path, member_name)
+
+
+def send_line_to_corrections(bundle_reader: BundleReader, path: str, line_number: int):
+    """
+    Appends a line of a bundle to the matching uncompressed bundle of the corrections directory.
+    The line is kept in the original bundle, so that the keys of the other lines stay valid, and its number is recorded
+    in the corrections ledger of the bundle: a line already recorded is not appended again.
+
+    Args:
+        bundle_reader (BundleReader): The reader of the bundle
+        path (str): The path of the bundle
+        line_number (int): The number of the line
+    """
+    if not os.path.exists(path) or str(line_number) in read_corrections_ledger(path):
+        return
+    line = bytes(bundle_reader.read_line(path, line_number)).rstrip(b"\r\n")
+    correction_path = split_compression(path)[0].replace("data", "corrections")
+    os.makedirs(os.path.dirname(correction_path), exist_ok=True)
+    print(f"Copying line {line_number} of {path} to {correction_path}")
+    with open(correction_path, 'ab') as file:
+        file.write(line + b"\n")
+    add_to_corrections_ledger(path, str(line_number))
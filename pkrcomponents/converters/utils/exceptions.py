@@ -18,4 +18,12 @@ class SummaryConversionError(Exception):
                             f"Original error: {str(original_exception)}")
         else:
             self.message = "Error converting summary"
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+
+class ParsedHistoryError(ValueError):
+    def __init__(self, path: str, reason: str):
+        self.path = path
+        self.reason = reason
+        self.message = f"Invalid parsed history at {path}: {reason}"
+        super().__init__(self.message)
@@ -0,0 +1,199 @@
+"""This module contains the msgspec structs mirroring the schema of the parsed history files.
+The msgspec decoder decodes parsed histories straight into these structs: types and required fields are checked by
+msgspec while decoding, then the structs are turned into ParsedHistory records without building intermediate dicts.
+Importing this module requires msgspec."""
+from datetime import datetime
+
+import msgspec
+
+from pkrcomponents.converters.utils.exceptions import ParsedHistoryError
+from pkrcomponents.converters.utils.parsed_history import BLIND_TYPES, check_player_name, DATETIME_FORMAT, \
+    ParsedAction, ParsedHistory, ParsedPlayer, ParsedPosting, ParsedShowdown, ParsedWinner, PLAYED_MOVES, \
+    STREETS_NAMES
+
+Number = int | float
+
+
+class TournamentInfoStruct(msgspec.Struct):
+    tournament_name: str | None
+    tournament_id: str | None
+    table_number: str | None
+
+
+class LevelStruct(msgspec.Struct):
+    value: int
+    ante: Number
+    sb: Number
+    bb: Number
+
+
+class HeroHandStruct(msgspec.Struct):
+    hero: str | None
+    first_card: str | None
+    second_card: str | None
+
+
+class FlopStruct(msgspec.Struct):
+    flop_card_1: str | None
+    flop_card_2: str | None
+    flop_card_3: str | None
+
+
+class TurnStruct(msgspec.Struct):
+    turn_card: str | None
+
+
+class RiverStruct(msgspec.Struct):
+    river_card: str | None
+
+
+class PlayerStruct(msgspec.Struct):
+    seat: int
+    name: str
+    init_stack: Number
+    bounty: Number | None
+    entered_hand: bool
+
+
+class PostingStruct(msgspec.Struct):
+    name: str
+    amount: Number
+    blind_type: str
+
+
+class ActionStruct(msgspec.Struct):
+    player: str
+    action: str
+    amount: Number | None
+    raise_total: Number | None = None
+    is_all_in: bool | None = False
+
+
+class ActionsStruct(msgspec.Struct):
+    preflop: list[ActionStruct]
+    flop: list[ActionStruct]
+    turn: list[ActionStruct]
+    river: list[ActionStruct]
+
+
+class ShowdownStruct(msgspec.Struct):
+    first_card: str
+    second_card: str
+
+
+class WinnerStruct(msgspec.Struct):
+    amount: Number
+    pot_type: str | None
+
+
+class HistoryStruct(msgspec.Struct):
+    hand_id: str
+    datetime: str
+    game_type: str
+    buy_in: Number
+    max_players: int
+    button_seat: int
+    tournament_info: TournamentInfoStruct
+    level: LevelStruct
+    hero_hand: HeroHandStruct
+    flop: FlopStruct
+    turn: TurnStruct
+    river: RiverStruct
+    players: dict[str, PlayerStruct]
+    postings: list[PostingStruct]
+    actions: ActionsStruct
+    showdown: dict[str, ShowdownStruct]
+    winners: dict[str, WinnerStruct]
+
+
+def get_played_move(action: ActionStruct, path: str):
+    """Returns the move of an action, from any of its aliases"""
+    try:
+        return PLAYED_MOVES[action.action.upper()]
+    except KeyError:
+        raise ParsedHistoryError(f"{path}.action", f"invalid action {action.action!r}") from None
+
+
+def get_blind_type(posting: PostingStruct, path: str):
+    """Returns the blind type of a posting, from any of its aliases"""
+    try:
+        return BLIND_TYPES[posting.blind_type.upper()]
+    except KeyError:
+        raise ParsedHistoryError(f"{path}.blind_type", f"invalid blind type {posting.blind_type!r}") from None
+
+
+def history_from_struct(history: HistoryStruct) -> ParsedHistory:
+    """
+    Creates the record of a parsed history decoded into structs.
+    The types are already checked, only the values are: the date, the moves, the blind types and the player names.
+
+    Args:
+        history (HistoryStruct): The decoded parsed history
+
+    Returns:
+        ParsedHistory: The record of the parsed history
+
+    Raises:
+        ParsedHistoryError: If a value is invalid or refers to an unknown player
+    """
+    try:
+        hand_date = datetime.strptime(history.datetime, DATETIME_FORMAT)
+    except ValueError:
+        raise ParsedHistoryError("history.datetime", f"invalid date {history.datetime!r}") from None
+    players = tuple(
+        ParsedPlayer(seat=player.seat, name=player.name, init_stack=player.init_stack, bounty=player.bounty,
+                     entered_hand=player.entered_hand)
+        for player in history.players.values()
+    )
+    players_names = {player.name for player in players}
+    postings = tuple(
+        ParsedPosting(name=check_player_name(posting.name, players_names, f"postings[{index}].name"),
+                      amount=posting.amount, blind_type=get_blind_type(posting, f"postings[{index}]"))
+        for index, posting in enumerate(history.postings)
+    )
+    actions = {
+        street: tuple(
+            ParsedAction(player=check_player_name(action.player, players_names, f"actions.{street}[{index}].player"),
+                         move=get_played_move(action, f"actions.{street}[{index}]"), amount=action.amount,
+                         raise_total=action.raise_total, is_all_in=action.is_all_in)
+            for index, action in enumerate(getattr(history.actions, street))
+        )
+        for street in STREETS_NAMES
+    }
+    showdown = tuple(
+        ParsedShowdown(name=check_player_name(name, players_names, "showdown"), first_card=hand.first_card,
+                       second_card=hand.second_card)
+        for name, hand in history.showdown.items()
+    )
+    winners = tuple(
+        ParsedWinner(name=name, amount=win.amount, pot_type=win.pot_type)
+        for name, win in history.winners.items()
+    )
+    flop = history.flop
+    return ParsedHistory(
+        hand_id=history.hand_id,
+        hand_date=hand_date,
+        game_type=history.game_type,
+        tournament_name=history.tournament_info.tournament_name,
+        tournament_id=history.tournament_info.tournament_id,
+        table_number=history.tournament_info.table_number,
+        buy_in=history.buy_in,
+        level_value=history.level.value,
+        ante=history.level.ante,
+        sb=history.level.sb,
+        bb=history.level.bb,
+        max_players=history.max_players,
+        button_seat=history.button_seat,
+        players=players,
+        hero=history.hero_hand.hero,
+        hero_first_card=history.hero_hand.first_card,
+        hero_second_card=history.hero_hand.second_card,
+        postings=postings,
+        actions=actions,
+        flop_cards=(flop.flop_card_1, flop.flop_card_2, flop.flop_card_3),
+        turn_card=history.turn.turn_card,
+        river_card=history.river.river_card,
+        showdown=showdown,
+        winners=winners
+    )
+
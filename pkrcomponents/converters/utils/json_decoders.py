@@ -0,0 +1,132 @@
+"""This module contains the JSON decoders used to read parsed histories and summaries.
+Decoders read bytes, so parsed files do not have to be decoded into str before being parsed. The fastest installed
+library is used by default: msgspec, then orjson, then the json module of the standard library.
+Every decoder raises a ValueError on an invalid document, like json.loads.
+Parsed histories can also be decoded into their typed records: the msgspec decoder decodes them into structs of their
+schema, the other decoders validate the decoded dicts."""
+import json
+from functools import lru_cache
+from importlib.util import find_spec
+
+from pkrcomponents.converters.utils.exceptions import ParsedHistoryError
+from pkrcomponents.converters.utils.parsed_history import ParsedHistory
+
+JSON_BACKENDS = ("msgspec", "orjson", "json")
+
+
+class JsonDecoder:
+    """
+    Decodes JSON documents with the json module of the standard library
+
+    Methods:
+        decode: decodes a JSON document
+        decode_history: decodes a parsed history into its typed record
+    """
+    name = "json"
+
+    def decode(self, data: bytes | memoryview | str):
+        """
+        Decodes a JSON document. The json module does not read memoryviews, they are copied into bytes.
+
+        Args:
+            data (bytes | memoryview | str): The JSON document
+
+        Returns:
+            The decoded document
+        """
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def decode_history(self, data: bytes | memoryview | str) -> ParsedHistory:
+        """
+        Decodes a parsed history and validates it into its typed record
+
+        Args:
+            data (bytes | memoryview | str): The JSON document of the parsed history
+
+        Returns:
+            ParsedHistory: The record of the parsed history
+
+        Raises:
+            ParsedHistoryError: If the document does not match the parsed history schema
+        """
+        return ParsedHistory.from_dict(self.decode(data))
+
+
+class OrjsonDecoder(JsonDecoder):
+    """Decodes JSON documents with orjson"""
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._loads = orjson.loads
+
+    def decode(self, data: bytes | str):
+        return self._loads(data)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """Decodes JSON documents with msgspec, and parsed histories straight into the structs of their schema"""
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        from pkrcomponents.converters.utils.history_structs import HistoryStruct, history_from_struct
+        self._decoder = msgspec.json.Decoder()
+        self._history_decoder = msgspec.json.Decoder(type=HistoryStruct)
+        self._history_from_struct = history_from_struct
+        self._error_type = msgspec.DecodeError
+        self._validation_error_type = msgspec.ValidationError
+
+    def decode(self, data: bytes | str):
+        try:
+            return self._decoder.decode(data)
+        except self._error_type as error:
+            raise ValueError(f"{error}") from error
+
+    def decode_history(self, data: bytes | memoryview | str) -> ParsedHistory:
+        try:
+            history = self._history_decoder.decode(data)
+        except self._validation_error_type as error:
+            reason, _, path = f"{error}".partition(" - at ")
+            raise ParsedHistoryError(path.strip("`") or "history", reason) from error
+        except self._error_type as error:
+            raise ValueError(f"{error}") from error
+        return self._history_from_struct(history)
+
+
+DECODER_CLASSES = {"msgspec": MsgspecDecoder, "orjson": OrjsonDecoder, "json": JsonDecoder}
+
+
+@lru_cache
+def get_available_backends() -> tuple:
+    """
+    Returns the JSON backends that can be used, fastest first
+
+    Returns:
+        tuple: The names of the installed backends
+    """
+    return tuple(backend for backend in JSON_BACKENDS if backend == "json" or find_spec(backend) is not None)
+
+
+@lru_cache
+def _build_json_decoder(backend: str) -> JsonDecoder:
+    if backend not in DECODER_CLASSES:
+        raise ValueError(f"JSON backend must be one of {JSON_BACKENDS}, not {backend}")
+    return DECODER_CLASSES[backend]()
+
+
+def get_json_decoder(backend: str = None) -> JsonDecoder:
+    """
+    Returns the JSON decoder of a backend, built once
+
+    Args:
+        backend (str): "msgspec", "orjson" or "json", the fastest installed backend by default
+
+    Returns:
+        JsonDecoder: The decoder of the backend
+    """
+    if backend is None:
+        backend = get_available_backends()[0]
+    return _build_json_decoder(backend)
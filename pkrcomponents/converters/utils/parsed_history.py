@@ -0,0 +1,398 @@
+"""This module contains the typed schema of parsed hand histories.
+A parsed history is validated in a single pass right after being decoded and turned into slotted records,
+so that malformed files are rejected before any replay on the table and the converter reads typed fields only."""
+from datetime import datetime
+
+from attrs import define, field
+
+from pkrcomponents.components.actions.action_move import ActionMove
+from pkrcomponents.components.actions.blind_type import BlindType
+from pkrcomponents.converters.utils.exceptions import ParsedHistoryError
+
+DATETIME_FORMAT = "%d-%m-%Y %H:%M:%S"
+STREETS_NAMES = ("preflop", "flop", "turn", "river")
+NUMBER = (int, float)
+TEXT = (str,)
+INTEGER = (int,)
+BOOLEAN = (bool,)
+PLAYED_MOVES = {
+    alias.upper(): move
+    for move in (ActionMove.FOLD, ActionMove.CHECK, ActionMove.CALL, ActionMove.BET, ActionMove.RAISE)
+    for alias in move.value
+}
+BLIND_TYPES = {alias.upper(): blind_type for blind_type in BlindType for alias in blind_type.value}
+
+
+def get_value(data: dict, key: str, value_types: tuple, path: str, nullable: bool = False):
+    """
+    Gets a value from a parsed mapping and checks its type.
+    Types are checked exactly, so that a boolean is not accepted as a number.
+
+    Args:
+        data (dict): The mapping to read
+        key (str): The key of the value
+        value_types (tuple): The accepted types of the value
+        path (str): The path of the mapping in the parsed history, used in error messages
+        nullable (bool): Whether the value can be None
+
+    Returns:
+        The value
+
+    Raises:
+        ParsedHistoryError: If the value is missing or of an unexpected type
+    """
+    try:
+        value = data[key]
+    except KeyError:
+        raise ParsedHistoryError(f"{path}.{key}", "missing field") from None
+    if type(value) in value_types or (value is None and nullable):
+        return value
+    expected = " or ".join(value_type.__name__ for value_type in value_types)
+    raise ParsedHistoryError(f"{path}.{key}", f"expected {expected}, got {type(value).__name__}")
+
+
+def get_optional_value(data: dict, key: str, value_types: tuple, path: str, default=None):
+    """
+    Gets a value that older parsed files may not contain, and checks its type when it is present
+
+    Args:
+        data (dict): The mapping to read
+        key (str): The key of the value
+        value_types (tuple): The accepted types of the value
+        path (str): The path of the mapping in the parsed history, used in error messages
+        default: The value returned when the key is missing
+
+    Returns:
+        The value, or the default value
+    """
+    if key not in data:
+        return default
+    return get_value(data, key, value_types, path, nullable=True)
+
+
+def get_mapping(data: dict, key: str, path: str) -> dict:
+    """Gets a nested mapping from a parsed mapping"""
+    return get_value(data, key, (dict,), path)
+
+
+def get_list(data: dict, key: str, path: str) -> list:
+    """Gets a nested list from a parsed mapping"""
+    return get_value(data, key, (list,), path)
+
+
+def check_mapping(data, path: str) -> dict:
+    """Checks that an item of a parsed collection is a mapping"""
+    if type(data) is not dict:
+        raise ParsedHistoryError(path, f"expected dict, got {type(data).__name__}")
+    return data
+
+
+def check_player_name(name: str, players_names: set, path: str) -> str:
+    """Checks that a name refers to one of the players of the parsed history"""
+    if name not in players_names:
+        raise ParsedHistoryError(path, f"unknown player {name!r}")
+    return name
+
+
+@define(frozen=True)
+class ParsedPlayer:
+    """
+    This class represents a player of a parsed history
+
+    Attributes:
+        seat (int): The seat number of the player
+        name (str): The name of the player
+        init_stack (float): The stack of the player at the beginning of the hand
+        bounty (float): The bounty of the player
+        entered_hand (bool): Whether the player was dealt in the hand
+    """
+    seat = field()
+    name = field()
+    init_stack = field()
+    bounty = field()
+    entered_hand = field()
+
+    @classmethod
+    def from_dict(cls, data: dict, path: str = "players"):
+        """
+        Validates the data of a player and creates its record
+
+        Args:
+            data (dict): The parsed data of the player
+            path (str): The path of the player in the parsed history
+
+        Returns:
+            ParsedPlayer: The record of the player
+        """
+        check_mapping(data, path)
+        return cls(
+            seat=get_value(data, "seat", INTEGER, path),
+            name=get_value(data, "name", TEXT, path),
+            init_stack=get_value(data, "init_stack", NUMBER, path),
+            bounty=get_value(data, "bounty", NUMBER, path, nullable=True),
+            entered_hand=get_value(data, "entered_hand", BOOLEAN, path)
+        )
+
+
+@define(frozen=True)
+class ParsedPosting:
+    """
+    This class represents a blind or an ante posted in a parsed history
+
+    Attributes:
+        name (str): The name of the player posting
+        amount (float): The amount posted
+        blind_type (BlindType): The type of the posting
+    """
+    name = field()
+    amount = field()
+    blind_type = field()
+
+    @classmethod
+    def from_dict(cls, data: dict, path: str = "postings"):
+        """
+        Validates the data of a posting and creates its record
+
+        Args:
+            data (dict): The parsed data of the posting
+            path (str): The path of the posting in the parsed history
+
+        Returns:
+            ParsedPosting: The record of the posting
+        """
+        check_mapping(data, path)
+        blind_type_name = get_value(data, "blind_type", TEXT, path)
+        try:
+            blind_type = BLIND_TYPES[blind_type_name.upper()]
+        except KeyError:
+            raise ParsedHistoryError(f"{path}.blind_type", f"invalid blind type {blind_type_name!r}") from None
+        return cls(
+            name=get_value(data, "name", TEXT, path),
+            amount=get_value(data, "amount", NUMBER, path),
+            blind_type=blind_type
+        )
+
+
+@define(frozen=True)
+class ParsedAction:
+    """
+    This class represents an action played in a parsed history
+
+    Attributes:
+        player (str): The name of the player acting
+        move (ActionMove): The move played, one of fold, check, call, bet or raise
+        amount (float): The amount of the bet or raise
+        raise_total (float): The total amount of the bet or raise, None in older parsed files
+        is_all_in (bool): Whether the player is all-in after the action, False in older parsed files
+    """
+    player = field()
+    move = field()
+    amount = field()
+    raise_total = field()
+    is_all_in = field()
+
+    @classmethod
+    def from_dict(cls, data: dict, path: str = "actions"):
+        """
+        Validates the data of an action and creates its record
+
+        Args:
+            data (dict): The parsed data of the action
+            path (str): The path of the action in the parsed history
+
+        Returns:
+            ParsedAction: The record of the action
+        """
+        check_mapping(data, path)
+        move_name = get_value(data, "action", TEXT, path)
+        try:
+            move = PLAYED_MOVES[move_name.upper()]
+        except KeyError:
+            raise ParsedHistoryError(f"{path}.action", f"invalid action {move_name!r}") from None
+        return cls(
+            player=get_value(data, "player", TEXT, path),
+            move=move,
+            amount=get_value(data, "amount", NUMBER, path, nullable=True),
+            raise_total=get_optional_value(data, "raise_total", NUMBER, path),
+            is_all_in=get_optional_value(data, "is_all_in", BOOLEAN, path, default=False)
+        )
+
+
+@define(frozen=True)
+class ParsedShowdown:
+    """
+    This class represents the cards shown by a player in a parsed history
+
+    Attributes:
+        name (str): The name of the player
+        first_card (str): The first card of the player
+        second_card (str): The second card of the player
+    """
+    name = field()
+    first_card = field()
+    second_card = field()
+
+
+@define(frozen=True)
+class ParsedWinner:
+    """
+    This class represents a pot won by a player in a parsed history
+
+    Attributes:
+        name (str): The name of the player
+        amount (float): The amount won
+        pot_type (str): The type of the pot won
+    """
+    name = field()
+    amount = field()
+    pot_type = field()
+
+
+@define(frozen=True)
+class ParsedHistory:
+    """
+    This class represents a parsed hand history, validated against the schema of the parsed history files
+
+    Attributes:
+        hand_id (str): The id of the hand
+        hand_date (datetime): The date of the hand
+        game_type (str): The type of game
+        tournament_name (str): The name of the tournament
+        tournament_id (str): The id of the tournament
+        table_number (str): The number of the table
+        buy_in (float): The total buy-in of the tournament
+        level_value (int): The value of the blinds level
+        ante (float): The ante amount
+        sb (float): The small blind amount
+        bb (float): The big blind amount
+        max_players (int): The maximum number of players at the table
+        button_seat (int): The seat of the button
+        players (tuple): The ParsedPlayer records, in the order of the file
+        hero (str): The name of the hero
+        hero_first_card (str): The first card of the hero, if known
+        hero_second_card (str): The second card of the hero, if known
+        postings (tuple): The ParsedPosting records
+        actions (dict): The ParsedAction records of each street, by street name
+        flop_cards (tuple): The three flop cards, None when the flop was not dealt
+        turn_card (str): The turn card, if dealt
+        river_card (str): The river card, if dealt
+        showdown (tuple): The ParsedShowdown records
+        winners (tuple): The ParsedWinner records
+    """
+    hand_id = field()
+    hand_date = field()
+    game_type = field()
+    tournament_name = field()
+    tournament_id = field()
+    table_number = field()
+    buy_in = field()
+    level_value = field()
+    ante = field()
+    sb = field()
+    bb = field()
+    max_players = field()
+    button_seat = field()
+    players = field()
+    hero = field()
+    hero_first_card = field()
+    hero_second_card = field()
+    postings = field()
+    actions = field()
+    flop_cards = field()
+    turn_card = field()
+    river_card = field()
+    showdown = field()
+    winners = field()
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Validates a decoded parsed history in a single pass and creates its record
+
+        Args:
+            data (dict): The decoded parsed history
+
+        Returns:
+            ParsedHistory: The record of the parsed history
+
+        Raises:
+            ParsedHistoryError: If a field is missing, of an unexpected type or refers to an unknown player
+        """
+        check_mapping(data, "history")
+        tournament_info = get_mapping(data, "tournament_info", "history")
+        level = get_mapping(data, "level", "history")
+        hero_hand = get_mapping(data, "hero_hand", "history")
+        flop = get_mapping(data, "flop", "history")
+        actions_data = get_mapping(data, "actions", "history")
+        date_text = get_value(data, "datetime", TEXT, "history")
+        try:
+            hand_date = datetime.strptime(date_text, DATETIME_FORMAT)
+        except ValueError:
+            raise ParsedHistoryError("history.datetime", f"invalid date {date_text!r}") from None
+        players = tuple(
+            ParsedPlayer.from_dict(player_data, f"players.{seat}")
+            for seat, player_data in get_mapping(data, "players", "history").items()
+        )
+        players_names = {player.name for player in players}
+        postings = tuple(
+            ParsedPosting.from_dict(posting_data, f"postings[{index}]")
+            for index, posting_data in enumerate(get_list(data, "postings", "history"))
+        )
+        for index, posting in enumerate(postings):
+            check_player_name(posting.name, players_names, f"postings[{index}].name")
+        actions = {}
+        for street in STREETS_NAMES:
+            street_actions = tuple(
+                ParsedAction.from_dict(action_data, f"actions.{street}[{index}]")
+                for index, action_data in enumerate(get_list(actions_data, street, "actions"))
+            )
+            for index, action in enumerate(street_actions):
+                check_player_name(action.player, players_names, f"actions.{street}[{index}].player")
+            actions[street] = street_actions
+        showdown = tuple(
+            ParsedShowdown(
+                name=check_player_name(name, players_names, "showdown"),
+                first_card=get_value(check_mapping(hand, f"showdown.{name}"), "first_card", TEXT, f"showdown.{name}"),
+                second_card=get_value(hand, "second_card", TEXT, f"showdown.{name}")
+            )
+            for name, hand in get_mapping(data, "showdown", "history").items()
+        )
+        winners = tuple(
+            ParsedWinner(
+                name=name,
+                amount=get_value(check_mapping(win, f"winners.{name}"), "amount", NUMBER, f"winners.{name}"),
+                pot_type=get_value(win, "pot_type", TEXT, f"winners.{name}", nullable=True)
+            )
+            for name, win in get_mapping(data, "winners", "history").items()
+        )
+        flop_cards = (
+            get_value(flop, "flop_card_1", TEXT, "flop", nullable=True),
+            get_value(flop, "flop_card_2", TEXT, "flop", nullable=True),
+            get_value(flop, "flop_card_3", TEXT, "flop", nullable=True)
+        )
+        return cls(
+            hand_id=get_value(data, "hand_id", TEXT, "history"),
+            hand_date=hand_date,
+            game_type=get_value(data, "game_type", TEXT, "history"),
+            tournament_name=get_value(tournament_info, "tournament_name", TEXT, "tournament_info", nullable=True),
+            tournament_id=get_value(tournament_info, "tournament_id", TEXT, "tournament_info", nullable=True),
+            table_number=get_value(tournament_info, "table_number", TEXT, "tournament_info", nullable=True),
+            buy_in=get_value(data, "buy_in", NUMBER, "history"),
+            level_value=get_value(level, "value", INTEGER, "level"),
+            ante=get_value(level, "ante", NUMBER, "level"),
+            sb=get_value(level, "sb", NUMBER, "level"),
+            bb=get_value(level, "bb", NUMBER, "level"),
+            max_players=get_value(data, "max_players", INTEGER, "history"),
+            button_seat=get_value(data, "button_seat", INTEGER, "history"),
+            players=players,
+            hero=get_value(hero_hand, "hero", TEXT, "hero_hand", nullable=True),
+            hero_first_card=get_value(hero_hand, "first_card", TEXT, "hero_hand", nullable=True),
+            hero_second_card=get_value(hero_hand, "second_card", TEXT, "hero_hand", nullable=True),
+            postings=postings,
+            actions=actions,
+            flop_cards=flop_cards,
+            turn_card=get_value(get_mapping(data, "turn", "history"), "turn_card", TEXT, "turn", nullable=True),
+            river_card=get_value(get_mapping(data, "river", "history"), "river_card", TEXT, "river", nullable=True),
+            showdown=showdown,
+            winners=winners
+        )
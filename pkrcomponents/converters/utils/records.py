@@ -0,0 +1,170 @@
+"""This module contains compact records describing converted hands, detached from the Table that produced them.
+They only hold built-in values, so they are cheap to pickle between processes and to keep in memory."""
+from attrs import define, field
+
+from pkrcomponents.converters.utils.exceptions import HandConversionError
+
+
+@define(frozen=True)
+class PlayerRecord:
+    """
+    This class represents the result of a hand for one player
+
+    Attributes:
+        name (str): The name of the player
+        seat (int): The seat number of the player
+        position (str): The position of the player
+        init_stack (float): The stack of the player at the beginning of the hand
+        stack (float): The stack of the player at the end of the hand
+        bounty (float): The bounty of the player
+        combo (str): The combo of the player, if known
+        is_hero (bool): Whether the player is the hero
+        amount_won (float): The amount won by the player
+        chips_difference (float): The difference in chips after rewarding
+        amount_expected_won (float): The amount the player was expected to win (EV)
+    """
+    name = field()
+    seat = field()
+    position = field()
+    init_stack = field()
+    stack = field()
+    bounty = field()
+    combo = field()
+    is_hero = field()
+    amount_won = field()
+    chips_difference = field()
+    amount_expected_won = field()
+
+    @classmethod
+    def from_player(cls, player):
+        """
+        Creates a record from a table player
+
+        Args:
+            player (TablePlayer): The player to describe
+
+        Returns:
+            PlayerRecord: The record of the player
+        """
+        general_stats = player.hand_stats.general
+        return cls(
+            name=player.name,
+            seat=player.seat,
+            position=f"{player.position}" if player.position else None,
+            init_stack=player.init_stack,
+            stack=player.stack,
+            bounty=player.bounty,
+            combo=f"{player.combo}" if player.has_combo else None,
+            is_hero=player.is_hero,
+            amount_won=general_stats.amount_won,
+            chips_difference=general_stats.chips_difference,
+            amount_expected_won=general_stats.amount_expected_won
+        )
+
+
+@define(frozen=True)
+class HandRecord:
+    """
+    This class represents a converted hand
+
+    Attributes:
+        file_key (str): The key of the parsed history
+        hand_id (str): The ID of the hand
+        hand_date (datetime): The date of the hand
+        tournament_id (str): The ID of the tournament
+        tournament_name (str): The name of the tournament
+        max_players (int): The maximum number of players on the table
+        button_seat (int): The seat of the button
+        level (int): The level value
+        bb (float): The big blind of the level
+        ante (float): The ante of the level
+        board (tuple): The cards of the board
+        flop_class (int): The id of the suit-isomorphic class of the flop in the FlopTable, None without a flop
+        players (tuple): The records of every player of the hand
+    """
+    file_key = field()
+    hand_id = field()
+    hand_date = field()
+    tournament_id = field()
+    tournament_name = field()
+    max_players = field()
+    button_seat = field()
+    level = field()
+    bb = field()
+    ante = field()
+    board = field()
+    flop_class = field()
+    players = field()
+
+    @classmethod
+    def from_table(cls, file_key: str, table):
+        """
+        Creates a record from a converted table
+
+        Args:
+            file_key (str): The key of the parsed history
+            table (Table): The converted table
+
+        Returns:
+            HandRecord: The record of the hand
+        """
+        tournament = table.tournament
+        return cls(
+            file_key=file_key,
+            hand_id=table.hand_id,
+            hand_date=table.hand_date,
+            tournament_id=tournament.id if tournament else None,
+            tournament_name=tournament.name if tournament else None,
+            max_players=table.max_players,
+            button_seat=getattr(table.players, "button_seat", None),
+            level=table.level.value,
+            bb=table.level.bb,
+            ante=table.level.ante,
+            board=tuple(f"{card}" for card in table.board.card_slots if card is not None),
+            flop_class=table.board.flop.class_id,
+            players=tuple(PlayerRecord.from_player(player) for player in table.players)
+        )
+
+
+@define(frozen=True)
+class HandConversionFailure:
+    """
+    This class represents a hand that could not be converted
+
+    Attributes:
+        file_key (str): The key of the parsed history
+        error_type (str): The name of the original error
+        message (str): The message of the conversion error
+    """
+    file_key = field()
+    error_type = field()
+    message = field()
+
+    @classmethod
+    def from_error(cls, error: HandConversionError):
+        """
+        Creates a failure record from a conversion error
+
+        Args:
+            error (HandConversionError): The error raised during conversion
+
+        Returns:
+            HandConversionFailure: The failure record
+        """
+        original_exception = error.original_exception
+        error_type = type(original_exception).__name__ if original_exception else type(error).__name__
+        return cls(file_key=error.file_key, error_type=error_type, message=error.message)
+
+    @classmethod
+    def from_exception(cls, file_key: str, exception: Exception):
+        """
+        Creates a failure record from an unexpected exception, raised outside of the conversion of the hand itself
+
+        Args:
+            file_key (str): The key of the parsed history
+            exception (Exception): The exception raised
+
+        Returns:
+            HandConversionFailure: The failure record
+        """
+        return cls(file_key=file_key, error_type=type(exception).__name__, message=str(exception))
@@ -0,0 +1,282 @@
+"""This module exports the statistics of converted hands to columnar files.
+The statistics of every player are appended to column buffers, one row per player and per hand, and written in
+row groups to Parquet or Arrow IPC files, instead of building pandas DataFrames for every player of every hand.
+The schema of the files comes from the metadata of the statistics fields. Writing Parquet or Arrow files requires
+pyarrow, without it the statistics are written to CSV files by default."""
+import csv
+from importlib.util import find_spec
+from operator import attrgetter
+
+import pandas as pd
+from attrs import fields
+
+from pkrcomponents.components.players.street_hand_stats.general import GeneralPlayerHandStats
+from pkrcomponents.components.players.street_hand_stats.postflop import PostflopPlayerHandStats
+from pkrcomponents.components.players.street_hand_stats.preflop import PreflopPlayerHandStats
+
+STATS_CLASSES = (
+    ("general", GeneralPlayerHandStats),
+    ("preflop", PreflopPlayerHandStats),
+    ("flop", PostflopPlayerHandStats),
+    ("turn", PostflopPlayerHandStats),
+    ("river", PostflopPlayerHandStats),
+)
+KEY_COLUMNS = (("hand_id", "str"), ("player_name", "str"))
+NUMBER_TYPES = {
+    "bool": "bool_",
+    "decimal_10_5": "float64",
+    "decimal_15_2": "float64",
+    "float": "float64",
+    "tiny_int+": "int16",
+}
+ENUM_TYPES = ("ActionMove", "Position", "Street")
+FILE_FORMATS = ("parquet", "arrow", "csv")
+
+
+def get_stats_columns() -> tuple:
+    """
+    Returns the columns of the exported statistics, named like the columns of PlayerHandStats.to_dataframe
+
+    Returns:
+        tuple: The (column name, type) of every column, the type being the one of the field metadata
+    """
+    stats_columns = tuple((f"{group}_{attribute.name}", attribute.metadata.get("type", "str"))
+                          for group, stats_class in STATS_CLASSES for attribute in fields(stats_class))
+    return KEY_COLUMNS + stats_columns
+
+
+STATS_COLUMNS = get_stats_columns()
+STATS_GETTERS = tuple((group, attrgetter(*(attribute.name for attribute in fields(stats_class))))
+                      for group, stats_class in STATS_CLASSES)
+
+
+def encode_values(values, value_type: str) -> list:
+    """
+    Encodes the values of a column, as strings when they are not numbers or flags
+
+    Args:
+        values (Iterable): The values of the column
+        value_type (str): The type of the column, as in the field metadata
+
+    Returns:
+        list: The values, with enum members replaced by their name and other objects by their string
+    """
+    if value_type in NUMBER_TYPES:
+        return list(values)
+    if value_type in ENUM_TYPES:
+        return [None if value is None else value.name for value in values]
+    return [None if value is None else f"{value}" for value in values]
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow, which is only needed to write columnar files
+
+    Returns:
+        module: The pyarrow module
+    """
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError("Writing hand stats files requires pyarrow: pip install pkrcomponents[parquet]") from error
+    return pyarrow
+
+
+def get_default_file_format() -> str:
+    """
+    Returns the format of the exported files when none is given
+
+    Returns:
+        str: "parquet" when pyarrow is installed, "csv" otherwise
+    """
+    return "parquet" if find_spec("pyarrow") is not None else "csv"
+
+
+def get_arrow_schema():
+    """
+    Returns the Arrow schema of the exported statistics
+
+    Returns:
+        pyarrow.Schema: The schema, with strings for the statistics that are not numbers or flags
+    """
+    pa = import_pyarrow()
+    return pa.schema([(name, getattr(pa, NUMBER_TYPES.get(value_type, "string"))())
+                      for name, value_type in STATS_COLUMNS])
+
+
+class HandStatsColumns:
+    """
+    Column buffers of the statistics of converted hands, with one row per player and per hand
+
+    Methods:
+        add_player: adds the statistics of a player
+        add_table: adds the statistics of every player of a converted table
+        get_columns: returns the buffered values, column by column
+        iter_rows: yields the buffered values, row by row
+        to_dataframe: returns the buffered statistics as one DataFrame
+        to_arrow: returns the buffered statistics as one Arrow table
+        clear: empties the buffers
+    """
+
+    def __init__(self):
+        self.values = tuple([] for _ in STATS_COLUMNS)
+
+    def __len__(self):
+        return len(self.values[0])
+
+    def add_player(self, hand_id: str, player):
+        """
+        Adds the statistics of a player to the buffers
+
+        Args:
+            hand_id (str): The ID of the hand
+            player (TablePlayer): The player whose statistics are added
+        """
+        stats = player.hand_stats
+        row = (hand_id, player.name)
+        for group, getter in STATS_GETTERS:
+            row += getter(getattr(stats, group))
+        for column_values, value in zip(self.values, row):
+            column_values.append(value)
+
+    def add_table(self, table):
+        """
+        Adds the statistics of every player of a converted table to the buffers
+
+        Args:
+            table (Table): The converted table
+        """
+        for player in table.players:
+            self.add_player(table.hand_id, player)
+
+    def get_columns(self) -> dict:
+        """
+        Returns the buffered values column by column, with the values that are not numbers or flags encoded
+
+        Returns:
+            dict: The list of values of every column
+        """
+        return {name: encode_values(column_values, value_type)
+                for (name, value_type), column_values in zip(STATS_COLUMNS, self.values)}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the buffered statistics as one DataFrame
+
+        Returns:
+            pd.DataFrame: The statistics, one row per player and per hand
+        """
+        return pd.DataFrame(self.get_columns(), columns=[name for name, _ in STATS_COLUMNS])
+
+    def to_arrow(self):
+        """
+        Returns the buffered statistics as one Arrow table
+
+        Returns:
+            pyarrow.Table: The statistics, one row per player and per hand
+        """
+        pa = import_pyarrow()
+        return pa.table(self.get_columns(), schema=get_arrow_schema())
+
+    def iter_rows(self):
+        """
+        Yields the buffered statistics row by row, with the values that are not numbers or flags encoded
+
+        Yields:
+            tuple: The values of a row, in the order of the columns
+        """
+        yield from zip(*self.get_columns().values())
+
+    def clear(self):
+        """Empties the buffers"""
+        for column_values in self.values:
+            column_values.clear()
+
+
+class HandStatsWriter:
+    """
+    Writes the statistics of converted hands to a Parquet, Arrow IPC or CSV file, one row group at a time
+
+    Attributes:
+        path (str): The path of the written file
+        file_format (str): "parquet", "arrow" or "csv", "parquet" by default when pyarrow is installed, else "csv"
+        row_group_size (int): The number of rows buffered before they are written as a row group
+        nb_rows (int): The number of rows already written
+
+    Methods:
+        add_table: adds the statistics of every player of a converted table
+        flush: writes the buffered rows as a row group
+        close: writes the remaining rows and closes the file
+    """
+
+    def __init__(self, path: str, file_format: str = None, row_group_size: int = 100_000):
+        if file_format is None:
+            file_format = get_default_file_format()
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"file_format must be one of {FILE_FORMATS}, not {file_format}")
+        self.path = path
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.nb_rows = 0
+        self.columns = HandStatsColumns()
+        self._writer = None
+        self._file = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_writer(self):
+        if self.file_format == "csv":
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            writer = csv.writer(self._file)
+            writer.writerow(name for name, _ in STATS_COLUMNS)
+            return writer
+        pa = import_pyarrow()
+        schema = get_arrow_schema()
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(self.path, schema)
+        return pa.ipc.new_file(self.path, schema)
+
+    def add_table(self, table):
+        """
+        Adds the statistics of every player of a converted table, and writes a row group when the buffers are full
+
+        Args:
+            table (Table): The converted table
+        """
+        self.columns.add_table(table)
+        if len(self.columns) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows as a row group"""
+        if not len(self.columns):
+            return
+        if self._writer is None:
+            self._writer = self._open_writer()
+        if self.file_format == "csv":
+            self._writer.writerows(self.columns.iter_rows())
+        else:
+            self._writer.write_table(self.columns.to_arrow())
+        self.nb_rows += len(self.columns)
+        self.columns.clear()
+
+    def close(self):
+        """Writes the remaining rows and closes the file, which is written with its schema even without rows"""
+        if self._closed:
+            return
+        self.flush()
+        if self._writer is None:
+            self._writer = self._open_writer()
+        if self._file is None:
+            self._writer.close()
+        else:
+            self._file.close()
+            self._file = None
+        self._writer = None
+        self._closed = True
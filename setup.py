@@ -38,6 +38,8 @@ setup(
     url="https://github.com/manggy94/PokerComponents",
     license="MIT",
     packages=find_packages(exclude=["tests", ".venv", "venv", "venv.*"]),
+    include_package_data=True,
     install_requires=install_requires,
+    extras_require={"msgspec": ["msgspec"], "parquet": ["pyarrow"], "zstd": ["zstandard"]},
     tests_require=["pytest", "pytest-cov", "coverage", "coveralls"],
 )
@@ -0,0 +1,65 @@
+"""This module compares the time needed to list and read parsed histories stored one per file,
+and read straight from zip and tar.gz archives."""
+
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+from pkrcomponents.converters.utils.json_decoders import get_json_decoder
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+ARCHIVE_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "archive_speed_results.txt")
+
+
+def write_inputs(tmp_dir, nb_copies):
+    files_dir = os.path.join(tmp_dir, "files", "data", "histories", "parsed")
+    os.makedirs(files_dir)
+    file_names = sorted(os.listdir(FILES_DIR))
+    for copy in range(nb_copies):
+        for file_name in file_names:
+            shutil.copy(os.path.join(FILES_DIR, file_name), os.path.join(files_dir, f"{copy}_{file_name}"))
+    archives_dir = os.path.join(tmp_dir, "{}", "data", "histories", "parsed")
+    os.makedirs(archives_dir.format("zip"))
+    os.makedirs(archives_dir.format("tar.gz"))
+    zip_path = os.path.join(archives_dir.format("zip"), "hands.zip")
+    tar_path = os.path.join(archives_dir.format("tar.gz"), "hands.tar.gz")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as archive, tarfile.open(tar_path, "w:gz") as tar_archive:
+        for file_name in sorted(os.listdir(files_dir)):
+            archive.write(os.path.join(files_dir, file_name), file_name)
+            tar_archive.add(os.path.join(files_dir, file_name), file_name)
+    return len(file_names) * nb_copies
+
+
+def get_reading_time(data_dir):
+    converter = LocalHandHistoryConverter(data_dir)
+    decoder = get_json_decoder()
+    start = time.perf_counter()
+    nb_hands = 0
+    for parsed_key in converter.iter_parsed_histories_keys():
+        decoder.decode(converter.read_data_bytes(parsed_key))
+        nb_hands += 1
+    return (time.perf_counter() - start) / nb_hands
+
+
+def speed_test(results_path, nb_copies=200):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        nb_hands = write_inputs(tmp_dir, nb_copies)
+        lines = [f"{nb_hands} hands listed, read and decoded\n"]
+        for label in ("files", "zip", "tar.gz"):
+            reading_time = get_reading_time(os.path.join(tmp_dir, label, "data"))
+            lines.append(f"{label}: {reading_time * 1e6:.1f} microseconds per parsed history\n")
+            print(lines[-1])
+    finally:
+        shutil.rmtree(tmp_dir)
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=ARCHIVE_SPEED_RESULTS_PATH)
@@ -18,6 +18,11 @@ class MyBitCardTestCase(unittest.TestCase):
         self.assertIsInstance(bc3.binary_string, str)
         self.assertEqual(bc4.binary_string, "0000\t0000\t0000\t1000\t0001\t0011\t0000\t0111")
 
+    def test_index(self):
+        for card in bitcard.Card:
+            self.assertEqual(bitcard.BitCard(card).index, card.index)
+            self.assertEqual(bitcard.BitCard.from_index(card.index), bitcard.BitCard(card))
+
     def test_cards_to_int(self):
         self.assertIsInstance(bitcard.BitCard.cards_to_int(("As", "Ad")), list)
         self.assertEqual(bitcard.BitCard.cards_to_int(("As", "Ad", "Jd")), [268471337, 268446761, 33564957])
@@ -53,6 +53,19 @@ class MyBoardTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.board4.add("8s")
 
+    def test_indexes(self):
+        self.assertEqual(self.board.indexes, ())
+        self.assertEqual(self.board5.indexes, tuple(card.index for card in self.board5.card_slots[:4]))
+        self.board.add("Qs")
+        self.assertEqual(self.board.indexes, (Card("Qs").index,))
+        self.board.reset()
+        self.assertEqual(self.board.indexes, ())
+        self.board.river = "Ah"
+        self.assertEqual(self.board.indexes, (Card("Ah").index,))
+        self.board.turn = "Kh"
+        self.assertEqual(self.board.indexes, (Card("Kh").index, Card("Ah").index))
+        self.assertEqual(self.board.card_slots, (None, None, None, Card("Kh"), Card("Ah")))
+
     def test_to_json(self):
         self.assertIsInstance(self.board.to_json(), dict)
         self.assertEqual(self.board.to_json(), {
@@ -98,6 +111,12 @@ class MyBoardTestCase(unittest.TestCase):
             'river': 'nan'
         })
 
+    def test_to_series(self):
+        self.assertIsInstance(self.board.to_series(), pd.Series)
+        self.assertTrue(self.board.to_series().isna().all())
+        self.assertEqual(self.board5.to_series()["turn"], Card("Ac"))
+        self.assertTrue(pd.isna(self.board5.to_series()["river"]))
+
     def test_reset(self):
         self.board2.reset()
         self.assertEqual(len(self.board2), 0)
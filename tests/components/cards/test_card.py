@@ -62,6 +62,13 @@ class MyCardTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             c1 < a
 
+    def test_interning(self):
+        self.assertIs(card.Card("Kd"), card.Card("Kd"))
+        self.assertIs(card.Card("kd"), card.Card("Kd"))
+        self.assertIs(card.Card.from_index(card.Card("Kd").index), card.Card("Kd"))
+        self.assertEqual([c.index for c in self.all_cards], list(range(52)))
+        self.assertEqual(len({hash(c) for c in self.all_cards}), 52)
+
     def test_is_face(self):
         self.assertTrue(card.Card("Ks").is_face)
         self.assertFalse(card.Card("As").is_face)
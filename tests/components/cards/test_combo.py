@@ -44,7 +44,16 @@ class MyComboTestCase(unittest.TestCase):
 
     def test_hash(self):
         c1 = Combo("AsAd")
-        self.assertEqual(c1.__hash__(), c1.first.__hash__() + c1.second.__hash__())
+        self.assertEqual(c1.__hash__(), c1.index)
+        self.assertEqual(len({hash(combo) for combo in Combo}), 1326)
+
+    def test_interning(self):
+        self.assertIs(Combo("AsKd"), Combo("KdAs"))
+        self.assertIs(Combo("AsKd"), Combo.from_cards(Card("Kd"), "As"))
+        self.assertIs(Combo.from_index(Combo("AsKd").index), Combo("AsKd"))
+        self.assertEqual([combo.index for combo in Combo], list(range(1326)))
+        self.assertRaises(ValueError, lambda: Combo("Asas"))
+        self.assertIs(Combo.from_card_indexes(Card("Kd").index, Card("As").index), Combo("AsKd"))
 
     def test_eq(self):
         c4 = Combo("AsJs")
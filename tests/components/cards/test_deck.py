@@ -13,13 +13,16 @@ class MyDeckTestCase(unittest.TestCase):
     def test_shuffle(self):
         deck = pkrcomponents.components.cards.deck.Deck()
         deck.shuffle()
-        self.assertFalse(deck.cards[0:4] == [card.Card('2c'), card.Card('2d'), card.Card('2h'), card.Card('2s')])
         self.assertEqual(len(deck.cards), 52)
+        drawn_cards = [deck.draw() for _ in range(52)]
+        self.assertFalse(drawn_cards[0:4] == [card.Card('2c'), card.Card('2d'), card.Card('2h'), card.Card('2s')])
+        self.assertCountEqual(drawn_cards, list(card.Card))
+        self.assertEqual(len(deck.cards), 0)
 
     def test_reset(self):
         deck = pkrcomponents.components.cards.deck.Deck()
-        deck.cards.pop()
-        deck.cards.pop()
+        deck.draw()
+        deck.draw()
         self.assertEqual(len(deck.cards), 50)
         deck.reset()
         self.assertEqual(len(deck.cards), 52)
@@ -34,7 +37,23 @@ class MyDeckTestCase(unittest.TestCase):
         c2 = deck.draw("As")
         self.assertEqual(c2, card.Card("As"))
         self.assertNotIn(c2, deck.cards)
+        self.assertNotIn(c2.index, deck.indexes)
         self.assertEqual(len(deck.cards), 51)
+        with self.assertRaises(ValueError):
+            deck.draw("As")
+        drawn = {deck.draw() for _ in range(51)}
+        self.assertEqual(len(drawn), 51)
+        self.assertEqual(len(deck), 0)
+        with self.assertRaises(IndexError):
+            deck.draw()
+
+    def test_contains(self):
+        deck = pkrcomponents.components.cards.deck.Deck()
+        self.assertIn("As", deck)
+        deck.draw("As")
+        self.assertNotIn("As", deck)
+        self.assertIn(card.Card("Ad"), deck)
+        self.assertEqual(deck.indexes, [index for index in range(52) if index != card.Card("As").index])
 
     def test_to_json(self):
         self.assertIsInstance(pkrcomponents.components.cards.deck.Deck().to_json(), dict)
@@ -0,0 +1,106 @@
+import unittest
+
+from pkrcomponents.components.cards.combo import Combo
+from pkrcomponents.components.cards.equity import EquityCalculator, EquityResult, RangeEquityCalculator, \
+    _cached_equities, all_in_equities
+from pkrcomponents.components.cards.hand import Hand
+from pkrcomponents.components.cards.hand_range import Range
+
+
+class MyEquityCalculatorTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.calculator = EquityCalculator(seed=42)
+
+    def test_exhaustive_equity(self):
+        result = self.calculator.exhaustive_equity([Combo("AsKs"), Combo("QhQd")], ["2s", "3s", "Jh", "Td"])
+        self.assertIsInstance(result, EquityResult)
+        self.assertTrue(result.is_exact)
+        self.assertEqual(result.nb_runouts, 44)
+        self.assertAlmostEqual(result.equities[0], 16 / 44)
+        self.assertAlmostEqual(result.equities[1], 28 / 44)
+
+    def test_split_pot(self):
+        result = self.calculator.exhaustive_equity(["AsKs", "AhKh"], ["2c", "3d", "4h", "9s", "9c"])
+        self.assertEqual(result.nb_runouts, 1)
+        self.assertEqual(result.equities, (0.5, 0.5))
+
+    def test_multiway(self):
+        result = self.calculator.equity(["AsAh", "KdKc", "QsJs"], ["2c", "7d", "9h"])
+        self.assertTrue(result.is_exact)
+        self.assertEqual(result.nb_runouts, 903)
+        self.assertEqual(len(result.equities), 3)
+        self.assertAlmostEqual(sum(result.equities), 1)
+        self.assertGreater(result.equities[0], result.equities[1])
+
+    def test_monte_carlo_equity(self):
+        exact = self.calculator.exhaustive_equity(["AsAh", "KdKc"], ["2c", "7d", "9h"])
+        result = self.calculator.monte_carlo_equity(["AsAh", "KdKc"], ["2c", "7d", "9h"], precision=0.002)
+        self.assertFalse(result.is_exact)
+        self.assertAlmostEqual(sum(result.equities), 1)
+        self.assertAlmostEqual(result.equities[0], exact.equities[0], delta=0.01)
+        seeded = EquityCalculator(seed=42).monte_carlo_equity(["AsAh", "KdKc"], ["2c", "7d", "9h"], precision=0.002)
+        self.assertEqual(result, seeded)
+
+    def test_equity_mode(self):
+        self.assertFalse(self.calculator.equity(["AsAh", "KdKc"]).is_exact)
+        self.assertTrue(self.calculator.equity(["AsAh", "KdKc"], ["2c", "7d", "9h", "Ts"]).is_exact)
+        calculator = EquityCalculator(max_exhaustive_runouts=10)
+        self.assertFalse(calculator.equity(["AsAh", "KdKc"], ["2c", "7d", "9h"]).is_exact)
+
+    def test_all_in_equities(self):
+        _cached_equities.cache_clear()
+        equities = all_in_equities(["KdKc", "AsAh"], ["9h", "2c", "7d"])
+        exact = self.calculator.exhaustive_equity(["KdKc", "AsAh"], ["2c", "7d", "9h"])
+        self.assertEqual(equities, exact.equities)
+        self.assertEqual(all_in_equities([Combo("AsAh"), Combo("KdKc")], ["2c", "7d", "9h"]), equities[::-1])
+        self.assertEqual(_cached_equities.cache_info().hits, 1)
+        self.assertEqual(_cached_equities.cache_info().misses, 1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.calculator.equity(["AsAh"])
+        with self.assertRaises(ValueError):
+            self.calculator.equity(["AsAh", "AsKc"])
+        with self.assertRaises(ValueError):
+            self.calculator.equity(["AsAh", "KdKc"], ["Ah", "7d", "9h"])
+
+
+
+class MyRangeEquityCalculatorTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.calculator = RangeEquityCalculator(seed=42)
+
+    def test_combos_equity(self):
+        result = self.calculator.equity("AsAh", "KdKc", ["2c", "7d", "9h"])
+        exact = EquityCalculator().exhaustive_equity(["AsAh", "KdKc"], ["2c", "7d", "9h"])
+        self.assertTrue(result.is_exact)
+        self.assertAlmostEqual(result.equities[0], exact.equities[0])
+
+    def test_ranges_equity(self):
+        board = ["2s", "7s", "9s"]
+        pairs = [(aces, kings) for aces in Combo.from_hand(Hand("AA")) for kings in Combo.from_hand(Hand("KK"))]
+        expected = sum(EquityCalculator().exhaustive_equity(pair, board).equities[0] for pair in pairs) / len(pairs)
+        result = self.calculator.equity(Range.from_string("AA"), "KK", board)
+        self.assertAlmostEqual(result.equities[0], expected)
+        self.assertAlmostEqual(sum(result.equities), 1)
+        result = self.calculator.equity("top 50%", "top 50%", ["Ks", "Qd", "2h"])
+        self.assertAlmostEqual(result.equities[0], 0.5)
+
+    def test_preflop_equity(self):
+        result = self.calculator.equity("AsAh", "KdKc")
+        self.assertFalse(result.is_exact)
+        self.assertAlmostEqual(result.equities[0], 0.8126, delta=0.04)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.calculator.equity("AA", "KK", ["2s", "7s"])
+        with self.assertRaises(ValueError):
+            self.calculator.equity("AsAh", "KK", ["As", "7s", "9s"])
+        with self.assertRaises(ValueError):
+            self.calculator.equity("AsAh", "AsKs", ["2s", "7s", "9s"])
+
+
+if __name__ == '__main__':
+    unittest.main()
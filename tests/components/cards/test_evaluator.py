@@ -1,6 +1,10 @@
+import itertools
 import unittest
+import numpy as np
 import pkrcomponents.components.cards.evaluator as evaluator
-from pkrcomponents.components.cards.lookup_table import LookupTable
+from pkrcomponents.components.cards.bitcard import BitCard
+from pkrcomponents.components.cards.card import Card
+from pkrcomponents.components.cards.lookup_table import LookupTable, SevenCardLookupTable
 
 
 class MyEvaluatorTestCase(unittest.TestCase):
@@ -23,11 +27,79 @@ class MyEvaluatorTestCase(unittest.TestCase):
         self.assertIsInstance(evaluator.Evaluator.get_rank_class(487), int)
         self.assertEqual(evaluator.Evaluator.get_rank_class(487), 4)
         self.assertEqual(evaluator.Evaluator.get_rank_class(11), 2)
+        self.assertEqual(evaluator.Evaluator.get_rank_classes([487, 11, 7462, 1]).tolist(), [4, 2, 9, 1])
+        for hand_rank in (0, -1, 7463):
+            with self.assertRaises(ValueError):
+                evaluator.Evaluator.get_rank_class(hand_rank)
+        self.assertEqual(evaluator.Evaluator.get_rank_classes([0, -1, 7463, 487]).tolist(), [0, 0, 0, 4])
+        hand_ranks = evaluator.SevenCardEvaluator.evaluate_many([[0, 0], [0, 1]], [[0, 0, 0, 0, 0], [2, 3, 4, 5, 6]])
+        self.assertEqual(evaluator.Evaluator.get_rank_classes(hand_ranks)[0], 0)
         self.assertIsInstance(evaluator.Evaluator.score_to_string(487), str)
         self.assertEqual(evaluator.Evaluator.score_to_string(487), "Flush")
         self.assertIsInstance(evaluator.Evaluator.get_five_card_rank_percentage(487), float)
         self.assertEqual(evaluator.Evaluator.get_five_card_rank_percentage(487), 1 - 487 / 7462)
 
+    def test_evaluate_many(self):
+        cards = list(Card)
+        index = {card: i for i, card in enumerate(cards)}
+        rng = np.random.default_rng(42)
+        for board_size in (3, 4, 5):
+            hands = np.array([rng.permutation(52)[:2 + board_size] for _ in range(300)])
+            scores = self.ev.evaluate_many(hands[:, :2], hands[:, 2:])
+            self.assertIsInstance(scores, np.ndarray)
+            self.assertEqual(scores.shape, (300,))
+            expected = [self.ev.evaluate([cards[i] for i in hand[:2]], [cards[i] for i in hand[2:]]) for hand in hands]
+            self.assertEqual(scores.tolist(), expected)
+        royal_flush = [[index[Card("Js")], index[Card("Qs")]]], [[index[Card(c)] for c in ("As", "Ks", "Ts")]]
+        self.assertEqual(self.ev.evaluate_many(*royal_flush).tolist(), [1])
+        with self.assertRaises(ValueError):
+            self.ev.evaluate_many([[0, 1]], [[2, 3]])
+
+
+
+class MySevenCardEvaluatorTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.ev = evaluator.SevenCardEvaluator()
+
+    def test_new(self):
+        self.assertIsInstance(self.ev, evaluator.Evaluator)
+        self.assertIsInstance(self.ev.get_lookup_table(), SevenCardLookupTable)
+        self.assertIs(self.ev.get_lookup_table(), evaluator.SevenCardEvaluator.get_lookup_table())
+
+    def test_eval(self):
+        self.assertEqual(self.ev.evaluate(board=["As", "Kd", "Ts", "Js", "Qs"], cards=["9s", "8h"]), 487)
+        self.assertEqual(self.ev.evaluate(board=["As", "Kd", "Ts", "Js", "Qs"], cards=["9s", "8s"]), 3)
+        self.assertEqual(self.ev.evaluate(board=["As", "2c", "Ts", "Js", "Qs"], cards=["2h", "5h"]), 5976)
+        self.assertEqual(self.ev.evaluate(board=(Card("As"), Card("Ks"), Card("Ts")), cards=("Js", "Qs")), 1)
+        self.assertEqual(self.ev.evaluate(board=["As", "Kd", "Ts", "Js"], cards=["Qs", "2c"]), 1600)
+
+    def test_eval_non_canonical_cards(self):
+        for board, cards in ((["as", "kd", "TS", "Js", "qs"], ["9S", "8h"]),
+                             ([BitCard("As"), BitCard("Kd"), BitCard("Ts")], [int(BitCard("Js")), int(BitCard("Qs"))]),
+                             ([Card("As"), "kD", BitCard("Ts")], ["JS", "Qs"])):
+            self.assertEqual(self.ev.evaluate(cards, board), evaluator.Evaluator.evaluate(cards, board))
+        self.assertEqual(self.ev.get_card_key("as"), self.ev.get_card_key(Card("As")))
+        with self.assertRaises(ValueError):
+            self.ev.evaluate(["Xs", "As"], ["Kd", "Ts", "Js"])
+
+    def test_same_ranks_as_evaluator(self):
+        cards = list(Card)
+        for board in itertools.islice(itertools.combinations(cards[::3], 5), 0, 2000, 7):
+            for hole_cards in (cards[1:3], cards[40:42], [cards[2], cards[50]]):
+                if set(hole_cards) & set(board):
+                    continue
+                for street_board in (board, board[:4], board[:3]):
+                    self.assertEqual(self.ev.evaluate(hole_cards, street_board),
+                                     evaluator.Evaluator.evaluate(hole_cards, list(street_board)))
+
+    def test_evaluate_indexes(self):
+        board, cards = [Card("As"), Card("Kd"), Card("Ts"), Card("Js"), Card("Qs")], [Card("9s"), Card("8h")]
+        board_indexes, cards_indexes = [card.index for card in board], [card.index for card in cards]
+        self.assertEqual(self.ev.evaluate_indexes(cards_indexes, board_indexes), self.ev.evaluate(cards, board))
+        self.assertEqual(evaluator.Evaluator.evaluate_indexes(cards_indexes, board_indexes[:4]),
+                         self.ev.evaluate(cards, board[:4]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from itertools import combinations
+
+import numpy as np
+
+from pkrcomponents.components.cards.card import Card
+from pkrcomponents.components.cards.flop import Flop
+from pkrcomponents.components.cards.flop_table import FlopTable, NB_FLOP_CLASSES, get_flop_table
+
+
+class MyFlopTableTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.flop_table = get_flop_table()
+
+    def test_new(self):
+        self.assertIsInstance(self.flop_table, FlopTable)
+        self.assertIs(self.flop_table, get_flop_table())
+        self.assertEqual(len(self.flop_table.representatives), NB_FLOP_CLASSES)
+        self.assertEqual(len(self.flop_table.features), NB_FLOP_CLASSES)
+        self.assertEqual(self.flop_table.features.nb_flops.sum(), 22100)
+
+    def test_get_class_id(self):
+        class_id = self.flop_table.get_class_id(["As", "Ks", "Qs"])
+        self.assertEqual(self.flop_table.get_class_id(["Qh", "Ah", "Kh"]), class_id)
+        self.assertEqual(self.flop_table.get_class_id(Flop("Ac", "Kc", "Qc")), class_id)
+        self.assertNotEqual(self.flop_table.get_class_id(["As", "Ks", "Qh"]), class_id)
+        self.assertEqual(self.flop_table.features[class_id].nb_flops, 4)
+        self.assertEqual(self.flop_table.get_class_id([Card("As").index, Card("Kd").index, Card("7h").index]),
+                         self.flop_table.get_class_id(["Ad", "Kc", "7s"]))
+        with self.assertRaises(ValueError):
+            self.flop_table.get_class_id([0, 0, 1])
+
+    def test_get_class_ids(self):
+        flops = np.array(list(combinations(range(52), 3))[::100])
+        class_ids = self.flop_table.get_class_ids(flops)
+        self.assertEqual(class_ids.tolist(), [self.flop_table.get_class_id(flop) for flop in flops])
+        self.assertEqual(self.flop_table.get_class_ids([[3, 3, 5]]).tolist(), [-1])
+
+    def test_features(self):
+        for flop in Flop.all_flops[::37]:
+            features = self.flop_table.features[flop.class_id]
+            self.assertEqual(features.is_rainbow, flop.is_rainbow)
+            self.assertEqual(features.is_monotone, flop.is_monotone)
+            self.assertEqual(features.is_paired, flop.is_paired)
+            self.assertEqual(features.has_straight_draw, flop.has_straight_draw)
+            self.assertEqual(features.has_gutshot, flop.has_gutshot)
+            self.assertEqual(features.min_distance, flop.min_distance)
+            self.assertEqual(features.max_distance, flop.max_distance)
+            self.assertEqual(features.high_card, flop.first_card.rank.ordinal)
+        self.assertIsNone(Flop().class_id)
+        self.assertIsNone(Flop().features)
+
+
+if __name__ == '__main__':
+    unittest.main()
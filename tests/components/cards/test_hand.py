@@ -27,6 +27,11 @@ class MyHandTestCase(unittest.TestCase):
     def test_all_hands_length(self):
         self.assertEqual(len(Hand.all_hands), 169)
 
+    def test_index(self):
+        self.assertEqual([hand.index for hand in Hand], list(range(169)))
+        self.assertEqual(Hand.from_index(Hand("AKs").index), Hand("AKs"))
+        self.assertEqual(Hand("22").index, 156)
+
     def test_all_hands_shapes(self):
         for hand in Hand.all_hands:
             self.assertIn(hand.shape, list(Shape))
@@ -0,0 +1,52 @@
+import unittest
+
+from pkrcomponents.components.cards.combo import Combo
+from pkrcomponents.components.cards.hand_range import HANDS_BY_STRENGTH, Range
+
+
+class MyRangeTestCase(unittest.TestCase):
+
+    def test_hands_by_strength(self):
+        self.assertEqual(len(HANDS_BY_STRENGTH), 169)
+        self.assertEqual(len(set(HANDS_BY_STRENGTH)), 169)
+        self.assertEqual(HANDS_BY_STRENGTH[0], "AA")
+        self.assertEqual(HANDS_BY_STRENGTH[-1], "32o")
+
+    def test_from_string(self):
+        self.assertEqual(len(Range.from_string("22+")), 78)
+        self.assertEqual(len(Range.from_string("A2s+")), 48)
+        self.assertEqual(len(Range.from_string("AK")), 16)
+        self.assertEqual(len(Range.from_string("KTo+")), 36)
+        self.assertEqual(len(Range.from_string("99-66")), 24)
+        self.assertEqual(len(Range.from_string("T9s-65s")), 20)
+        self.assertEqual(len(Range.from_string("A5s-A2s")), 16)
+        self.assertEqual(len(Range.from_string("AsKs")), 1)
+        hand_range = Range.from_string("22+, A2s+, KQo:0.5, AsKs")
+        self.assertEqual(len(hand_range), 138)
+        self.assertEqual(hand_range.nb_combos, 132)
+        self.assertEqual(hand_range.weights[Combo("KsQd")], 0.5)
+        self.assertIn("AhAd", hand_range)
+        self.assertNotIn("KsQs", hand_range)
+        with self.assertRaises(ValueError):
+            Range.from_string("T9s-65o")
+        with self.assertRaises(ValueError):
+            Range.from_string("AKo:2")
+
+    def test_from_top(self):
+        self.assertEqual(len(Range.from_top(100)), 1326)
+        self.assertEqual(len(Range.from_top(0)), 0)
+        top_range = Range.from_string("top 15%")
+        self.assertEqual(top_range, Range.from_top(15))
+        self.assertGreaterEqual(len(top_range), 0.15 * 1326)
+        self.assertIn("AsAh", top_range)
+        self.assertNotIn("7c2d", top_range)
+
+    def test_without_dead_cards(self):
+        hand_range = Range.from_string("AA,KK")
+        self.assertEqual(len(hand_range.without_dead_cards(["As"])), 9)
+        self.assertEqual(len(hand_range.without_dead_cards(["As", "Ah", "Kd"])), 4)
+        self.assertEqual(len(hand_range), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+import numpy as np
 import pkrcomponents.components.cards.lookup_table as lookup
 
 
@@ -7,6 +10,58 @@ class MyTestCase(unittest.TestCase):
         lk_table = lookup.LookupTable()
         self.assertIsInstance(lk_table, lookup.LookupTable)
 
+    def test_seven_card_table(self):
+        lk_table = lookup.SevenCardLookupTable()
+        self.assertEqual(len(lk_table.flush_lookup), 8192)
+        self.assertEqual(lk_table.flush_lookup[0b1111100000000], 1)
+        self.assertEqual(lk_table.flush_lookup[0b1111110000000], 1)
+        self.assertEqual(lk_table.flush_lookup[0b11], 0)
+        self.assertEqual(min(lk_table.unsuited_lookup.values()), lookup.LookupTable.MAX_STRAIGHT_FLUSH + 1)
+        self.assertEqual(max(lk_table.unsuited_lookup.values()), lookup.LookupTable.MAX_HIGH_CARD)
+
+
+    def test_array_table(self):
+        lk_table = lookup.ArrayLookupTable()
+        self.assertEqual(lk_table.flush_lookup.shape, (8192,))
+        self.assertTrue((lk_table.unsuited_keys[1:] > lk_table.unsuited_keys[:-1]).all())
+        self.assertEqual(lk_table.unsuited_keys.shape, lk_table.unsuited_ranks.shape)
+        self.assertEqual(lk_table.card_primes.shape, (52,))
+
+    def test_rank_classes(self):
+        self.assertEqual(len(lookup.LookupTable.RANK_TO_RANK_CLASS), lookup.LookupTable.MAX_HIGH_CARD + 1)
+        for hand_rank in range(1, lookup.LookupTable.MAX_HIGH_CARD + 1):
+            max_rank = min(rank for rank in lookup.LookupTable.MAX_TO_RANK_CLASS if hand_rank <= rank)
+            self.assertEqual(lookup.LookupTable.RANK_TO_RANK_CLASS[hand_rank],
+                             lookup.LookupTable.MAX_TO_RANK_CLASS[max_rank])
+        self.assertEqual(lookup.LookupTable.RANK_CLASSES.tolist(), list(lookup.LookupTable.RANK_TO_RANK_CLASS))
+
+    def test_books(self):
+        books = lookup.load_books()
+        self.assertIsInstance(books["seven_card_unsuited_keys"], np.memmap)
+        lk_table = lookup.LookupTable()
+        self.assertEqual(lookup.LookupTable(books).flush_lookup, lk_table.flush_lookup)
+        self.assertEqual(lookup.LookupTable(books).unsuited_lookup, lk_table.unsuited_lookup)
+        seven_card_table = lookup.SevenCardLookupTable(lk_table)
+        loaded_seven_card_table = lookup.SevenCardLookupTable(books=books)
+        self.assertEqual(loaded_seven_card_table.flush_lookup, seven_card_table.flush_lookup)
+        self.assertEqual(loaded_seven_card_table.unsuited_lookup, seven_card_table.unsuited_lookup)
+        array_table = lookup.ArrayLookupTable(seven_card_table)
+        loaded_array_table = lookup.ArrayLookupTable(books=books)
+        np.testing.assert_array_equal(loaded_array_table.unsuited_keys, array_table.unsuited_keys)
+        np.testing.assert_array_equal(loaded_array_table.unsuited_ranks, array_table.unsuited_ranks)
+        np.testing.assert_array_equal(loaded_array_table.flush_lookup, array_table.flush_lookup)
+
+    def test_save_books(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "lookup_table.bin")
+            self.assertIsNone(lookup.load_books(path))
+            lookup.save_books(path)
+            books = lookup.load_books(path)
+            with open(lookup.BOOKS_PATH, "rb") as shipped_file, open(path, "rb") as saved_file:
+                self.assertEqual(shipped_file.read(), saved_file.read())
+            self.assertEqual(set(books), {name for name, _ in lookup.BOOKS_LAYOUT})
+            del books
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -67,6 +67,16 @@ class MyRankTestCase(unittest.TestCase):
         self.assertEqual(pkrcomponents.components.cards.rank.Rank.ACE - pkrcomponents.components.cards.rank.Rank.THREE, 2)
         self.assertEqual(pkrcomponents.components.cards.rank.Rank.FIVE - pkrcomponents.components.cards.rank.Rank.JACK, 6)
 
+    def test_rank_differences_table(self):
+        ranks = pkrcomponents.components.cards.rank.Rank
+        self.assertEqual([rank.ordinal for rank in ranks], list(range(13)))
+        for first in ranks:
+            for second in ranks:
+                low, high = sorted((first.ordinal, second.ordinal))
+                expected = min(high - low, low + 1) if high == 12 else high - low
+                self.assertEqual(ranks.difference(first, second), expected)
+                self.assertEqual(ranks.difference(f"{first}", f"{second}"), expected)
+
     def test_rank_order_operator(self):
         self.assertTrue(pkrcomponents.components.cards.rank.Rank.NINE > pkrcomponents.components.cards.rank.Rank.SIX)
         self.assertFalse(pkrcomponents.components.cards.rank.Rank.NINE > pkrcomponents.components.cards.rank.Rank.KING)
@@ -23,6 +23,19 @@ class PlayersTest(unittest.TestCase):
         self.assertIsInstance(players.name_dict, dict)
         self.assertIsInstance(players.seat_dict, dict)
 
+    def test_reset(self):
+        tab = Table()
+        for player in self.list:
+            player.sit(tab)
+        tab.players.button_seat = 4
+        tab.players.bb_seat = 2
+        tab.players.reset()
+        self.assertEqual(len(tab.players), 0)
+        self.assertEqual(tab.players.name_dict, {})
+        self.assertEqual(tab.players.seat_dict, {})
+        self.assertEqual(tab.players.bb_seat, 1)
+        self.assertFalse(hasattr(tab.players, "button_seat"))
+
     def test_occupied_and_distribute_positions(self):
         tab = Table()
         for player in self.list:
@@ -63,6 +76,28 @@ class PlayersTest(unittest.TestCase):
         self.assertEqual(tab.players[5].position, Position.HJ)
         self.assertRaises(ValueError, lambda: tab.players[0.5])
 
+    def test_seating_cache(self):
+        tab = Table()
+        for player in self.list:
+            player.sit(tab)
+        tab.players.bb_seat = 2
+        preflop_ordered_seats = tab.players.preflop_ordered_seats
+        self.assertIs(tab.players.preflop_ordered_seats, preflop_ordered_seats)
+        self.assertIs(tab.players.seats_mapper, tab.players.seats_mapper)
+        tab.players.bb_seat = 2
+        self.assertIs(tab.players.preflop_ordered_seats, preflop_ordered_seats)
+        tab.players.bb_seat = 4
+        self.assertEqual(tab.players.preflop_ordered_seats, [6, 1, 2, 4])
+        self.assertEqual(tab.players.seats_mapper, {"CO": 6, "BTN": 1, "SB": 2, "BB": 4})
+        self.p5.sit(tab)
+        self.assertEqual(tab.players.occupied_seats, [1, 2, 4, 5, 6])
+        self.assertEqual(tab.players.postflop_ordered_seats, [2, 4, 5, 6, 1])
+        self.p5.sit_out()
+        self.assertEqual(tab.players.occupied_seats, [1, 2, 4, 6])
+        self.assertEqual(tab.players.positions_mapper[4], Position.BB)
+        tab.players.reset()
+        self.assertEqual(tab.players.occupied_seats, [])
+
     def test_advance_bb_seat(self):
         table = Table()
         for pl in self.list:
@@ -2,6 +2,8 @@ import unittest
 from pkrcomponents.components.players.table_player import TablePlayer, Table
 from pkrcomponents.components.cards.combo import Combo
 from pkrcomponents.components.tournaments.level import Level
+from pkrcomponents.components.players.player_hand_stats import PlayerHandStats
+from pkrcomponents.components.players.street_hand_stats.postflop import PostflopPlayerHandStats
 from pkrcomponents.components.players.position import Position
 
 
@@ -110,6 +112,24 @@ class MyPlayerTestCase(unittest.TestCase):
         self.assertFalse(hasattr(self.toto, "_table"))
         self.assertRaises(KeyError, lambda: table.players.name_dict["Toto"])
 
+    def test_hand_stats(self):
+        stats = PlayerHandStats.make_default()
+        self.assertIsInstance(self.player.hand_stats, PlayerHandStats)
+        self.assertEqual(stats, PlayerHandStats())
+        self.assertEqual(stats.flop.amount_bet_made, 0.0)
+        self.assertIsInstance(stats.flop.amount_bet_made, float)
+        self.assertIs(stats.flop.amount_bet_made, self.toto.hand_stats.flop.amount_bet_made)
+        self.assertIsNone(stats.flop.actions_sequence)
+        self.assertIsNot(PostflopPlayerHandStats.make_default().actions_sequence,
+                         PostflopPlayerHandStats.make_default().actions_sequence)
+        stats.preflop.flag_vpip = True
+        stats.general.amount_won = 300
+        stats.reset()
+        self.assertFalse(stats.preflop.flag_vpip)
+        self.assertEqual(stats.general, PlayerHandStats().general)
+        with self.assertRaises(TypeError):
+            stats.preflop.flag_vpip = 1
+
     def test_repr(self):
         self.assertEqual(repr(self.player),
                          "TablePlayer(name: 'Jean', seat: 3, stack: 2000.0, position: None, bounty: 0.0)")
@@ -1,5 +1,6 @@
 import unittest
 import numpy as np
+from attrs import fields
 from pkrcomponents.components.actions.action import FoldAction, CheckAction, CallAction, BetAction, RaiseAction
 from pkrcomponents.components.cards.card import Card
 from pkrcomponents.components.cards.flop import Flop
@@ -52,6 +53,66 @@ class TableTest(unittest.TestCase):
         self.assertEqual(self.level.bb, 400)
         self.assertFalse(table.hand_has_started)
 
+    def test_reset_for_conversion(self):
+        table = Table()
+        board, deck, players, pot, postings = table.board, table.deck, table.players, table.pot, table.postings
+        for pl in self.pl_list:
+            pl.sit(table)
+        table.add_tournament(self.tournament)
+        table.players.button_seat = 6
+        table.max_players = 9
+        table.hand_id = "123"
+        table.start_hand()
+        self.p1.distribute("AcKc")
+        table.set_hero(self.p1)
+        table.street = Street.FLOP
+        table.draw_flop("2c", "5d", "8h")
+        BetAction(self.p2, 800).play()
+        table.reset_for_conversion()
+        self.assertIs(table.board, board)
+        self.assertIs(table.deck, deck)
+        self.assertIs(table.players, players)
+        self.assertIs(table.pot, pot)
+        self.assertIs(table.postings, postings)
+        fresh_table = Table()
+        for attribute_name in ("cnt_bets", "cnt_calls", "cnt_cold_calls", "cnt_limps", "hand_has_started", "hand_id",
+                               "hero_combo", "is_mtt", "is_opened", "max_players", "min_bet", "seat_playing",
+                               "hand_date", "street", "tournament", "total_buy_in", "postings", "rewards_table",
+                               "level"):
+            self.assertEqual(getattr(table, attribute_name), getattr(fresh_table, attribute_name))
+        self.assertEqual(table.board.len, 0)
+        self.assertEqual(table.deck.len, 52)
+        self.assertEqual(table.pot.value, 0)
+        self.assertEqual(table.pot.highest_bet, 0)
+        self.assertEqual(len(table.players), 0)
+        self.assertFalse(hasattr(table.players, "button_seat"))
+        self.assertEqual(table.players.bb_seat, 1)
+
+    def test_reset_for_conversion_fields(self):
+        table = Table()
+        for pl in self.pl_list:
+            pl.sit(table)
+        table.add_tournament(self.tournament)
+        table.players.button_seat = 6
+        table.hand_id = "123"
+        table.start_hand()
+        table.street = Street.FLOP
+        table.draw_flop("2c", "5d", "8h")
+        BetAction(self.p2, 800).play()
+        table.reset_for_conversion()
+        fresh_table = Table()
+        for attribute in fields(Table):
+            value, fresh_value = getattr(table, attribute.name), getattr(fresh_table, attribute.name)
+            with self.subTest(attribute=attribute.name):
+                if isinstance(value, Deck):
+                    self.assertEqual(value.mask, fresh_value.mask)
+                elif isinstance(value, Players):
+                    self.assertEqual(vars(value), vars(fresh_value))
+                elif attribute.name == "evaluator":
+                    self.assertIs(type(value), type(fresh_value))
+                else:
+                    self.assertEqual(value, fresh_value)
+
     def test_playing_order(self):
         table = Table()
         for pl in self.pl_list:
@@ -391,6 +452,39 @@ class TableTest(unittest.TestCase):
         self.assertEqual(table.pot.highest_bet, 400)
         self.assertFalse(table.players[2].is_current_player)
 
+    def test_player_counts(self):
+        def assert_counts_match_players():
+            self.assertEqual(table.nb_involved, len([pl for pl in table.players if not pl.folded]))
+            self.assertEqual(table.nb_in_game, len([pl for pl in table.players if pl.in_game]))
+            self.assertEqual(table.nb_able_to_play, len([pl for pl in table.players if pl.can_play]))
+            self.assertEqual(table.nb_waiting, len([pl for pl in table.players if pl.is_waiting]))
+
+        table = Table()
+        table.add_tournament(self.tournament)
+        for player in self.pl_list2:
+            table.add_player(player)
+        table.set_bb_seat(2)
+        table.start_hand()
+        assert_counts_match_players()
+        self.assertEqual((table.nb_involved, table.nb_in_game, table.nb_able_to_play), (6, 6, 6))
+        FoldAction(table.current_player).play()
+        assert_counts_match_players()
+        self.assertEqual((table.nb_involved, table.nb_in_game, table.nb_able_to_play), (5, 5, 5))
+        CallAction(table.current_player).play()
+        assert_counts_match_players()
+        self.assertEqual(table.nb_able_to_play, 4)
+        RaiseAction(table.current_player, value=1200).play()
+        assert_counts_match_players()
+        self.assertEqual(table.nb_able_to_play, 4)
+        table.players[5].stack = 0
+        assert_counts_match_players()
+        self.assertEqual((table.nb_involved, table.nb_in_game), (5, 4))
+        table.remove_player(self.p5)
+        assert_counts_match_players()
+        self.assertEqual((table.nb_involved, table.nb_in_game), (4, 4))
+        table.reset_for_conversion()
+        self.assertEqual((table.nb_involved, table.nb_in_game, table.nb_able_to_play), (0, 0, 0))
+
     def test_hand_example(self):
         hand_id = "2612804708405870609-6-1672853787"
         datetime = "04-01-2023 17:36:27"
@@ -0,0 +1,77 @@
+"""This module measures the time added to the conversion of hands by the calculation of the all-in EV.
+Every measure follows a warm-up round and is repeated, the best repetition is kept. The equities cache is cleared
+before each repetition, so that every repetition computes the equities of the hands once."""
+
+import os
+import time
+from pkrcomponents.components.cards.equity import _cached_equities
+from pkrcomponents.components.tables.table import Table
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+EXPECTED_REWARDS_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "expected_rewards_speed_results.txt")
+
+
+def convert_files(converter, files_list, nb_rounds):
+    for _ in range(nb_rounds):
+        for file_key in files_list:
+            converter.convert_history(file_key)
+
+
+def get_conversion_time(files_list, with_expected_rewards, nb_rounds=20, nb_repeats=5):
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    calculate_expected_rewards = Table.calculate_expected_rewards
+    if not with_expected_rewards:
+        Table.calculate_expected_rewards = lambda table: None
+    convert_files(converter, files_list, nb_rounds=1)
+    durations = []
+    for _ in range(nb_repeats):
+        _cached_equities.cache_clear()
+        start = time.perf_counter()
+        convert_files(converter, files_list, nb_rounds)
+        durations.append(time.perf_counter() - start)
+    Table.calculate_expected_rewards = calculate_expected_rewards
+    return min(durations) / (nb_rounds * len(files_list))
+
+
+def get_expected_rewards_time(files_list, nb_rounds=20, nb_repeats=5):
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    calculate_expected_rewards = Table.calculate_expected_rewards
+    durations = []
+
+    def timed_calculate_expected_rewards(table):
+        start = time.perf_counter()
+        calculate_expected_rewards(table)
+        durations.append(time.perf_counter() - start)
+
+    Table.calculate_expected_rewards = timed_calculate_expected_rewards
+    convert_files(converter, files_list, nb_rounds=1)
+    repeat_durations = []
+    for _ in range(nb_repeats):
+        durations.clear()
+        _cached_equities.cache_clear()
+        convert_files(converter, files_list, nb_rounds)
+        repeat_durations.append(sum(durations) / len(durations))
+    Table.calculate_expected_rewards = calculate_expected_rewards
+    return min(repeat_durations)
+
+
+def speed_test(results_path):
+    files_list = sorted(os.path.join(FILES_DIR, file_name) for file_name in os.listdir(FILES_DIR)
+                        if file_name.endswith(".json"))
+    lines = []
+    for label, with_expected_rewards in (("Without all-in EV", False), ("With all-in EV", True)):
+        conversion_time = get_conversion_time(files_list, with_expected_rewards)
+        lines.append(f"{label}: {conversion_time * 1000:.2f} milliseconds per converted hand\n")
+        print(lines[-1])
+    expected_rewards_time = get_expected_rewards_time(files_list)
+    lines.append(f"calculate_expected_rewards(): {expected_rewards_time * 1e6:.1f} microseconds per converted hand\n")
+    print(lines[-1])
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=EXPECTED_REWARDS_SPEED_RESULTS_PATH)
@@ -0,0 +1,36 @@
+"""This module measures the time needed to classify the texture of every flop."""
+
+import os
+import time
+from pkrcomponents.components.cards.flop import Flop
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FLOP_TEXTURE_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "flop_texture_speed_results.txt")
+TEXTURE_PROPERTIES = ("is_rainbow", "is_monotone", "is_paired", "has_straight_draw", "has_gutshot", "is_sequential",
+                      "has_straights", "min_distance", "max_distance")
+
+
+def get_classification_time(flops, nb_rounds=5):
+    durations = []
+    for _ in range(nb_rounds):
+        start = time.perf_counter()
+        for flop in flops:
+            for texture_property in TEXTURE_PROPERTIES:
+                getattr(flop, texture_property)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def speed_test(results_path):
+    flops = Flop.all_flops
+    classification_time = get_classification_time(flops)
+    lines = [f"Texture of the {len(flops)} flops: {classification_time * 1000:.1f} milliseconds, "
+             f"{classification_time / len(flops) * 1e6:.2f} microseconds per flop\n"]
+    print(lines[-1])
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=FLOP_TEXTURE_SPEED_RESULTS_PATH)
@@ -1,6 +1,14 @@
+import gzip
+import importlib.util
+import json
 import os
 import pandas as pd
+import shutil
+import tarfile
+import tempfile
 import unittest
+import zipfile
+from unittest import mock
 
 from datetime import datetime
 
@@ -8,6 +16,7 @@ from pkrcomponents.components.actions.action_move import ActionMove
 from pkrcomponents.components.actions.street import Street
 from pkrcomponents.components.cards.board import Board
 from pkrcomponents.components.cards.combo import Combo
+from pkrcomponents.components.cards.flop import Flop
 from pkrcomponents.components.players.player_hand_stats import PlayerHandStats
 from pkrcomponents.components.players.players import Players
 from pkrcomponents.components.players.position import Position
@@ -16,8 +25,18 @@ from pkrcomponents.components.tournaments.buy_in import BuyIn
 from pkrcomponents.components.tournaments.level import Level
 from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
 from pkrcomponents.converters.settings import BUCKET_NAME, DATA_DIR, TEST_DATA_DIR
+from pkrcomponents.converters.utils import archives, stats_export
+from pkrcomponents.converters.utils.archives import ArchiveReader, make_member_key, split_member_key
+from pkrcomponents.converters.utils.bundles import BundleReader, index_lines, make_line_key, MappedBundle, \
+    read_corrections_ledger, split_line_key
+from pkrcomponents.converters.utils.exceptions import ParsedHistoryError
+from pkrcomponents.converters.utils.json_decoders import get_available_backends, get_json_decoder, JsonDecoder
+from pkrcomponents.converters.utils.parsed_history import ParsedHistory, ParsedPlayer
+from pkrcomponents.converters.utils.records import HandConversionFailure, HandRecord
+from pkrcomponents.converters.utils.stats_export import HandStatsColumns, HandStatsWriter, STATS_COLUMNS
 
 FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "json_files")
+ERRORS_FILES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "errors", "json_files")
 
 
 class TestS3Converter(unittest.TestCase):
@@ -817,6 +836,15 @@ class TestLocalHandHistoryConverter08(unittest.TestCase):
     def test_convert_history(self):
         self.converter.convert_history(self.history_path)
 
+    def test_expected_rewards(self):
+        table = self.converter.convert_history(self.history_path)
+        self.assertEqual(table.all_in_board_size, 3)
+        winner, loser = table.players["carlitouam"], table.players["SHOVE&TILT"]
+        self.assertEqual(winner.hand_stats.general.amount_expected_won, 3219.22)
+        self.assertEqual(loser.hand_stats.general.amount_expected_won, 473.78)
+        self.assertAlmostEqual(winner.hand_stats.general.amount_expected_won +
+                               loser.hand_stats.general.amount_expected_won, winner.hand_stats.general.amount_won)
+
 
 class TestLocalHandHistoryConverter09(unittest.TestCase):
     def setUp(self):
@@ -986,3 +1014,431 @@ class TestLocalHandHistoryConverter25(unittest.TestCase):
 
     def test_convert_history(self):
         self.converter.convert_history(self.history_path)
+
+
+class TestConvertHistories(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.tmp_dir, "data")
+        self.parsed_dir = os.path.join(self.data_dir, "histories", "parsed")
+        split_dir = os.path.join(self.data_dir, "histories", "split")
+        os.makedirs(self.parsed_dir)
+        os.makedirs(split_dir)
+        for file_name in ("example01.json", "example03.json", "example09.json"):
+            shutil.copy(os.path.join(FILES_DIR, file_name), self.parsed_dir)
+        shutil.copy(os.path.join(ERRORS_FILES_DIR, "example02.json"), os.path.join(self.parsed_dir, "error02.json"))
+        with open(os.path.join(split_dir, "error02.txt"), "w") as file:
+            file.write("")
+        self.converter = LocalHandHistoryConverter(data_dir=self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_get_init_kwargs(self):
+        self.assertEqual(self.converter.get_init_kwargs(),
+                         {"data_dir": self.data_dir, "read_buffer_size": 1 << 20, "memory_map": True})
+
+    def test_convert_history_to_record(self):
+        record = self.converter.convert_history_to_record(os.path.join(self.parsed_dir, "example03.json"))
+        self.assertIsInstance(record, HandRecord)
+        self.assertEqual(len(record.board), 5)
+        self.assertEqual(record.flop_class, Flop(*record.board[:3]).class_id)
+        self.assertEqual(len(record.players), self.converter.table.cnt_players)
+        hero_record = [player for player in record.players if player.is_hero][0]
+        self.assertEqual(hero_record.name, "manggy94")
+        self.assertEqual(hero_record.combo, "Qd2c")
+        failure = self.converter.convert_history_to_record(os.path.join(self.parsed_dir, "error02.json"))
+        self.assertIsInstance(failure, HandConversionFailure)
+        self.assertTrue(failure.file_key.endswith("error02.json"))
+
+    def test_reset_table(self):
+        table = self.converter.table
+        for file_name in sorted(os.listdir(FILES_DIR)):
+            file_key = os.path.join(FILES_DIR, file_name)
+            record = self.converter.convert_history_to_record(file_key)
+            self.assertIs(self.converter.table, table)
+            fresh_converter = LocalHandHistoryConverter(data_dir=self.data_dir)
+            self.assertEqual(record, fresh_converter.convert_history_to_record(file_key))
+
+    def test_iter_process_converted_histories(self):
+        results = list(self.converter.iter_process_converted_histories(max_workers=2, chunk_size=1))
+        self.assertEqual(len(results), 4)
+        records = [result for result in results if isinstance(result, HandRecord)]
+        expected_hand_ids = {self.converter.convert_history(key).hand_id
+                             for key in self.converter.list_parsed_histories_keys()
+                             if not key.endswith("error02.json")}
+        self.assertEqual({record.hand_id for record in records}, expected_hand_ids)
+
+    def test_iter_process_converted_histories_failing_chunk(self):
+        parsed_keys = sorted(self.converter.list_parsed_histories_keys())
+        missing_key = os.path.join(self.parsed_dir, "missing.json")
+        keys = [missing_key, parsed_keys[0]] + parsed_keys[1:] * 3
+        results = list(self.converter.iter_process_converted_histories(iter(keys), max_workers=1, chunk_size=2))
+        self.assertEqual(len(results), len(keys))
+        failures = {result.file_key: result for result in results if isinstance(result, HandConversionFailure)}
+        self.assertEqual(failures[missing_key].error_type, "FileNotFoundError")
+        self.assertEqual(failures[parsed_keys[0]].error_type, "FileNotFoundError")
+
+    def test_iter_parsed_histories_keys(self):
+        keys = self.converter.iter_parsed_histories_keys()
+        self.assertNotIsInstance(keys, list)
+        self.assertEqual(sorted(keys), sorted(self.converter.list_parsed_histories_keys()))
+
+    def test_iter_convert_histories(self):
+        results = self.converter.iter_convert_histories()
+        first_result = next(results)
+        self.assertIsInstance(first_result, (HandRecord, HandConversionFailure))
+        results = [first_result] + list(results)
+        self.assertEqual(len(results), 4)
+        failures = [result for result in results if isinstance(result, HandConversionFailure)]
+        self.assertEqual(len(failures), 1)
+        self.assertTrue(failures[0].file_key.endswith("error02.json"))
+        records = list(self.converter.iter_convert_histories([os.path.join(self.parsed_dir, "example09.json")]))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].board, tuple(f"{card}" for card in self.converter.table.board.flop.cards +
+                                                 [self.converter.table.board.turn, self.converter.table.board.river]))
+
+    def test_json_backends(self):
+        file_key = os.path.join(self.parsed_dir, "example03.json")
+        self.assertIn("json", get_available_backends())
+        self.assertIs(get_json_decoder(), get_json_decoder(get_available_backends()[0]))
+        expected_data = JsonDecoder().decode(self.converter.read_data_text(file_key))
+        for backend in get_available_backends():
+            decoder = get_json_decoder(backend)
+            self.assertEqual(decoder.name, backend)
+            self.assertEqual(decoder.decode(self.converter.read_data_bytes(file_key)), expected_data)
+            with self.assertRaises(ValueError):
+                decoder.decode(b'{"hand_id": ')
+        with self.assertRaises(ValueError):
+            get_json_decoder("yaml")
+        self.converter.json_backend = "json"
+        self.converter.get_parsed_data(file_key)
+        self.assertEqual(self.converter.data, expected_data)
+        failure = self.converter.convert_history_to_record(os.path.join(self.parsed_dir, "error02.json"))
+        self.assertIsInstance(failure, HandConversionFailure)
+
+    def test_parsed_history(self):
+        file_key = os.path.join(self.parsed_dir, "example03.json")
+        self.converter.get_parsed_data(file_key)
+        parsed_history = self.converter.parsed_history
+        self.assertIsInstance(parsed_history, ParsedHistory)
+        self.assertEqual(parsed_history, ParsedHistory.from_dict(self.converter.data))
+        self.assertEqual(parsed_history.hand_id, self.converter.data["hand_id"])
+        self.assertEqual(len(parsed_history.players), len(self.converter.data["players"]))
+        self.assertIsInstance(parsed_history.players[0], ParsedPlayer)
+        self.assertEqual(tuple(parsed_history.actions), ("preflop", "flop", "turn", "river"))
+        self.assertIsInstance(parsed_history.actions["preflop"][0].move, ActionMove)
+        invalid_data = (
+            ("hand_id", None, "history.hand_id"),
+            ("max_players", "6", "history.max_players"),
+            ("datetime", "yesterday", "history.datetime"),
+            ("postings", [{"name": "unknown", "amount": 25.0, "blind_type": "ante"}], "postings[0].name"),
+            ("actions", {"preflop": [{"player": "manggy94", "action": "dances", "amount": 0.0}]},
+             "actions.preflop[0].action"),
+        )
+        for key, value, path in invalid_data:
+            data = {**self.converter.data, key: value}
+            with self.assertRaises(ParsedHistoryError) as context:
+                ParsedHistory.from_dict(data)
+            self.assertEqual(context.exception.path, path)
+        with self.assertRaises(ParsedHistoryError):
+            ParsedHistory.from_dict({key: value for key, value in self.converter.data.items() if key != "players"})
+        with open(file_key) as file:
+            data_text = file.read()
+        with open(file_key, "w") as file:
+            file.write(data_text.replace('"max_players": 6', '"max_players": "6"'))
+        failure = self.converter.convert_history_to_record(file_key)
+        self.assertIsInstance(failure, HandConversionFailure)
+        self.assertEqual(failure.error_type, "ParsedHistoryError")
+
+    def test_typed_decoding(self):
+        file_keys = [os.path.join(self.parsed_dir, file_name) for file_name in ("example03.json", "example09.json")]
+        for backend in get_available_backends():
+            decoder = get_json_decoder(backend)
+            for file_key in file_keys:
+                data_bytes = self.converter.read_data_bytes(file_key)
+                expected_history = ParsedHistory.from_dict(decoder.decode(data_bytes))
+                self.assertEqual(decoder.decode_history(data_bytes), expected_history)
+            data = decoder.decode(self.converter.read_data_bytes(file_keys[0]))
+            invalid_data = (
+                ({**data, "max_players": "6"}, "max_players"),
+                ({**data, "datetime": "yesterday"}, "datetime"),
+                ({**data, "postings": [{"name": "unknown", "amount": 25.0, "blind_type": "ante"}]}, "postings[0]"),
+                ({key: value for key, value in data.items() if key != "players"}, "players"),
+            )
+            for invalid, path in invalid_data:
+                with self.assertRaises(ParsedHistoryError) as context:
+                    decoder.decode_history(json.dumps(invalid).encode())
+                self.assertIn(path, f"{context.exception}")
+            with self.assertRaises(ValueError):
+                decoder.decode_history(b'{"hand_id": ')
+        self.converter.typed_decoding = True
+        self.converter.get_parsed_data(file_keys[0])
+        self.assertIsNone(self.converter.data)
+        self.assertEqual(self.converter.parsed_history, ParsedHistory.from_dict(data))
+        records = list(self.converter.iter_convert_histories(file_keys))
+        self.assertEqual(len(records), len(file_keys))
+        self.assertEqual(records[0].hand_id, data["hand_id"])
+
+    def write_bundle(self, path: str, file_names: tuple, open_function=open):
+        lines = []
+        for file_name in file_names:
+            file_key = os.path.join(self.parsed_dir, file_name)
+            lines.append(JsonDecoder().decode(self.converter.read_data_bytes(file_key)))
+        with open_function(path, "wt") as file:
+            for data in lines:
+                file.write(json.dumps(data) + "\n\n")
+        return lines
+
+    def test_ndjson_bundles(self):
+        file_names = ("example01.json", "error02.json", "example03.json", "example09.json")
+        bundle_path = os.path.join(self.parsed_dir, "bundle.ndjson.gz")
+        expected_data = self.write_bundle(bundle_path, file_names, gzip.open)
+        for file_name in file_names:
+            os.remove(os.path.join(self.parsed_dir, file_name))
+        converter = LocalHandHistoryConverter(data_dir=self.data_dir, read_buffer_size=4096)
+        keys = converter.list_parsed_histories_keys()
+        self.assertEqual(keys, [make_line_key(bundle_path, line_number) for line_number in (1, 3, 5, 7)])
+        self.assertEqual(split_line_key(keys[2]), (bundle_path, 5))
+        self.assertEqual(split_line_key(os.path.join(self.parsed_dir, "example01.json#5"))[1], None)
+        self.assertEqual([JsonDecoder().decode(converter.read_data_bytes(key)) for key in keys], expected_data)
+        self.assertEqual(JsonDecoder().decode(converter.read_data_text(keys[0])), expected_data[0])
+        results = list(converter.iter_convert_histories())
+        self.assertEqual([isinstance(result, HandRecord) for result in results], [True, False, True, True])
+        self.assertEqual(results[2].hand_id, expected_data[2]["hand_id"])
+        with self.assertRaises(KeyError):
+            BundleReader().read_line(bundle_path, 2)
+        converter.slow_convert_histories()
+        correction_keys = converter.list_parsed_history_keys_to_correct()
+        self.assertEqual(len(correction_keys), 1)
+        self.assertTrue(correction_keys[0].endswith(f"bundle.ndjson{make_line_key('', 1)}"))
+        self.assertEqual(JsonDecoder().decode(converter.read_data_bytes(correction_keys[0])), expected_data[1])
+        self.assertEqual(len(converter.list_parsed_histories_keys()), 3)
+
+    def test_bundle_corrections_are_recorded_once(self):
+        file_names = ("example01.json", "error02.json", "example03.json")
+        bundle_path = os.path.join(self.parsed_dir, "bundle.ndjson")
+        self.write_bundle(bundle_path, file_names)
+        for file_name in file_names:
+            os.remove(os.path.join(self.parsed_dir, file_name))
+        converter = LocalHandHistoryConverter(data_dir=self.data_dir)
+        converter.slow_convert_histories()
+        self.assertEqual(read_corrections_ledger(bundle_path), {"3"})
+        converter.slow_convert_histories()
+        converter.send_to_corrections(make_line_key(bundle_path, 3))
+        results = list(converter.iter_convert_histories())
+        self.assertFalse(any(isinstance(result, HandConversionFailure) for result in results))
+        self.assertNotIn(make_line_key(bundle_path, 3), converter.list_parsed_histories_keys())
+        correction_keys = converter.list_parsed_history_keys_to_correct()
+        self.assertEqual(len(correction_keys), 1)
+        self.assertEqual(read_corrections_ledger(bundle_path), {"3"})
+
+    def test_memory_mapped_bundles(self):
+        file_names = ("example01.json", "error02.json", "example03.json")
+        bundle_path = os.path.join(self.parsed_dir, "bundle.jsonl")
+        expected_data = self.write_bundle(bundle_path, file_names)
+        with open(bundle_path, "ab") as file:
+            file.write(b"  \r\n")
+        self.assertEqual(list(index_lines(b"{}\n\n{}")), [0, 3, 4, 6])
+        mapped_bundle = MappedBundle(bundle_path)
+        self.assertEqual(len(mapped_bundle), 7)
+        self.assertEqual([line_number for line_number, _ in mapped_bundle.iter_lines()], [1, 3, 5])
+        with self.assertRaises(KeyError):
+            mapped_bundle.get_line(7)
+        line = mapped_bundle.get_line(5)
+        mapped_bundle.close()
+        self.assertEqual(JsonDecoder().decode(line), expected_data[2])
+        keys = [key for key in self.converter.list_parsed_histories_keys() if split_line_key(key)[1] is not None]
+        self.assertEqual(keys, [make_line_key(bundle_path, line_number) for line_number in (1, 3, 5)])
+        self.assertIsInstance(self.converter.read_data_bytes(keys[0]), memoryview)
+        for backend in get_available_backends():
+            self.converter.json_backend = backend
+            self.converter.get_parsed_data(keys[2])
+            self.assertEqual(self.converter.data, expected_data[2])
+        streaming_converter = LocalHandHistoryConverter(data_dir=self.data_dir, memory_map=False)
+        self.assertIsInstance(streaming_converter.read_data_bytes(keys[0]), bytes)
+        self.assertEqual(list(self.converter.iter_convert_histories(keys)),
+                         list(streaming_converter.iter_convert_histories(keys)))
+
+    def test_many_memory_mapped_bundles(self):
+        bundle_paths = [os.path.join(self.parsed_dir, f"bundle{index}.jsonl") for index in range(6)]
+        expected_data = [self.write_bundle(bundle_path, ("example01.json", "example03.json"))
+                         for bundle_path in bundle_paths]
+        bundle_reader = BundleReader(max_mapped_bundles=2)
+        for bundle_path in bundle_paths:
+            self.assertEqual([line_number for line_number, _ in bundle_reader.iter_lines(bundle_path)], [1, 3])
+        self.assertEqual(len(bundle_reader._mapped_bundles), 0)
+        mapped_bundles = []
+        for bundle_path, bundle_data in zip(bundle_paths, expected_data):
+            self.assertEqual(JsonDecoder().decode(bundle_reader.read_line(bundle_path, 3)), bundle_data[1])
+            mapped_bundles.append(bundle_reader.get_mapped_bundle(bundle_path))
+            self.assertLessEqual(len(bundle_reader._mapped_bundles), 2)
+        self.assertEqual([mapped_bundle._map.closed for mapped_bundle in mapped_bundles], [True] * 4 + [False] * 2)
+        self.assertEqual(JsonDecoder().decode(bundle_reader.read_line(bundle_paths[0], 1)), expected_data[0][0])
+        self.assertEqual(list(bundle_reader._mapped_bundles), [bundle_paths[5], bundle_paths[0]])
+        bundle_reader.close()
+        self.assertTrue(mapped_bundles[5]._map.closed)
+
+    @unittest.skipUnless(importlib.util.find_spec("zstandard"), "zstandard is not installed")
+    def test_zstd_bundles(self):
+        import zstandard
+        bundle_path = os.path.join(self.parsed_dir, "bundle.jsonl.zst")
+        expected_data = self.write_bundle(bundle_path, ("example01.json", "example03.json"),
+                                          lambda path, mode: zstandard.open(path, mode))
+        keys = [key for key in self.converter.list_parsed_histories_keys() if split_line_key(key)[1] is not None]
+        self.assertEqual([JsonDecoder().decode(self.converter.read_data_bytes(key)) for key in keys], expected_data)
+
+    def test_archives(self):
+        file_names = ("example01.json", "error02.json", "example03.json", "example09.json")
+        archives_dir = os.path.join(self.tmp_dir, "archives", "data")
+        archives_parsed_dir = os.path.join(archives_dir, "histories", "parsed")
+        os.makedirs(archives_parsed_dir)
+        zip_path = os.path.join(archives_parsed_dir, "hands.zip")
+        tar_path = os.path.join(archives_parsed_dir, "hands.tar.gz")
+        with zipfile.ZipFile(zip_path, "w") as archive, tarfile.open(tar_path, "w:gz") as tar_archive:
+            for file_name in reversed(file_names):
+                archive.write(os.path.join(self.parsed_dir, file_name), f"608341002/{file_name}")
+                tar_archive.add(os.path.join(self.parsed_dir, file_name), f"608341002/{file_name}")
+            archive.writestr("README.txt", "")
+        converter = LocalHandHistoryConverter(data_dir=archives_dir)
+        keys = list(converter.iter_parsed_histories_keys())
+        self.assertEqual(len(keys), 8)
+        for path in (zip_path, tar_path):
+            expected_keys = [make_member_key(path, f"608341002/{file_name}") for file_name in reversed(file_names)]
+            self.assertEqual([key for key in keys if key.startswith(path)], expected_keys)
+        self.assertEqual(split_member_key(keys[0])[1], f"608341002/{file_names[-1]}")
+        self.assertEqual(split_member_key(os.path.join(self.parsed_dir, "example01.json"))[1], None)
+        for key in keys:
+            file_name = os.path.basename(split_member_key(key)[1])
+            self.assertEqual(converter.read_data_bytes(key), self.converter.read_data_bytes(
+                os.path.join(self.parsed_dir, file_name)))
+        self.assertEqual(json.loads(converter.read_data_text(make_member_key(tar_path, "608341002/example01.json"))),
+                         json.loads(self.converter.read_data_text(os.path.join(self.parsed_dir, "example01.json"))))
+        with self.assertRaises(KeyError):
+            ArchiveReader().read_member(tar_path, "608341002/example02.json")
+        archive_reader = ArchiveReader()
+        with mock.patch.object(archives, "read_tar_member", wraps=archives.read_tar_member) as read_tar_member:
+            for file_name in file_names:
+                self.assertEqual(archive_reader.read_member(tar_path, f"608341002/{file_name}"),
+                                 self.converter.read_data_bytes(os.path.join(self.parsed_dir, file_name)))
+        self.assertEqual(read_tar_member.call_count, len(file_names))
+        results = list(converter.iter_convert_histories(sorted(keys)))
+        self.assertEqual(sum(isinstance(result, HandConversionFailure) for result in results), 2)
+        converter.slow_convert_histories()
+        correction_keys = converter.list_parsed_history_keys_to_correct()
+        self.assertEqual(sorted(os.path.basename(os.path.dirname(os.path.dirname(key))) for key in correction_keys),
+                         ["hands.tar.gz", "hands.zip"])
+        self.assertEqual(converter.read_data_bytes(correction_keys[0]), self.converter.read_data_bytes(
+            os.path.join(self.parsed_dir, "error02.json")))
+        self.assertEqual(len(converter.list_parsed_histories_keys()), 6)
+        self.assertEqual(read_corrections_ledger(tar_path), {"608341002/error02.json"})
+        converter.slow_convert_histories()
+        results = list(converter.iter_convert_histories())
+        self.assertFalse(any(isinstance(result, HandConversionFailure) for result in results))
+        self.assertEqual(len(converter.list_parsed_history_keys_to_correct()), 2)
+
+    def test_archive_member_corrections(self):
+        archives_dir = os.path.join(self.tmp_dir, "archives", "data")
+        archives_parsed_dir = os.path.join(archives_dir, "histories", "parsed")
+        os.makedirs(archives_parsed_dir)
+        zip_path = os.path.join(archives_parsed_dir, "hands.zip")
+        member_names = ("../../x.json", "608341002/../../../x.json", "/abs/x.json", "608341002/./error02.json")
+        with zipfile.ZipFile(zip_path, "w") as archive:
+            for member_name in member_names:
+                archive.writestr(member_name, "{}")
+        converter = LocalHandHistoryConverter(data_dir=archives_dir)
+        for member_name in member_names[:2]:
+            with self.assertWarns(UserWarning):
+                converter.send_member_to_corrections(zip_path, member_name)
+        for member_name in member_names:
+            converter.send_member_to_corrections(zip_path, member_name)
+        self.assertEqual(read_corrections_ledger(zip_path), set(member_names))
+        self.assertEqual(converter.list_parsed_histories_keys(), [])
+        correction_dir = zip_path.replace("data", "corrections")
+        written_paths = sorted(os.path.relpath(os.path.join(root, filename), self.tmp_dir)
+                               for root, _, filenames in os.walk(self.tmp_dir) for filename in filenames
+                               if filename.endswith(".json") and not root.startswith(self.parsed_dir))
+        self.assertEqual(written_paths, sorted(os.path.relpath(os.path.join(correction_dir, name), self.tmp_dir)
+                                               for name in ("abs/x.json", "608341002/error02.json")))
+
+    def test_hand_stats_columns(self):
+        columns = HandStatsColumns()
+        self.assertEqual(list(columns.to_dataframe().columns), [name for name, _ in STATS_COLUMNS])
+        table = self.converter.convert_history(os.path.join(self.parsed_dir, "example03.json"))
+        columns.add_table(table)
+        self.assertEqual(len(columns), table.cnt_players)
+        df = columns.to_dataframe()
+        hero_row = df[df["player_name"] == "manggy94"].iloc[0]
+        hero_stats = table.players["manggy94"].hand_stats.to_dataframe().iloc[0]
+        self.assertEqual(list(df.columns[2:]), list(hero_stats.index))
+        self.assertEqual(hero_row["hand_id"], table.hand_id)
+        self.assertEqual(hero_row["general_combo"], "Qd2c")
+        self.assertEqual(hero_row["general_position"], hero_stats["general_position"].name)
+        self.assertEqual(hero_row["general_seat"], hero_stats["general_seat"])
+        self.assertEqual(hero_row["preflop_flag_vpip"], hero_stats["preflop_flag_vpip"])
+        self.assertEqual(hero_row["preflop_actions_sequence"], f"{hero_stats['preflop_actions_sequence']}")
+        columns.clear()
+        self.assertEqual(len(columns), 0)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_export_hand_stats(self):
+        import pyarrow.parquet as pq
+        path = os.path.join(self.tmp_dir, "stats.parquet")
+        nb_hands = self.converter.export_hand_stats(path, row_group_size=5)
+        self.assertEqual(nb_hands, 3)
+        stats = pq.read_table(path)
+        self.assertEqual(stats.column_names, [name for name, _ in STATS_COLUMNS])
+        self.assertGreater(pq.ParquetFile(path).num_row_groups, 1)
+        with self.assertRaises(ValueError):
+            HandStatsWriter(path, file_format="xlsx")
+
+    def test_export_hand_stats_csv(self):
+        path = os.path.join(self.tmp_dir, "stats.csv")
+        with mock.patch.object(stats_export, "find_spec", return_value=None):
+            nb_hands = self.converter.export_hand_stats(path, row_group_size=5)
+        self.assertEqual(nb_hands, 3)
+        stats = pd.read_csv(path)
+        self.assertEqual(list(stats.columns), [name for name, _ in STATS_COLUMNS])
+        columns = HandStatsColumns()
+        for parsed_key in self.converter.list_parsed_histories_keys():
+            columns.add_table(self.converter.convert_history(parsed_key))
+        self.assertEqual(len(stats), len(columns))
+        self.assertEqual(sorted(stats["player_name"]), sorted(columns.to_dataframe()["player_name"]))
+        corrections_dir = os.path.join(self.tmp_dir, "corrections", "histories", "parsed")
+        self.assertTrue(os.path.exists(os.path.join(corrections_dir, "error02.json")))
+
+    def test_convert_histories(self):
+        for file_name in ("example08.json", "example10.json", "example14.json", "example15.json", "example17.json"):
+            shutil.copy(os.path.join(FILES_DIR, file_name), self.parsed_dir)
+        parsed_keys = self.converter.list_parsed_histories_keys()
+        expected_records = {}
+        for parsed_key in parsed_keys:
+            record = LocalHandHistoryConverter(data_dir=self.data_dir).convert_history_to_record(parsed_key)
+            if isinstance(record, HandRecord):
+                expected_records[parsed_key] = record
+        records = {}
+
+        def convert_history(parsed_key):
+            table = LocalHandHistoryConverter.convert_history(self.converter, parsed_key)
+            records[parsed_key] = HandRecord.from_table(parsed_key, table)
+            return table
+
+        with mock.patch.object(self.converter, "convert_history", side_effect=convert_history):
+            self.converter.convert_histories()
+        self.assertEqual(len(records), 8)
+        self.assertEqual(records, expected_records)
+        self.assertEqual(len(self.converter.list_parsed_histories_keys()), 8)
+
+    def test_slow_convert_histories(self):
+        self.converter.slow_convert_histories()
+        corrections_dir = os.path.join(self.tmp_dir, "corrections", "histories", "parsed")
+        self.assertTrue(os.path.exists(os.path.join(corrections_dir, "error02.json")))
+        self.assertEqual(len(self.converter.list_parsed_histories_keys()), 3)
+
+    def test_process_convert_histories(self):
+        records = self.converter.process_convert_histories(max_workers=2, chunk_size=2)
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all(isinstance(record, HandRecord) for record in records))
+        corrections_dir = os.path.join(self.tmp_dir, "corrections", "histories", "parsed")
+        self.assertTrue(os.path.exists(os.path.join(corrections_dir, "error02.json")))
+        self.assertEqual(len(self.converter.list_parsed_histories_keys()), 3)
@@ -0,0 +1,52 @@
+"""This module measures the time needed to import the cards modules and to build their enumerations on first use."""
+
+import os
+import subprocess
+import sys
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "import_speed_results.txt")
+MEASURED_IMPORTS = (
+    ("Card", "pkrcomponents.components.cards.card"),
+    ("Hand", "pkrcomponents.components.cards.hand"),
+    ("Combo", "pkrcomponents.components.cards.combo"),
+    ("Flop", "pkrcomponents.components.cards.flop"),
+)
+MEASURE_SCRIPT = """
+import time
+start = time.perf_counter()
+from {module} import {class_name}
+imported = time.perf_counter()
+len({class_name})
+iterated = time.perf_counter()
+print(imported - start, iterated - imported)
+"""
+
+
+def get_import_times(class_name, module, nb_runs=5):
+    import_times, first_use_times = [], []
+    for _ in range(nb_runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE_SCRIPT.format(module=module, class_name=class_name)],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(TEST_DIR)
+        ).stdout
+        import_time, first_use_time = (float(value) for value in output.split())
+        import_times.append(import_time)
+        first_use_times.append(first_use_time)
+    return min(import_times), min(first_use_times)
+
+
+def speed_test(results_path):
+    lines = []
+    for class_name, module in MEASURED_IMPORTS:
+        import_time, first_use_time = get_import_times(class_name, module)
+        lines.append(f"{class_name}: {import_time * 1000:.1f} milliseconds to import, "
+                     f"{first_use_time * 1000:.1f} milliseconds to build all instances on first use\n")
+        print(lines[-1])
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=IMPORT_SPEED_RESULTS_PATH)
@@ -0,0 +1,46 @@
+"""This module compares the time needed to read and decode parsed histories with each installed JSON backend."""
+
+import json
+import os
+import time
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+from pkrcomponents.converters.utils.json_decoders import get_available_backends, get_json_decoder
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+JSON_DECODING_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "json_decoding_speed_results.txt")
+
+
+def read_text_and_loads(converter, file_key):
+    return json.loads(converter.read_data_text(file_key))
+
+
+def get_decoding_time(decode_function, files_list, nb_rounds=200):
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    start = time.perf_counter()
+    for _ in range(nb_rounds):
+        for file_key in files_list:
+            decode_function(converter, file_key)
+    return (time.perf_counter() - start) / (nb_rounds * len(files_list))
+
+
+def speed_test(results_path):
+    files_list = sorted(os.path.join(FILES_DIR, file_name) for file_name in os.listdir(FILES_DIR)
+                        if file_name.endswith(".json"))
+    decode_functions = [("str + json.loads", read_text_and_loads)]
+    for backend in get_available_backends():
+        decoder = get_json_decoder(backend)
+        decode_functions.append((f"bytes + {backend}", lambda converter, file_key, decoder=decoder:
+                                 decoder.decode(converter.read_data_bytes(file_key))))
+    lines = []
+    for label, decode_function in decode_functions:
+        decoding_time = get_decoding_time(decode_function, files_list)
+        lines.append(f"{label}: {decoding_time * 1e6:.1f} microseconds per parsed history\n")
+        print(lines[-1])
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=JSON_DECODING_SPEED_RESULTS_PATH)
@@ -0,0 +1,64 @@
+"""This module compares the time needed to list, read and decode the parsed histories of an NDJSON bundle,
+streamed through a read buffer or mapped in memory with a line index."""
+
+import os
+import random
+import shutil
+import tempfile
+import time
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+from pkrcomponents.converters.utils.json_decoders import get_json_decoder
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+MMAP_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "mmap_speed_results.txt")
+
+
+def write_bundle(data_dir, nb_copies):
+    parsed_dir = os.path.join(data_dir, "histories", "parsed")
+    os.makedirs(parsed_dir)
+    lines = []
+    for file_name in sorted(os.listdir(FILES_DIR)):
+        with open(os.path.join(FILES_DIR, file_name), "rb") as file:
+            lines.append(b" ".join(file.read().split()) + b"\n")
+    with open(os.path.join(parsed_dir, "hands.ndjson"), "wb") as file:
+        for _ in range(nb_copies):
+            file.writelines(lines)
+    return len(lines) * nb_copies
+
+
+def get_reading_time(data_dir, memory_map, shuffle=False):
+    converter = LocalHandHistoryConverter(data_dir, memory_map=memory_map)
+    decoder = get_json_decoder()
+    start = time.perf_counter()
+    parsed_keys = converter.list_parsed_histories_keys()
+    if shuffle:
+        random.Random(0).shuffle(parsed_keys)
+    for parsed_key in parsed_keys:
+        decoder.decode(converter.read_data_bytes(parsed_key))
+    return (time.perf_counter() - start) / len(parsed_keys)
+
+
+def speed_test(results_path, nb_copies=400):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        data_dir = os.path.join(tmp_dir, "data")
+        nb_hands = write_bundle(data_dir, nb_copies)
+        lines = [f"{nb_hands} hands listed, read and decoded from one NDJSON bundle\n"]
+        timings = [
+            ("streamed, in order", get_reading_time(data_dir, memory_map=False)),
+            ("mapped, in order", get_reading_time(data_dir, memory_map=True)),
+            ("mapped, random order", get_reading_time(data_dir, memory_map=True, shuffle=True)),
+        ]
+        for label, reading_time in timings:
+            lines.append(f"{label}: {reading_time * 1e6:.1f} microseconds per parsed history\n")
+            print(lines[-1])
+    finally:
+        shutil.rmtree(tmp_dir)
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=MMAP_SPEED_RESULTS_PATH)
@@ -0,0 +1,65 @@
+"""This module compares the time needed to list and read parsed histories stored one per file,
+and bundled in NDJSON files, plain or gzip-compressed."""
+
+import gzip
+import os
+import shutil
+import tempfile
+import time
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+from pkrcomponents.converters.utils.json_decoders import get_json_decoder
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+NDJSON_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "ndjson_speed_results.txt")
+
+
+def write_inputs(parsed_dir, nb_copies):
+    lines = []
+    for file_name in sorted(os.listdir(FILES_DIR)):
+        with open(os.path.join(FILES_DIR, file_name), "rb") as file:
+            lines.append(b" ".join(file.read().split()) + b"\n")
+    files_dir = os.path.join(parsed_dir, "files", "data", "histories", "parsed")
+    os.makedirs(files_dir)
+    for copy in range(nb_copies):
+        for index, line in enumerate(lines):
+            with open(os.path.join(files_dir, f"{copy}_{index}.json"), "wb") as file:
+                file.write(line)
+    for name, open_function in (("ndjson", open), ("ndjson.gz", gzip.open)):
+        bundle_dir = os.path.join(parsed_dir, name, "data", "histories", "parsed")
+        os.makedirs(bundle_dir)
+        with open_function(os.path.join(bundle_dir, f"hands.{name}"), "wb") as file:
+            for _ in range(nb_copies):
+                file.writelines(lines)
+    return len(lines) * nb_copies
+
+
+def get_reading_time(data_dir):
+    converter = LocalHandHistoryConverter(data_dir)
+    decoder = get_json_decoder()
+    start = time.perf_counter()
+    nb_hands = 0
+    for parsed_key in converter.iter_parsed_histories_keys():
+        decoder.decode(converter.read_data_bytes(parsed_key))
+        nb_hands += 1
+    return (time.perf_counter() - start) / nb_hands
+
+
+def speed_test(results_path, nb_copies=400):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        nb_hands = write_inputs(tmp_dir, nb_copies)
+        lines = [f"{nb_hands} hands listed, read and decoded\n"]
+        for label in ("files", "ndjson", "ndjson.gz"):
+            reading_time = get_reading_time(os.path.join(tmp_dir, label, "data"))
+            lines.append(f"{label}: {reading_time * 1e6:.1f} microseconds per parsed history\n")
+            print(lines[-1])
+    finally:
+        shutil.rmtree(tmp_dir)
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=NDJSON_SPEED_RESULTS_PATH)
@@ -0,0 +1,53 @@
+"""This module measures the time needed to validate parsed histories against their schema,
+compared with the time needed to convert them."""
+
+import os
+import time
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+from pkrcomponents.converters.utils.parsed_history import ParsedHistory
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+PARSED_HISTORY_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "parsed_history_speed_results.txt")
+
+
+def get_validation_time(data_list, nb_rounds=200):
+    start = time.perf_counter()
+    for _ in range(nb_rounds):
+        for data in data_list:
+            ParsedHistory.from_dict(data)
+    return (time.perf_counter() - start) / (nb_rounds * len(data_list))
+
+
+def get_conversion_time(converter, files_list, nb_rounds=20):
+    start = time.perf_counter()
+    for _ in range(nb_rounds):
+        for file_key in files_list:
+            converter.convert_history_to_record(file_key)
+    return (time.perf_counter() - start) / (nb_rounds * len(files_list))
+
+
+def speed_test(results_path):
+    files_list = sorted(os.path.join(FILES_DIR, file_name) for file_name in os.listdir(FILES_DIR)
+                        if file_name.endswith(".json"))
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    data_list = []
+    for file_key in files_list:
+        converter.get_parsed_data(file_key)
+        data_list.append(converter.data)
+    validation_time = get_validation_time(data_list)
+    conversion_time = get_conversion_time(converter, files_list)
+    lines = [
+        f"Schema validation: {validation_time * 1e6:.1f} microseconds per parsed history\n",
+        f"Full conversion: {conversion_time * 1e6:.1f} microseconds per parsed history\n",
+        f"Validation share of the conversion: {validation_time / conversion_time:.1%}\n"
+    ]
+    for line in lines:
+        print(line)
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=PARSED_HISTORY_SPEED_RESULTS_PATH)
@@ -0,0 +1,86 @@
+"""This module compares the cost of the actions played on a table when the player counts are maintained by the table
+with their cost when the counts are rebuilt by filtering the players in playing order."""
+
+import os
+import time
+from pkrcomponents.components.actions.action import Action
+from pkrcomponents.components.tables.table import Table
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+PLAYER_COUNTS_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "player_counts_speed_results.txt")
+STATUS_QUERIES = ("street_ended", "hand_ended", "next_street_ready", "one_player_left", "can_parse_winners")
+FILTERED_COUNTS = {
+    "nb_able_to_play": property(lambda table: len(table.players_able_to_play)),
+    "nb_waiting": property(lambda table: len(table.players_waiting)),
+    "nb_in_game": property(lambda table: len(table.players_in_game)),
+    "nb_involved": property(lambda table: len(table.players_involved)),
+}
+
+
+def use_filtered_counts(filtered_counts):
+    maintained_counts = {name: getattr(Table, name) for name in FILTERED_COUNTS}
+    if filtered_counts:
+        for name, count in FILTERED_COUNTS.items():
+            setattr(Table, name, count)
+    return maintained_counts
+
+
+def restore_counts(maintained_counts):
+    for name, count in maintained_counts.items():
+        setattr(Table, name, count)
+
+
+def get_action_time(files_list, filtered_counts, nb_rounds=20):
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    maintained_counts = use_filtered_counts(filtered_counts)
+    play = Action.play
+    durations = []
+
+    def timed_play(action):
+        start = time.perf_counter()
+        play(action)
+        durations.append(time.perf_counter() - start)
+
+    Action.play = timed_play
+    for _ in range(nb_rounds):
+        for file_key in files_list:
+            converter.convert_history(file_key)
+    Action.play = play
+    restore_counts(maintained_counts)
+    return sum(durations) / len(durations)
+
+
+def get_queries_time(files_list, filtered_counts, nb_queries=1000):
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    maintained_counts = use_filtered_counts(filtered_counts)
+    duration = 0
+    for file_key in files_list:
+        converter.convert_history(file_key)
+        start = time.perf_counter()
+        for _ in range(nb_queries):
+            for query in STATUS_QUERIES:
+                getattr(converter.table, query)
+        duration += time.perf_counter() - start
+    restore_counts(maintained_counts)
+    return duration / (nb_queries * len(files_list))
+
+
+def speed_test(results_path):
+    files_list = sorted(os.path.join(FILES_DIR, file_name) for file_name in os.listdir(FILES_DIR)
+                        if file_name.endswith(".json"))
+    lines = []
+    for label, filtered_counts in (("Filtering players", True), ("Maintained counts", False)):
+        action_time = get_action_time(files_list, filtered_counts)
+        queries_time = get_queries_time(files_list, filtered_counts)
+        lines.append(f"{label}: {action_time * 1e6:.1f} microseconds per action, "
+                     f"{queries_time * 1e6:.1f} microseconds to check the table status\n")
+        print(lines[-1])
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=PLAYER_COUNTS_SPEED_RESULTS_PATH)
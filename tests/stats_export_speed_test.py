@@ -0,0 +1,69 @@
+"""This module compares the export of hand stats through one DataFrame per player with the export through column
+buffers, written in row groups."""
+
+import importlib.util
+import os
+import tempfile
+import time
+import pandas as pd
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+from pkrcomponents.converters.utils.stats_export import HandStatsColumns, HandStatsWriter
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+STATS_EXPORT_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "stats_export_speed_results.txt")
+
+
+def get_converted_tables(files_list):
+    tables = []
+    for file_key in files_list:
+        converter = LocalHandHistoryConverter(FILES_DIR)
+        tables.append(converter.convert_history(file_key))
+    return tables
+
+
+def export_dataframes(tables):
+    return pd.concat([player.hand_stats.to_dataframe() for table in tables for player in table.players])
+
+
+def export_columns(tables):
+    columns = HandStatsColumns()
+    for table in tables:
+        columns.add_table(table)
+    return columns.to_dataframe()
+
+
+def export_parquet(tables):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with HandStatsWriter(os.path.join(tmp_dir, "stats.parquet")) as writer:
+            for table in tables:
+                writer.add_table(table)
+
+
+def get_export_time(export_function, tables, nb_rounds=3):
+    start = time.perf_counter()
+    for _ in range(nb_rounds):
+        export_function(tables)
+    nb_rows = sum(table.cnt_players for table in tables)
+    return (time.perf_counter() - start) / (nb_rounds * nb_rows)
+
+
+def speed_test(results_path):
+    files_list = sorted(os.path.join(FILES_DIR, file_name) for file_name in os.listdir(FILES_DIR)
+                        if file_name.endswith(".json"))
+    tables = get_converted_tables(files_list)
+    exports = [("DataFrame per player", export_dataframes, 1), ("Column buffers", export_columns, 100)]
+    if importlib.util.find_spec("pyarrow"):
+        exports.append(("Parquet row groups", export_parquet, 100))
+    lines = []
+    for label, export_function, nb_copies in exports:
+        export_time = get_export_time(export_function, tables * nb_copies)
+        lines.append(f"{label}: {export_time * 1e6:.1f} microseconds per player row\n")
+        print(lines[-1])
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=STATS_EXPORT_SPEED_RESULTS_PATH)
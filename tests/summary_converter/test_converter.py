@@ -1,5 +1,8 @@
-import unittest
+import json
 import os
+import shutil
+import tempfile
+import unittest
 from datetime import datetime
 from pkrcomponents.components.tournaments.buy_in import BuyIn
 from pkrcomponents.components.tournaments.level import Level
@@ -118,3 +121,46 @@ class TestLocalSummaryConverter2(unittest.TestCase):
         self.converter.get_nb_entries()
         nb_entries = self.converter.tournament.nb_entries
         self.assertEqual(nb_entries, 2)
+
+
+class TestLocalSummaryBundles(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.tmp_dir, "data")
+        self.parsed_dir = os.path.join(self.data_dir, "summaries", "parsed")
+        os.makedirs(self.parsed_dir)
+        self.bundle_path = os.path.join(self.parsed_dir, "summaries.ndjson")
+        self.expected_data = []
+        with open(self.bundle_path, "w") as bundle:
+            for file_name in ("example01.json", "example02.json"):
+                with open(os.path.join(FILES_DIR, file_name)) as file:
+                    self.expected_data.append(json.load(file))
+                bundle.write(json.dumps(self.expected_data[-1]) + "\n")
+        self.converter = LocalSummaryConverter(data_dir=self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_list_parsed_summaries_keys(self):
+        keys = self.converter.list_parsed_summaries_keys()
+        self.assertEqual(keys, [f"{self.bundle_path}#1", f"{self.bundle_path}#2"])
+
+    def test_memory_mapped_lines(self):
+        keys = self.converter.list_parsed_summaries_keys()
+        self.assertIsInstance(self.converter.read_data_bytes(keys[1]), memoryview)
+        self.converter.get_parsed_data(keys[1])
+        self.assertEqual(self.converter.data, self.expected_data[1])
+        self.assertEqual(json.loads(self.converter.read_data_text(keys[0])), self.expected_data[0])
+        tournament = self.converter.convert_summary(keys[1])
+        self.assertEqual(tournament.name, "POUR LA DARONNE")
+        streaming_converter = LocalSummaryConverter(data_dir=self.data_dir, memory_map=False)
+        self.assertEqual(streaming_converter.read_data_bytes(keys[1]), self.converter.read_data_bytes(keys[1]))
+
+    def test_send_to_corrections(self):
+        key = self.converter.list_parsed_summaries_keys()[0]
+        self.converter.send_to_corrections(key)
+        self.converter.send_to_corrections(key)
+        correction_path = os.path.join(self.tmp_dir, "corrections", "summaries", "parsed", "summaries.ndjson")
+        with open(correction_path) as file:
+            self.assertEqual(json.loads(file.read()), self.expected_data[0])
+        self.assertEqual(self.converter.list_parsed_summaries_keys(), [f"{self.bundle_path}#2"])
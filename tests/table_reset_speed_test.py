@@ -0,0 +1,55 @@
+"""This module compares the time needed to rebuild a table with the time needed to reset it in place between hands."""
+
+import os
+import time
+from pkrcomponents.components.tables.table import Table
+from pkrcomponents.converters.history_converter.local import LocalHandHistoryConverter
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+FILES_DIR = os.path.join(TEST_DIR, "history_converter", "json_files")
+TABLE_RESET_SPEED_RESULTS_PATH = os.path.join(TEST_DIR, "table_reset_speed_results.txt")
+
+
+def rebuild_table(converter):
+    del converter.table
+    converter.table = Table()
+
+
+def reset_table(converter):
+    converter.table.reset_for_conversion()
+
+
+def get_reset_time(reset_function, nb_resets=10000):
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    start = time.perf_counter()
+    for _ in range(nb_resets):
+        reset_function(converter)
+    return (time.perf_counter() - start) / nb_resets
+
+
+def get_conversion_time(reset_function, files_list, nb_rounds=20):
+    converter = LocalHandHistoryConverter(FILES_DIR)
+    converter.reset_table = lambda: reset_function(converter)
+    start = time.perf_counter()
+    for _ in range(nb_rounds):
+        for file_key in files_list:
+            converter.convert_history(file_key)
+    return (time.perf_counter() - start) / (nb_rounds * len(files_list))
+
+
+def speed_test(results_path):
+    files_list = sorted(os.path.join(FILES_DIR, file_name) for file_name in os.listdir(FILES_DIR))
+    lines = []
+    for label, reset_function in (("Rebuilding Table()", rebuild_table), ("reset_for_conversion()", reset_table)):
+        reset_time = get_reset_time(reset_function)
+        conversion_time = get_conversion_time(reset_function, files_list)
+        lines.append(f"{label}: {reset_time * 1e6:.1f} microseconds per reset, "
+                     f"{conversion_time * 1000:.2f} milliseconds per converted hand\n")
+        print(lines[-1])
+    print(f"Writing results to {results_path}")
+    with open(results_path, "w") as file:
+        file.writelines(lines)
+
+
+if __name__ == "__main__":
+    speed_test(results_path=TABLE_RESET_SPEED_RESULTS_PATH)